@@ -32,6 +32,8 @@ class Settings(BaseSettings):
     # Rate Limiting (per source)
     max_requests_per_minute: int = 60  # Maximum requests per minute per source
     delay_between_requests: float = 1.0  # Minimum delay in seconds between requests
+    article_concurrency: int = 16  # Maximum articles fetched/processed concurrently per source
+    max_items_per_feed: int = 100  # Maximum RSS items processed per polling cycle
 
     # API
     api_host: str = "0.0.0.0"
@@ -40,3 +40,26 @@ DEFAULT_PAGE_LIMIT = 20
 MAX_PAGE_LIMIT = 100
 DEFAULT_PAGE_OFFSET = 0
 
+
+# Reuters NewsML-G2 XML namespaces (Clark notation, for ElementTree paths)
+NS_NAR = "{http://iptc.org/std/nar/2006-10-01/}"
+NS_RTR = "{http://www.reuters.com/ns/2003/08/content}"
+# Older rtr namespace, still used for the video downloader's altLoc lookup
+NS_RTR_2006 = "{http://www.reuters.com/ns/2006-04-01/}"
+
+# Prebuilt ElementTree paths for Reuters NewsML lookups
+NAR_NEWS_ITEM = f".//{NS_NAR}newsItem"
+NAR_HEADLINE = f".//{NS_NAR}headline"
+NAR_INLINE_XML = f".//{NS_NAR}inlineXML"
+NAR_DESCRIPTION = f".//{NS_NAR}description"
+NAR_PRIORITY = f".//{NS_NAR}header/{NS_NAR}priority"
+NAR_SENT = f".//{NS_NAR}header/{NS_NAR}sent"
+NAR_SUBJECTS = f".//{NS_NAR}contentMeta/{NS_NAR}subject"
+NAR_NAME = f"{NS_NAR}name"
+NAR_ITEM_CLASS = f".//{NS_NAR}itemMeta/{NS_NAR}itemClass"
+NAR_REMOTE_CONTENT = f"{NS_NAR}remoteContent"
+NAR_REMOTE_CONTENTS = f".//{NS_NAR}contentSet/{NAR_REMOTE_CONTENT}"
+RTR_ALT_LOC = f"{NS_RTR}altLoc"
+RTR_2006_ALT_LOCS = f".//{NS_RTR_2006}altLoc"
+RTR_ALT_ID = f"{NS_RTR}altId"
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
@@ -6,6 +6,7 @@ from typing import AsyncGenerator
 from app.core.logging import setup_logging
 from app.db.session import init_db, close_db
 from app.storage.s3 import init_s3, close_s3
+from app.workers.http_session import close_http_session
 
 logger = setup_logging()
 
@@ -15,7 +16,8 @@ async def lifespan(app) -> AsyncGenerator[None, None]:
     """
     Manage application lifecycle events.
 
-    Handles startup and shutdown of database and S3 connections.
+    Handles startup and shutdown of database and S3 connections, and closes
+    the shared HTTP connection pool used by on-demand downloads.
     """
     # Startup
     logger.info("Starting application...")
@@ -41,5 +43,6 @@ async def lifespan(app) -> AsyncGenerator[None, None]:
     logger.info("Shutting down application...")
     await close_db()
     await close_s3()
+    await close_http_session()
     logger.info("Application shut down complete")
 
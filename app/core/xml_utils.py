@@ -0,0 +1,57 @@
+"""XML parsing helpers for the NewsML-based sources."""
+
+from io import BytesIO
+from typing import Optional, Union
+
+from lxml import etree
+
+from app.core.constants import NAR_REMOTE_CONTENT
+
+
+def parse_xml(content: Union[str, bytes]) -> etree._Element:
+    """
+    Parse an XML document with lxml.
+
+    lxml refuses ``str`` input that carries an encoding declaration, so text
+    responses are encoded back to UTF-8 (what the Reuters API serves) first.
+    The returned element supports the ``find``/``findall``/``itertext`` calls
+    the sources used with ``xml.etree.ElementTree``.
+
+    Args:
+        content: XML document as text or raw bytes
+
+    Returns:
+        Root element of the parsed document
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return etree.fromstring(content)
+
+
+def find_remote_content(content: Union[str, bytes], rendition: str) -> Optional[etree._Element]:
+    """
+    Find the first ``remoteContent`` element with the given rendition.
+
+    The document is parsed incrementally and parsing stops at the first
+    match, so callers that only need one rendition don't build the whole
+    NewsML tree. Non-matching ``remoteContent`` elements are cleared as soon
+    as they have been checked. Renditions are compared case-insensitively.
+
+    Args:
+        content: NewsML item XML as text or raw bytes
+        rendition: Rendition to look for (e.g. ``rend:stream:8256:16x9:mp4``)
+
+    Returns:
+        Matching element with its children (e.g. ``altLoc``), or None
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    target = rendition.lower()
+    for _, elem in etree.iterparse(
+        BytesIO(content), events=("end",), tag=NAR_REMOTE_CONTENT
+    ):
+        if elem.get("rendition", "").lower() == target:
+            return elem
+        elem.clear()
+    return None
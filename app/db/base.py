@@ -1,5 +1,6 @@
 """Database base configuration."""
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
@@ -15,6 +16,19 @@ engine = create_async_engine(
     max_overflow=20,
 )
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune SQLite connections for concurrent worker writes (local development)."""
+        cursor = dbapi_connection.cursor()
+        # WAL lets readers run alongside the writer; NORMAL sync is safe under WAL
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        # Page cache per connection, in KiB (negative value)
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, Boolean, Integer, DateTime, UniqueConstraint, Column, TypeDecorator
+from sqlalchemy import String, Text, Boolean, Integer, DateTime, UniqueConstraint, Column, TypeDecorator, Index
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
@@ -107,5 +107,7 @@ class News(Base):
 
     __table_args__ = (
         UniqueConstraint("url", name="uq_news_url"),
+        # Per-source "latest news" queries (API source filter, URL preloads)
+        Index("idx_news_source_created", "source", created_at.desc()),
     )
 
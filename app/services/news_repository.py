@@ -5,9 +5,12 @@ from typing import List, Optional
 from datetime import datetime
 
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.category_normalizer import normalize_category
+from app.db.base import engine
 from app.db.models import News
 from app.db.session import AsyncSessionLocal
 
@@ -68,6 +71,39 @@ class NewsRepository:
             logger.error(f"Error saving news: {e}", exc_info=True)
             return False
 
+    @staticmethod
+    async def bulk_insert_ignore_duplicates(rows: List[dict]) -> int:
+        """
+        Insert many news rows in a single statement, skipping existing URLs.
+        
+        Rows whose URL already exists are ignored by the database
+        (ON CONFLICT DO NOTHING), so callers do not need a per-row
+        existence check before inserting.
+        
+        Args:
+            rows: Column name to value mappings for the News table
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        try:
+            async with AsyncSessionLocal() as db:
+                if engine.dialect.name == "postgresql":
+                    stmt = pg_insert(News)
+                else:
+                    stmt = sqlite_insert(News)
+                stmt = stmt.on_conflict_do_nothing(index_elements=["url"]).returning(News.url)
+                result = await db.execute(stmt, rows)
+                inserted = len(result.all())
+                await db.commit()
+                return inserted
+        except Exception as e:
+            logger.error(f"Error bulk inserting news: {e}", exc_info=True)
+            return 0
+
     @staticmethod
     async def update(news: News) -> bool:
         """
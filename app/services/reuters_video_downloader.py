@@ -4,7 +4,6 @@ import asyncio
 import hashlib
 import os
 import tempfile
-import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Optional, Dict, Any, Callable
 from io import BytesIO
@@ -12,16 +11,29 @@ import logging
 
 import aiohttp
 import yt_dlp
+from boto3.s3.transfer import TransferConfig
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from app.core.config import settings
+from app.core.constants import RTR_2006_ALT_LOCS
 from app.core.logging import setup_logging
+from app.core.xml_utils import find_remote_content, parse_xml
 from app.storage.s3 import get_s3_session, init_s3
+from app.workers.http_session import get_shared_connector
 
 logger = setup_logging()
 
+# Videos above the threshold are uploaded as multipart uploads with parts
+# sent in parallel; a failed part is retried without resending the file
+VIDEO_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=False,
+)
+
 
 class ReutersVideoDownloader:
     """Service for downloading high-quality Reuters videos."""
@@ -31,6 +43,27 @@ class ReutersVideoDownloader:
         self.reuters_username = os.getenv("REUTERS_USERNAME")
         self.reuters_password = os.getenv("REUTERS_PASSWORD")
         self._s3_initialized = False
+    
+    @staticmethod
+    def _new_session(**kwargs) -> aiohttp.ClientSession:
+        """
+        Create a session on the process-wide connection pool.
+        
+        The session only carries per-call settings (headers, timeout); TCP/TLS
+        connections and DNS lookups to the Reuters hosts are reused across
+        calls and downloads through the shared connector.
+        
+        Args:
+            **kwargs: Extra aiohttp.ClientSession arguments
+            
+        Returns:
+            aiohttp.ClientSession that leaves the shared connector open on close
+        """
+        return aiohttp.ClientSession(
+            connector=get_shared_connector(),
+            connector_owner=False,
+            **kwargs,
+        )
         
     async def _authenticate(self) -> Optional[str]:
         """Authenticate with Reuters API and get fresh token."""
@@ -39,7 +72,7 @@ class ReutersVideoDownloader:
                 logger.error("Reuters credentials not configured")
                 return None
             
-            async with aiohttp.ClientSession() as session:
+            async with self._new_session() as session:
                 auth_url = "https://commerce.reuters.com/rmd/rest/xml/login"
                 params = {
                     "username": self.reuters_username,
@@ -52,7 +85,7 @@ class ReutersVideoDownloader:
                         return None
                     
                     xml_content = await response.text()
-                    root = ET.fromstring(xml_content)
+                    root = parse_xml(xml_content)
                     
                     if root.tag == "authToken" and root.text:
                         token = root.text.strip()
@@ -66,10 +99,10 @@ class ReutersVideoDownloader:
             logger.error(f"Error during authentication: {e}", exc_info=True)
             return None
     
-    async def _fetch_item_detail(self, item_id: str, token: str) -> Optional[str]:
+    async def _fetch_item_detail(self, item_id: str, token: str) -> Optional[bytes]:
         """Fetch item detail XML."""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._new_session() as session:
                 detail_url = f"http://rmb.reuters.com/rmd/rest/xml/item?token={token}&id={item_id}"
                 
                 async with session.get(detail_url) as response:
@@ -77,45 +110,37 @@ class ReutersVideoDownloader:
                         logger.warning(f"Failed to fetch item detail for {item_id}, status: {response.status}")
                         return None
                     
-                    xml_content = await response.text()
-                    return xml_content
+                    return await response.read()
                     
         except Exception as e:
             logger.error(f"Error fetching item detail for {item_id}: {e}", exc_info=True)
             return None
     
-    def _extract_high_quality_video_url(self, xml_content: str, token: str) -> Optional[str]:
+    def _extract_high_quality_video_url(self, xml_content: bytes, token: str) -> Optional[str]:
         """Extract high-quality video URL (rend:stream:8256:16x9:mp4) from XML."""
         try:
-            root = ET.fromstring(xml_content)
-            
-            # Find all remoteContent elements
-            all_remote_contents = root.findall('.//{http://iptc.org/std/nar/2006-10-01/}remoteContent')
-            
-            # Find the target rendition
+            # Stop parsing at the target rendition instead of building the whole tree
             target_rendition = 'rend:stream:8256:16x9:mp4'
-            for remote_content in all_remote_contents:
-                rendition = remote_content.get('rendition', '')
+            remote_content = find_remote_content(xml_content, target_rendition)
+            
+            if remote_content is not None:
+                # Try altLoc first (authenticated URL)
+                alt_loc = remote_content.find(RTR_2006_ALT_LOCS)
+                if alt_loc is not None and alt_loc.text:
+                    url = alt_loc.text.strip()
+                    # Add token if not already present
+                    if 'token=' not in url:
+                        separator = '&' if '?' in url else '?'
+                        url = f"{url}{separator}token={token}"
+                    return url
                 
-                # Look for rend:stream:8256m:16x9:mp4 (case-insensitive)
-                if rendition.lower() == target_rendition.lower():
-                    # Try altLoc first (authenticated URL)
-                    alt_loc = remote_content.find('.//{http://www.reuters.com/ns/2006-04-01/}altLoc')
-                    if alt_loc is not None and alt_loc.text:
-                        url = alt_loc.text.strip()
-                        # Add token if not already present
-                        if 'token=' not in url:
-                            separator = '&' if '?' in url else '?'
-                            url = f"{url}{separator}token={token}"
-                        return url
-                    
-                    # Fallback to href
-                    href = remote_content.get('href', '')
-                    if href:
-                        if 'token=' not in href:
-                            separator = '&' if '?' in href else '?'
-                            href = f"{href}{separator}token={token}"
-                        return href
+                # Fallback to href
+                href = remote_content.get('href', '')
+                if href:
+                    if 'token=' not in href:
+                        separator = '&' if '?' in href else '?'
+                        href = f"{href}{separator}token={token}"
+                    return href
             
             logger.warning(f"High-quality video URL ({target_rendition}) not found in XML")
             return None
@@ -145,7 +170,7 @@ class ReutersVideoDownloader:
             temp_file.close()
             
             # Download using aiohttp with proper headers
-            async with aiohttp.ClientSession(
+            async with self._new_session(
                 timeout=aiohttp.ClientTimeout(total=600),  # 10 minutes timeout
                 headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -253,11 +278,12 @@ class ReutersVideoDownloader:
             # Create a new session for this upload
             s3_session = aioboto3.Session()
             async with s3_session.client("s3", **client_kwargs) as s3:
-                await s3.put_object(
-                    Bucket=settings.s3_bucket,
-                    Key=s3_key,
-                    Body=video_data,
-                    ContentType='video/mp4',
+                await s3.upload_fileobj(
+                    BytesIO(video_data),
+                    settings.s3_bucket,
+                    s3_key,
+                    ExtraArgs={"ContentType": "video/mp4"},
+                    Config=VIDEO_TRANSFER_CONFIG,
                 )
             
             logger.info(f"Successfully uploaded video to S3: {s3_key}")
@@ -327,7 +353,10 @@ class ReutersVideoDownloader:
                     'message': 'در حال استخراج آدرس ویدئو...'
                 })
             
-            video_url = self._extract_high_quality_video_url(xml_content, token)
+            # Parsing is CPU-bound, so keep it off the event loop
+            video_url = await asyncio.to_thread(
+                self._extract_high_quality_video_url, xml_content, token
+            )
             if not video_url:
                 if progress_callback:
                     progress_callback({
@@ -361,9 +361,3 @@ class AFPTextWorker(APIWorker):
             
         except Exception as e:
             self.logger.error(f"Error in fetch_news: {e}", exc_info=True)
-
-    async def close(self) -> None:
-        """Close HTTP session and perform cleanup."""
-        if self.http_session and not self.http_session.closed:
-            await self.http_session.close()
-
@@ -5,10 +5,9 @@ import hashlib
 import re
 from datetime import datetime
 from io import BytesIO
-from typing import Optional
+from typing import Mapping, Optional
 from urllib.parse import urljoin, urlparse
 
-import aiohttp
 import feedparser
 from bs4 import BeautifulSoup
 from sqlalchemy import select
@@ -29,14 +28,16 @@ logger = setup_logging(source="mehrnews")
 # RSS feed URL
 MEHRNEWS_RSS_URL = "https://www.mehrnews.com/rss"
 
-# HTTP client settings
-HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
-HTTP_RETRIES = 3
+# Longest wait after HTTP 429 (Too Many Requests) before retrying, in seconds
+MAX_RATE_LIMIT_WAIT = 300
 
 
 class MehrNewsWorker(WebScraperWorker):
     """Worker for MehrNews RSS feed."""
 
+    # MehrNews rate limits for minutes at a time, so wait longer than the default
+    max_retry_after = MAX_RATE_LIMIT_WAIT
+
     def __init__(self):
         """Initialize MehrNews worker."""
         super().__init__("mehrnews")
@@ -46,117 +47,25 @@ class MehrNewsWorker(WebScraperWorker):
         # Initialize article processor
         self.article_processor = ArticleProcessor(source_name="mehrnews")
 
-    async def _get_http_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
-        if self.http_session is None or self.http_session.closed:
-            self.http_session = aiohttp.ClientSession(
-                timeout=HTTP_TIMEOUT,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                }
-            )
-        return self.http_session
-
-    async def _fetch_with_retry(
-        self,
-        url: str,
-        max_retries: int = HTTP_RETRIES,
-        request_type: str = "article",
-    ) -> Optional[bytes]:
+    def _throttle_delay(self, status: int, headers: Mapping[str, str], attempt: int) -> Optional[float]:
         """
-        Fetch URL with retries and rate limiting.
+        Get the wait before retrying a throttled response.
+
+        On HTTP 429 without a Retry-After header, backs off exponentially
+        (10s, 20s, 40s, ...) up to MAX_RATE_LIMIT_WAIT.
 
         Args:
-            url: URL to fetch
-            max_retries: Maximum number of retry attempts
-            request_type: Type of request (rss, article) for logging
+            status: Response status code (429 or 503)
+            headers: Response headers
+            attempt: Zero-based attempt number of the throttled request
 
         Returns:
-            Response content as bytes, or None if all retries failed
+            Delay in seconds, or None to use the normal retry backoff
         """
-        session = await self._get_http_session()
-        for attempt in range(max_retries):
-            try:
-                # Apply rate limiting before making request
-                await self.rate_limiter.acquire(
-                    source=self.source_name,
-                    request_type=request_type
-                )
-                
-                stats = self.rate_limiter.get_stats(self.source_name)
-                self.logger.debug(
-                    f"Rate limit: {stats['requests_last_minute']}/{stats['max_requests_per_minute']} requests/min, "
-                    f"delay: {stats['delay_between_requests']}s",
-                    extra={
-                        "source": self.source_name,
-                        "request_type": request_type,
-                        "delay_applied": stats['delay_between_requests'],
-                    }
-                )
-                
-                async with session.get(url) as response:
-                    # Handle HTTP 429 (Too Many Requests)
-                    if response.status == 429:
-                        # Get Retry-After header if available
-                        retry_after = response.headers.get("Retry-After")
-                        if retry_after:
-                            try:
-                                wait_time = float(retry_after)
-                            except ValueError:
-                                wait_time = 60  # Default to 60 seconds
-                        else:
-                            # Exponential backoff for 429
-                            wait_time = min(2 ** attempt * 10, 300)  # Max 5 minutes
-                        
-                        self.logger.warning(
-                            f"HTTP 429 (Rate Limited) for {url}, waiting {wait_time}s before retry",
-                            extra={
-                                "source": self.source_name,
-                                "request_type": request_type,
-                                "article_url": url,
-                                "retry_after": wait_time,
-                            }
-                        )
-                        
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            self.logger.error(
-                                f"Rate limit exceeded after {max_retries} attempts: {url}",
-                                extra={
-                                    "source": self.source_name,
-                                    "request_type": request_type,
-                                    "article_url": url,
-                                }
-                            )
-                            return None
-                    
-                    if response.status == 200:
-                        return await response.read()
-                    else:
-                        self.logger.warning(
-                            f"HTTP {response.status} for {url}, attempt {attempt + 1}/{max_retries}",
-                            extra={
-                                "source": self.source_name,
-                                "request_type": request_type,
-                                "article_url": url,
-                            }
-                        )
-            except Exception as e:
-                self.logger.warning(
-                    f"Error fetching {url}, attempt {attempt + 1}/{max_retries}: {e}",
-                    extra={
-                        "source": self.source_name,
-                        "request_type": request_type,
-                        "article_url": url,
-                    }
-                )
-                if attempt < max_retries - 1:
-                    # Exponential backoff for temporary failures
-                    wait_time = min(2 ** attempt, 60)  # Max 60 seconds
-                    await asyncio.sleep(wait_time)
-        return None
+        delay = self._retry_after_delay(headers)
+        if delay is None and status == 429:
+            delay = min(2 ** attempt * 10, MAX_RATE_LIMIT_WAIT)
+        return delay
 
     async def _parse_rss_feed(self) -> list[dict]:
         """
@@ -677,13 +586,8 @@ class MehrNewsWorker(WebScraperWorker):
         """Cleanup resources."""
         if self.http_session and not self.http_session.closed:
             try:
-                # Cancel any pending requests first
-                if hasattr(self.http_session, '_connector'):
-                    connector = self.http_session._connector
-                    if connector:
-                        # Close all connections
-                        connector._close()
-                
+                # The session's connection pool is shared with other workers and is
+                # closed by close_http_session, so only the session is closed here
                 # Close with timeout to prevent hanging
                 await asyncio.wait_for(self.http_session.close(), timeout=2.0)
                 self.logger.debug("HTTP session closed successfully")
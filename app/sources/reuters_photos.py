@@ -2,7 +2,6 @@
 
 import asyncio
 import hashlib
-import xml.etree.ElementTree as ET
 from datetime import datetime
 from io import BytesIO
 from typing import Optional, Dict, Any
@@ -22,6 +21,20 @@ load_dotenv()
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.core.category_normalizer import normalize_category
+from app.core.xml_utils import parse_xml
+from app.core.constants import (
+    NAR_DESCRIPTION,
+    NAR_HEADLINE,
+    NAR_NAME,
+    NAR_NEWS_ITEM,
+    NAR_PRIORITY,
+    NAR_REMOTE_CONTENTS,
+    NAR_SENT,
+    NAR_SUBJECTS,
+    RTR_ALT_ID,
+    RTR_ALT_LOC,
+    XML_LANG,
+)
 from app.db.base import AsyncSessionLocal
 from app.db.models import News
 from app.storage.s3 import get_s3_session, init_s3
@@ -104,7 +117,7 @@ class ReutersPhotosWorker(BaseWorker):
                 
                 # Parse XML to extract auth token
                 # Response format: <?xml version="1.0" encoding="UTF-8" standalone="yes"?><authToken>TOKEN</authToken>
-                root = ET.fromstring(xml_content)
+                root = parse_xml(xml_content)
                 
                 # The root element itself is <authToken>
                 if root.tag == "authToken" and root.text:
@@ -119,7 +132,7 @@ class ReutersPhotosWorker(BaseWorker):
             logger.error(f"Error authenticating with Reuters API: {e}", exc_info=True)
             return None
 
-    async def _fetch_items_list(self, limit: int = 10) -> Optional[str]:
+    async def _fetch_items_list(self, limit: int = 10) -> Optional[bytes]:
         """Fetch list of items from Reuters API."""
         if not self.auth_token:
             await self._authenticate()
@@ -146,14 +159,13 @@ class ReutersPhotosWorker(BaseWorker):
             logger.debug(f"Fetching items list (limit={limit})...")
             async with session.get(REUTERS_ITEMS_URL, params=params) as response:
                 response.raise_for_status()
-                xml_content = await response.text()
-                return xml_content
+                return await response.read()
                 
         except Exception as e:
             logger.error(f"Error fetching items list: {e}", exc_info=True)
             return None
 
-    async def _fetch_item_detail(self, item_id: str) -> Optional[str]:
+    async def _fetch_item_detail(self, item_id: str) -> Optional[bytes]:
         """Fetch detailed item data from Reuters API."""
         if not self.auth_token:
             await self._authenticate()
@@ -178,17 +190,16 @@ class ReutersPhotosWorker(BaseWorker):
             logger.debug(f"Fetching item detail (id={item_id})...")
             async with session.get(REUTERS_ITEM_URL, params=params) as response:
                 response.raise_for_status()
-                xml_content = await response.text()
-                return xml_content
+                return await response.read()
                 
         except Exception as e:
             logger.error(f"Error fetching item detail: {e}", exc_info=True)
             return None
 
-    def _parse_items_list(self, xml_content: str) -> list[Dict[str, str]]:
+    def _parse_items_list(self, xml_content: bytes) -> list[Dict[str, str]]:
         """Parse items list XML and extract item IDs and GUIDs."""
         try:
-            root = ET.fromstring(xml_content)
+            root = parse_xml(xml_content)
             items = []
             
             # Find all result elements
@@ -209,10 +220,10 @@ class ReutersPhotosWorker(BaseWorker):
             logger.error(f"Error parsing items list: {e}", exc_info=True)
             return []
 
-    def _parse_item_detail(self, xml_content: str) -> Optional[Dict[str, Any]]:
+    def _parse_item_detail(self, xml_content: bytes) -> Optional[Dict[str, Any]]:
         """Parse item detail XML and extract photo metadata."""
         try:
-            root = ET.fromstring(xml_content)
+            root = parse_xml(xml_content)
             
             # Define namespaces
             ns = {
@@ -225,18 +236,18 @@ class ReutersPhotosWorker(BaseWorker):
             data = {}
             
             # GUID from newsItem attribute
-            news_item = root.find('.//{http://iptc.org/std/nar/2006-10-01/}newsItem')
+            news_item = root.find(NAR_NEWS_ITEM)
             if news_item is not None:
                 data["guid"] = news_item.get("guid", "")
             else:
                 data["guid"] = ""
             
             # Headline
-            headline_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}headline')
+            headline_elem = root.find(NAR_HEADLINE)
             data["headline"] = headline_elem.text if headline_elem is not None else ""
             
             # Description/Body
-            desc_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}description')
+            desc_elem = root.find(NAR_DESCRIPTION)
             if desc_elem is not None:
                 # Get text content (may have sub-elements)
                 desc_text = ''.join(desc_elem.itertext()).strip()
@@ -246,16 +257,16 @@ class ReutersPhotosWorker(BaseWorker):
             
             # Language from newsItem xml:lang attribute
             if news_item is not None:
-                data["language"] = news_item.get("{http://www.w3.org/XML/1998/namespace}lang", "en")
+                data["language"] = news_item.get(XML_LANG, "en")
             else:
                 data["language"] = "en"
             
             # Priority from header
-            priority_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}header/{http://iptc.org/std/nar/2006-10-01/}priority')
+            priority_elem = root.find(NAR_PRIORITY)
             data["priority"] = priority_elem.text if priority_elem is not None else "5"
             
             # Sent date from header
-            sent_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}header/{http://iptc.org/std/nar/2006-10-01/}sent')
+            sent_elem = root.find(NAR_SENT)
             data["sent"] = sent_elem.text if sent_elem is not None else ""
             
             # Photo URLs from remoteContent
@@ -263,7 +274,7 @@ class ReutersPhotosWorker(BaseWorker):
             # remoteContent[1] = THUMBNAIL (small size - extracted but not used)
             # remoteContent[2] = BASEIMAGE (full size - URL only for download button)
             # remoteContent[3] = LIMITEDIMAGE (optional)
-            remote_contents = root.findall('.//{http://iptc.org/std/nar/2006-10-01/}contentSet/{http://iptc.org/std/nar/2006-10-01/}remoteContent')
+            remote_contents = root.findall(NAR_REMOTE_CONTENTS)
             data["thumbnail_url"] = None  # Extracted but not used (fallback only)
             data["viewimage_url"] = None  # Used for both list and detail display
             data["baseimage_url"] = None  # Used for download button (URL only)
@@ -275,7 +286,7 @@ class ReutersPhotosWorker(BaseWorker):
                 data["thumbnail_url"] = thumb_elem.get("href")
                 
                 if not data["thumbnail_url"]:
-                    alt_loc_elem = thumb_elem.find("{http://www.reuters.com/ns/2003/08/content}altLoc")
+                    alt_loc_elem = thumb_elem.find(RTR_ALT_LOC)
                     if alt_loc_elem is not None and alt_loc_elem.text:
                         data["thumbnail_url"] = alt_loc_elem.text
             
@@ -285,7 +296,7 @@ class ReutersPhotosWorker(BaseWorker):
                 data["viewimage_url"] = view_elem.get("href")
                 
                 if not data["viewimage_url"]:
-                    alt_loc_elem = view_elem.find("{http://www.reuters.com/ns/2003/08/content}altLoc")
+                    alt_loc_elem = view_elem.find(RTR_ALT_LOC)
                     if alt_loc_elem is not None and alt_loc_elem.text:
                         data["viewimage_url"] = alt_loc_elem.text
             
@@ -295,21 +306,21 @@ class ReutersPhotosWorker(BaseWorker):
                 data["baseimage_url"] = base_elem.get("href")
                 
                 if not data["baseimage_url"]:
-                    alt_loc_elem = base_elem.find("{http://www.reuters.com/ns/2003/08/content}altLoc")
+                    alt_loc_elem = base_elem.find(RTR_ALT_LOC)
                     if alt_loc_elem is not None and alt_loc_elem.text:
                         data["baseimage_url"] = alt_loc_elem.text
                 
                 # Get filename from BASEIMAGE
-                alt_id_elem = base_elem.find("{http://www.reuters.com/ns/2003/08/content}altId")
+                alt_id_elem = base_elem.find(RTR_ALT_ID)
                 if alt_id_elem is not None:
                     data["filename"] = alt_id_elem.text
             
             # Category/Subject
-            subjects = root.findall('.//{http://iptc.org/std/nar/2006-10-01/}contentMeta/{http://iptc.org/std/nar/2006-10-01/}subject')
+            subjects = root.findall(NAR_SUBJECTS)
             if subjects:
                 # Use first subject with a name element
                 for subj in subjects:
-                    name_elem = subj.find("{http://iptc.org/std/nar/2006-10-01/}name")
+                    name_elem = subj.find(NAR_NAME)
                     if name_elem is not None and name_elem.text:
                         data["category"] = name_elem.text
                         break
@@ -1,7 +1,6 @@
 """Reuters Text News Worker - Fetches text articles from Reuters API."""
 
 import asyncio
-import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 import logging
@@ -16,12 +15,24 @@ load_dotenv()
 
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.xml_utils import parse_xml
 from app.db.models import News
 from sqlalchemy import update
 from app.db.session import AsyncSessionLocal
 from app.workers.base_worker import BaseWorker
 from app.workers.rate_limiter import RateLimiter
 from app.core.category_normalizer import normalize_category
+from app.core.constants import (
+    NAR_DESCRIPTION,
+    NAR_HEADLINE,
+    NAR_INLINE_XML,
+    NAR_NAME,
+    NAR_NEWS_ITEM,
+    NAR_PRIORITY,
+    NAR_SENT,
+    NAR_SUBJECTS,
+    XML_LANG,
+)
 
 logger = setup_logging()
 
@@ -95,7 +106,7 @@ class ReutersTextWorker(BaseWorker):
                 
                 # Parse XML to extract token
                 # Response format: <?xml version="1.0" encoding="UTF-8" standalone="yes"?><authToken>TOKEN</authToken>
-                root = ET.fromstring(xml_content)
+                root = parse_xml(xml_content)
                 
                 # The root element itself is <authToken>
                 if root.tag == "authToken" and root.text:
@@ -113,7 +124,7 @@ class ReutersTextWorker(BaseWorker):
             self.logger.error(f"Error during authentication: {e}", exc_info=True)
             return False
 
-    async def _fetch_text_channels(self) -> Optional[str]:
+    async def _fetch_text_channels(self) -> Optional[bytes]:
         """Fetch list of text channels from Reuters API."""
         try:
             await self.rate_limiter.acquire(
@@ -134,17 +145,16 @@ class ReutersTextWorker(BaseWorker):
                     self.logger.error(f"Failed to fetch channels, status: {response.status}")
                     return None
                 
-                xml_content = await response.text()
-                return xml_content
+                return await response.read()
                 
         except Exception as e:
             self.logger.error(f"Error fetching text channels: {e}", exc_info=True)
             return None
 
-    def _parse_channels_list(self, xml_content: str) -> List[Dict[str, str]]:
+    def _parse_channels_list(self, xml_content: bytes) -> List[Dict[str, str]]:
         """Parse channels XML and extract channel information."""
         try:
-            root = ET.fromstring(xml_content)
+            root = parse_xml(xml_content)
             channels = []
             
             # Find all channelInformation elements (from the XML structure provided)
@@ -175,7 +185,7 @@ class ReutersTextWorker(BaseWorker):
             self.logger.error(f"Error parsing channels list: {e}", exc_info=True)
             return []
 
-    async def _fetch_items_list(self, channel: str, limit: int = 20) -> Optional[str]:
+    async def _fetch_items_list(self, channel: str, limit: int = 20) -> Optional[bytes]:
         """Fetch list of items from a specific text channel."""
         try:
             await self.rate_limiter.acquire(
@@ -191,17 +201,16 @@ class ReutersTextWorker(BaseWorker):
                     self.logger.warning(f"Failed to fetch items from channel {channel}, status: {response.status}")
                     return None
                 
-                xml_content = await response.text()
-                return xml_content
+                return await response.read()
                 
         except Exception as e:
             self.logger.error(f"Error fetching items list from channel {channel}: {e}", exc_info=True)
             return None
 
-    def _parse_items_list(self, xml_content: str) -> List[Dict[str, str]]:
+    def _parse_items_list(self, xml_content: bytes) -> List[Dict[str, str]]:
         """Parse items list XML and extract item IDs and GUIDs."""
         try:
-            root = ET.fromstring(xml_content)
+            root = parse_xml(xml_content)
             items = []
             
             # Find all result elements
@@ -230,7 +239,7 @@ class ReutersTextWorker(BaseWorker):
             self.logger.error(f"Error parsing items list: {e}", exc_info=True)
             return []
 
-    async def _fetch_item_detail(self, item_id: str, channel: str) -> Optional[str]:
+    async def _fetch_item_detail(self, item_id: str, channel: str) -> Optional[bytes]:
         """Fetch detailed XML for a specific item."""
         try:
             await self.rate_limiter.acquire(
@@ -246,41 +255,40 @@ class ReutersTextWorker(BaseWorker):
                     self.logger.warning(f"Failed to fetch item detail for {item_id}, status: {response.status}")
                     return None
                 
-                xml_content = await response.text()
-                return xml_content
+                return await response.read()
                 
         except Exception as e:
             self.logger.error(f"Error fetching item detail for {item_id}: {e}", exc_info=True)
             return None
 
-    def _parse_item_detail(self, xml_content: str) -> Optional[Dict[str, Any]]:
+    def _parse_item_detail(self, xml_content: bytes) -> Optional[Dict[str, Any]]:
         """Parse item detail XML and extract article metadata and content."""
         try:
-            root = ET.fromstring(xml_content)
+            root = parse_xml(xml_content)
             
             data = {}
             
             # GUID from newsItem attribute
-            news_item = root.find('.//{http://iptc.org/std/nar/2006-10-01/}newsItem')
+            news_item = root.find(NAR_NEWS_ITEM)
             if news_item is not None:
                 data["guid"] = news_item.get("guid", "")
             else:
                 data["guid"] = ""
             
             # Headline
-            headline_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}headline')
+            headline_elem = root.find(NAR_HEADLINE)
             data["headline"] = headline_elem.text if headline_elem is not None else ""
             
             # Body content from multiple possible locations
             # Try inlineXML first (full article body)
-            inline_xml_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}inlineXML')
+            inline_xml_elem = root.find(NAR_INLINE_XML)
             if inline_xml_elem is not None:
                 # Extract all text content from inlineXML
                 body_text = ''.join(inline_xml_elem.itertext()).strip()
                 data["body"] = body_text
             else:
                 # Fallback to description
-                desc_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}description')
+                desc_elem = root.find(NAR_DESCRIPTION)
                 if desc_elem is not None:
                     desc_text = ''.join(desc_elem.itertext()).strip()
                     data["body"] = desc_text
@@ -289,7 +297,7 @@ class ReutersTextWorker(BaseWorker):
             
             # Language from newsItem xml:lang attribute
             if news_item is not None:
-                data["language"] = news_item.get("{http://www.w3.org/XML/1998/namespace}lang", "en")
+                data["language"] = news_item.get(XML_LANG, "en")
             else:
                 data["language"] = "en"
 
@@ -318,19 +326,19 @@ class ReutersTextWorker(BaseWorker):
             data["text_direction"] = "rtl" if data["language"].startswith("ar") else "ltr"
             
             # Priority from header
-            priority_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}header/{http://iptc.org/std/nar/2006-10-01/}priority')
+            priority_elem = root.find(NAR_PRIORITY)
             data["priority"] = priority_elem.text if priority_elem is not None else "5"
             
             # Sent date from header
-            sent_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}header/{http://iptc.org/std/nar/2006-10-01/}sent')
+            sent_elem = root.find(NAR_SENT)
             data["sent"] = sent_elem.text if sent_elem is not None else ""
             
             # Category/Subject
-            subjects = root.findall('.//{http://iptc.org/std/nar/2006-10-01/}contentMeta/{http://iptc.org/std/nar/2006-10-01/}subject')
+            subjects = root.findall(NAR_SUBJECTS)
             if subjects:
                 # Use first subject with a name element
                 for subj in subjects:
-                    name_elem = subj.find("{http://iptc.org/std/nar/2006-10-01/}name")
+                    name_elem = subj.find(NAR_NAME)
                     if name_elem is not None and name_elem.text:
                         data["category"] = name_elem.text
                         break
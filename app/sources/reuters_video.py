@@ -2,7 +2,6 @@
 
 import asyncio
 import hashlib
-import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from io import BytesIO
@@ -19,12 +18,28 @@ load_dotenv()
 
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.xml_utils import parse_xml
 from app.db.models import News
 from sqlalchemy import update
 from app.db.session import AsyncSessionLocal
 from app.workers.base_worker import BaseWorker
 from app.workers.rate_limiter import RateLimiter
 from app.core.category_normalizer import normalize_category
+from app.core.constants import (
+    NAR_DESCRIPTION,
+    NAR_HEADLINE,
+    NAR_INLINE_XML,
+    NAR_ITEM_CLASS,
+    NAR_NAME,
+    NAR_NEWS_ITEM,
+    NAR_PRIORITY,
+    NAR_REMOTE_CONTENTS,
+    NAR_SENT,
+    NAR_SUBJECTS,
+    RTR_ALT_ID,
+    RTR_ALT_LOC,
+    XML_LANG,
+)
 from app.storage.s3 import get_s3_session, init_s3
 
 logger = setup_logging()
@@ -43,6 +58,28 @@ VIDEO_CHANNELS = [
     "jts558"
 ]
 
+# Image rendition markers in priority order (BASEIMAGE has highest quality)
+IMAGE_RENDITION_MARKERS = ("baseimage", "viewimage", "thumbnail")
+
+
+def _image_rendition_rank(rendition: str) -> Optional[int]:
+    """
+    Get the priority of an image rendition.
+
+    Args:
+        rendition: remoteContent rendition attribute
+
+    Returns:
+        Index into IMAGE_RENDITION_MARKERS, or None if it is not a usable image rendition
+    """
+    rendition = rendition.lower()
+    if "thumbnailgrid" in rendition:
+        return None
+    return next(
+        (rank for rank, marker in enumerate(IMAGE_RENDITION_MARKERS) if marker in rendition),
+        None,
+    )
+
 
 class ReutersVideoWorker(BaseWorker):
     """Worker for fetching video articles from Reuters API."""
@@ -114,7 +151,7 @@ class ReutersVideoWorker(BaseWorker):
                 
                 # Parse XML to extract token
                 # Response format: <?xml version="1.0" encoding="UTF-8" standalone="yes"?><authToken>TOKEN</authToken>
-                root = ET.fromstring(xml_content)
+                root = parse_xml(xml_content)
                 
                 # The root element itself is <authToken>
                 if root.tag == "authToken" and root.text:
@@ -132,7 +169,7 @@ class ReutersVideoWorker(BaseWorker):
             self.logger.error(f"Error during authentication: {e}", exc_info=True)
             return False
 
-    async def _fetch_video_channels(self) -> Optional[str]:
+    async def _fetch_video_channels(self) -> Optional[bytes]:
         """Fetch list of video channels from Reuters API."""
         try:
             await self.rate_limiter.acquire(
@@ -153,17 +190,16 @@ class ReutersVideoWorker(BaseWorker):
                     self.logger.error(f"Failed to fetch channels, status: {response.status}")
                     return None
                 
-                xml_content = await response.text()
-                return xml_content
+                return await response.read()
                 
         except Exception as e:
             self.logger.error(f"Error fetching video channels: {e}", exc_info=True)
             return None
 
-    def _parse_channels_list(self, xml_content: str) -> List[Dict[str, str]]:
+    def _parse_channels_list(self, xml_content: bytes) -> List[Dict[str, str]]:
         """Parse channels XML and extract channel information."""
         try:
-            root = ET.fromstring(xml_content)
+            root = parse_xml(xml_content)
             channels = []
             
             # Find all channelInformation elements
@@ -194,7 +230,7 @@ class ReutersVideoWorker(BaseWorker):
             self.logger.error(f"Error parsing channels list: {e}", exc_info=True)
             return []
 
-    async def _fetch_items_list(self, channel: str, limit: int = 20) -> Optional[str]:
+    async def _fetch_items_list(self, channel: str, limit: int = 20) -> Optional[bytes]:
         """Fetch list of items from a specific video channel."""
         try:
             await self.rate_limiter.acquire(
@@ -216,17 +252,16 @@ class ReutersVideoWorker(BaseWorker):
                     self.logger.warning(f"Failed to fetch items from channel {channel}, status: {response.status}")
                     return None
                 
-                xml_content = await response.text()
-                return xml_content
+                return await response.read()
                 
         except Exception as e:
             self.logger.error(f"Error fetching items list from channel {channel}: {e}", exc_info=True)
             return None
 
-    def _parse_items_list(self, xml_content: str) -> List[Dict[str, str]]:
+    def _parse_items_list(self, xml_content: bytes) -> List[Dict[str, str]]:
         """Parse items list XML and extract item IDs and GUIDs."""
         try:
-            root = ET.fromstring(xml_content)
+            root = parse_xml(xml_content)
             items = []
             
             # Find all result elements
@@ -255,7 +290,7 @@ class ReutersVideoWorker(BaseWorker):
             self.logger.error(f"Error parsing items list: {e}", exc_info=True)
             return []
 
-    async def _fetch_item_detail(self, item_id: str) -> Optional[str]:
+    async def _fetch_item_detail(self, item_id: str) -> Optional[bytes]:
         """Fetch detailed XML for a specific item."""
         try:
             await self.rate_limiter.acquire(
@@ -274,41 +309,40 @@ class ReutersVideoWorker(BaseWorker):
                     self.logger.warning(f"Failed to fetch item detail for {item_id}, status: {response.status}")
                     return None
                 
-                xml_content = await response.text()
-                return xml_content
+                return await response.read()
                 
         except Exception as e:
             self.logger.error(f"Error fetching item detail for {item_id}: {e}", exc_info=True)
             return None
 
-    def _parse_item_detail(self, xml_content: str) -> Optional[Dict[str, Any]]:
+    def _parse_item_detail(self, xml_content: bytes) -> Optional[Dict[str, Any]]:
         """Parse item detail XML and extract video metadata and content."""
         try:
-            root = ET.fromstring(xml_content)
+            root = parse_xml(xml_content)
             
             data = {}
             
             # GUID from newsItem attribute
-            news_item = root.find('.//{http://iptc.org/std/nar/2006-10-01/}newsItem')
+            news_item = root.find(NAR_NEWS_ITEM)
             if news_item is not None:
                 data["guid"] = news_item.get("guid", "")
             else:
                 data["guid"] = ""
             
             # Headline
-            headline_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}headline')
+            headline_elem = root.find(NAR_HEADLINE)
             data["headline"] = headline_elem.text if headline_elem is not None else ""
             
             # Body content from multiple possible locations
             # Try inlineXML first (full article body)
-            inline_xml_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}inlineXML')
+            inline_xml_elem = root.find(NAR_INLINE_XML)
             if inline_xml_elem is not None:
                 # Extract all text content from inlineXML
                 body_text = ''.join(inline_xml_elem.itertext()).strip()
                 data["body"] = body_text
             else:
                 # Fallback to description
-                desc_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}description')
+                desc_elem = root.find(NAR_DESCRIPTION)
                 if desc_elem is not None:
                     desc_text = ''.join(desc_elem.itertext()).strip()
                     data["body"] = desc_text
@@ -317,7 +351,7 @@ class ReutersVideoWorker(BaseWorker):
             
             # Language from newsItem xml:lang attribute
             if news_item is not None:
-                data["language"] = news_item.get("{http://www.w3.org/XML/1998/namespace}lang", "en")
+                data["language"] = news_item.get(XML_LANG, "en")
             else:
                 data["language"] = "en"
 
@@ -346,19 +380,19 @@ class ReutersVideoWorker(BaseWorker):
             data["text_direction"] = "rtl" if data["language"].startswith("ar") else "ltr"
             
             # Priority from header
-            priority_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}header/{http://iptc.org/std/nar/2006-10-01/}priority')
+            priority_elem = root.find(NAR_PRIORITY)
             data["priority"] = priority_elem.text if priority_elem is not None else "5"
             
             # Sent date from header
-            sent_elem = root.find('.//{http://iptc.org/std/nar/2006-10-01/}header/{http://iptc.org/std/nar/2006-10-01/}sent')
+            sent_elem = root.find(NAR_SENT)
             data["sent"] = sent_elem.text if sent_elem is not None else ""
             
             # Category/Subject
-            subjects = root.findall('.//{http://iptc.org/std/nar/2006-10-01/}contentMeta/{http://iptc.org/std/nar/2006-10-01/}subject')
+            subjects = root.findall(NAR_SUBJECTS)
             if subjects:
                 # Use first subject with a name element
                 for subj in subjects:
-                    name_elem = subj.find("{http://iptc.org/std/nar/2006-10-01/}name")
+                    name_elem = subj.find(NAR_NAME)
                     if name_elem is not None and name_elem.text:
                         data["category"] = name_elem.text
                         break
@@ -373,14 +407,14 @@ class ReutersVideoWorker(BaseWorker):
             data["image_filename"] = None
             
             # Find all newsItems and check for picture items
-            all_news_items = root.findall('.//{http://iptc.org/std/nar/2006-10-01/}newsItem')
+            all_news_items = root.findall(NAR_NEWS_ITEM)
             picture_items = []
             
             logger.debug(f"Found {len(all_news_items)} total newsItems in XML")
             
             for news_item in all_news_items:
                 # Check if this is a picture item
-                item_class_elem = news_item.find('.//{http://iptc.org/std/nar/2006-10-01/}itemMeta/{http://iptc.org/std/nar/2006-10-01/}itemClass')
+                item_class_elem = news_item.find(NAR_ITEM_CLASS)
                 if item_class_elem is not None:
                     qcode = item_class_elem.get("qcode", "")
                     logger.debug(f"Found newsItem with itemClass qcode: {qcode}")
@@ -396,13 +430,13 @@ class ReutersVideoWorker(BaseWorker):
                 image_url = remote_content.get("href")
                 if not image_url:
                     # Try altLoc as fallback
-                    alt_loc_elem = remote_content.find("{http://www.reuters.com/ns/2003/08/content}altLoc")
+                    alt_loc_elem = remote_content.find(RTR_ALT_LOC)
                     if alt_loc_elem is not None and alt_loc_elem.text:
                         image_url = alt_loc_elem.text
                 
                 if image_url:
                     # Get filename from altId if available
-                    alt_id_elems = remote_content.findall("{http://www.reuters.com/ns/2003/08/content}altId")
+                    alt_id_elems = remote_content.findall(RTR_ALT_ID)
                     filename = None
                     for alt_id_elem in alt_id_elems:
                         if alt_id_elem.text:
@@ -411,40 +445,55 @@ class ReutersVideoWorker(BaseWorker):
                     return image_url, filename
                 return None, None
             
-            # Priority 1: Search for BASEIMAGE (highest quality)
-            # Search all remoteContent in the document for BASEIMAGE
-            logger.info(f"Searching for BASEIMAGE in document for {data.get('guid', 'N/A')[:30]}")
-            all_remote_contents = root.findall('.//{http://iptc.org/std/nar/2006-10-01/}contentSet/{http://iptc.org/std/nar/2006-10-01/}remoteContent')
+            # Classify every remoteContent once and keep the first URL per rank:
+            # BASEIMAGE (any image in the document), then VIEWIMAGE and THUMBNAIL
+            # (picture items only)
+            all_remote_contents = root.findall(NAR_REMOTE_CONTENTS)
             logger.info(f"Found {len(all_remote_contents)} total remoteContent elements in document")
+            picture_contents = {
+                remote_content
+                for picture_item in picture_items
+                for remote_content in picture_item.findall(NAR_REMOTE_CONTENTS)
+            }
             
-            # Log all renditions found for debugging
             all_renditions = []
+            image_candidates = [None] * len(IMAGE_RENDITION_MARKERS)
             for remote_content in all_remote_contents:
                 rendition = remote_content.get("rendition", "")
                 content_type = remote_content.get("contenttype", "")
                 if rendition:
                     all_renditions.append(f"{rendition} ({content_type})")
+                
+                rank = _image_rendition_rank(rendition)
+                if rank is None or image_candidates[rank] is not None:
+                    continue
+                if rank == 0:
+                    # Double check BASEIMAGE is actually an image (not video/audio)
+                    if content_type and "image" not in content_type.lower():
+                        continue
+                elif remote_content not in picture_contents:
+                    continue
+                
+                image_url, filename = extract_image_url(remote_content)
+                if image_url:
+                    image_candidates[rank] = (image_url, filename, rendition)
             
             if all_renditions:
                 logger.info(f"All renditions found: {', '.join(all_renditions[:10])}")  # Show first 10
             
-            for remote_content in all_remote_contents:
-                rendition = remote_content.get("rendition", "")
-                content_type = remote_content.get("contenttype", "")
-                # Check for baseImage in rendition (case insensitive) and ensure it's an image
-                if "baseimage" in rendition.lower():
-                    # Double check it's actually an image (not video/audio)
-                    if not content_type or "image" in content_type.lower():
-                        logger.info(f"Found BASEIMAGE with rendition: {rendition}, contenttype: {content_type}")
-                        image_url, filename = extract_image_url(remote_content)
-                        if image_url:
-                            data["image_url"] = image_url
-                            data["image_filename"] = filename
-                            logger.info(f"Successfully extracted BASEIMAGE URL: {image_url[:80]}...")
-                            break
-            
-            if not data["image_url"]:
-                logger.warning("BASEIMAGE not found anywhere, will try VIEWIMAGE next")
+            best = next(
+                ((rank, candidate) for rank, candidate in enumerate(image_candidates) if candidate),
+                None,
+            )
+            if best is not None:
+                rank, (image_url, filename, rendition) = best
+                data["image_url"] = image_url
+                data["image_filename"] = filename
+                marker = IMAGE_RENDITION_MARKERS[rank].upper()
+                if rank == len(IMAGE_RENDITION_MARKERS) - 1:
+                    logger.warning(f"Using {marker} (fallback) URL: {image_url[:80]}...")
+                else:
+                    logger.info(f"Using {marker} URL ({rendition}): {image_url[:80]}...")
             
             # Extract video URL from remoteContent
             # Look for video with format="fmt:H264/mpeg" and height="432"
@@ -456,7 +505,7 @@ class ReutersVideoWorker(BaseWorker):
             video_items = []
             for news_item in all_news_items:
                 # Check if this is a video item
-                item_class_elem = news_item.find('.//{http://iptc.org/std/nar/2006-10-01/}itemMeta/{http://iptc.org/std/nar/2006-10-01/}itemClass')
+                item_class_elem = news_item.find(NAR_ITEM_CLASS)
                 if item_class_elem is not None and item_class_elem.get("qcode") == "icls:video":
                     video_items.append(news_item)
             
@@ -467,7 +516,7 @@ class ReutersVideoWorker(BaseWorker):
             
             # Search in video items first
             for video_item in video_items:
-                video_remote_contents = video_item.findall('.//{http://iptc.org/std/nar/2006-10-01/}contentSet/{http://iptc.org/std/nar/2006-10-01/}remoteContent')
+                video_remote_contents = video_item.findall(NAR_REMOTE_CONTENTS)
                 for remote_content in video_remote_contents:
                     rendition = remote_content.get("rendition", "")
                     content_type = remote_content.get("contenttype", "")
@@ -477,7 +526,7 @@ class ReutersVideoWorker(BaseWorker):
                         logger.info(f"Found video with rendition={rendition}, contenttype={content_type}")
                         # Try altLoc first (it's the authenticated URL), then href as fallback
                         video_url = None
-                        alt_loc_elem = remote_content.find("{http://www.reuters.com/ns/2003/08/content}altLoc")
+                        alt_loc_elem = remote_content.find(RTR_ALT_LOC)
                         if alt_loc_elem is not None and alt_loc_elem.text:
                             video_url = alt_loc_elem.text
                             logger.debug(f"Using altLoc for video URL: {video_url[:80]}...")
@@ -490,7 +539,7 @@ class ReutersVideoWorker(BaseWorker):
                         if video_url:
                             data["video_url"] = video_url
                             # Get filename from altId if available
-                            alt_id_elems = remote_content.findall("{http://www.reuters.com/ns/2003/08/content}altId")
+                            alt_id_elems = remote_content.findall(RTR_ALT_ID)
                             for alt_id_elem in alt_id_elems:
                                 if alt_id_elem.text:
                                     data["video_filename"] = alt_id_elem.text
@@ -513,7 +562,7 @@ class ReutersVideoWorker(BaseWorker):
                         logger.info(f"Found video in all remoteContent with rendition={rendition}, contenttype={content_type}")
                         # Try altLoc first (it's the authenticated URL), then href as fallback
                         video_url = None
-                        alt_loc_elem = remote_content.find("{http://www.reuters.com/ns/2003/08/content}altLoc")
+                        alt_loc_elem = remote_content.find(RTR_ALT_LOC)
                         if alt_loc_elem is not None and alt_loc_elem.text:
                             video_url = alt_loc_elem.text
                             logger.debug(f"Using altLoc for video URL: {video_url[:80]}...")
@@ -526,7 +575,7 @@ class ReutersVideoWorker(BaseWorker):
                         if video_url:
                             data["video_url"] = video_url
                             # Get filename from altId if available
-                            alt_id_elems = remote_content.findall("{http://www.reuters.com/ns/2003/08/content}altId")
+                            alt_id_elems = remote_content.findall(RTR_ALT_ID)
                             for alt_id_elem in alt_id_elems:
                                 if alt_id_elem.text:
                                     data["video_filename"] = alt_id_elem.text
@@ -537,44 +586,6 @@ class ReutersVideoWorker(BaseWorker):
             if not data["video_url"]:
                 logger.warning(f"Video with rendition='{target_rendition}' not found")
             
-            # Priority 2: If no BASEIMAGE found, try VIEWIMAGE
-            if not data["image_url"]:
-                logger.debug("Searching for VIEWIMAGE")
-                for picture_item in picture_items:
-                    remote_contents = picture_item.findall('.//{http://iptc.org/std/nar/2006-10-01/}contentSet/{http://iptc.org/std/nar/2006-10-01/}remoteContent')
-                    for remote_content in remote_contents:
-                        rendition = remote_content.get("rendition", "")
-                        if "viewImage" in rendition.lower():
-                            logger.debug(f"Found VIEWIMAGE with rendition: {rendition}")
-                            image_url, filename = extract_image_url(remote_content)
-                            if image_url:
-                                data["image_url"] = image_url
-                                data["image_filename"] = filename
-                                logger.info(f"Using VIEWIMAGE URL: {image_url[:80]}...")
-                                break
-                    
-                    if data["image_url"]:
-                        break
-            
-            # Priority 3: If no VIEWIMAGE found, try THUMBNAIL as last resort
-            if not data["image_url"]:
-                logger.debug("Searching for THUMBNAIL as last resort")
-                for picture_item in picture_items:
-                    remote_contents = picture_item.findall('.//{http://iptc.org/std/nar/2006-10-01/}contentSet/{http://iptc.org/std/nar/2006-10-01/}remoteContent')
-                    for remote_content in remote_contents:
-                        rendition = remote_content.get("rendition", "")
-                        if "thumbnail" in rendition.lower() and "thumbnailgrid" not in rendition.lower():
-                            logger.debug(f"Found THUMBNAIL with rendition: {rendition}")
-                            image_url, filename = extract_image_url(remote_content)
-                            if image_url:
-                                data["image_url"] = image_url
-                                data["image_filename"] = filename
-                                logger.warning(f"Using THUMBNAIL (fallback) URL: {image_url[:80]}...")
-                                break
-                    
-                    if data["image_url"]:
-                        break
-            
             # Log image extraction result
             if data["image_url"]:
                 logger.debug(
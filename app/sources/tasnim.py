@@ -1,6 +1,5 @@
 """Tasnim News Agency worker implementation."""
 
-import asyncio
 import hashlib
 import re
 from datetime import datetime, timedelta
@@ -8,7 +7,6 @@ from io import BytesIO
 from typing import Optional
 from urllib.parse import urljoin, urlparse
 
-import aiohttp
 from bs4 import BeautifulSoup
 from selectolax.parser import HTMLParser
 from sqlalchemy import select
@@ -29,10 +27,6 @@ logger = setup_logging(source="tasnim")
 # Archive page URL
 TASNIM_ARCHIVE_URL = "https://www.tasnimnews.ir/fa/archive"
 
-# HTTP client settings
-HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
-HTTP_RETRIES = 3
-
 
 class TasnimWorker(WebScraperWorker):
     """Worker for Tasnim News Agency archive page."""
@@ -46,112 +40,6 @@ class TasnimWorker(WebScraperWorker):
         # Initialize article processor
         self.article_processor = ArticleProcessor(source_name="tasnim")
 
-    async def _get_http_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
-        if self.http_session is None or self.http_session.closed:
-            self.http_session = aiohttp.ClientSession(
-                timeout=HTTP_TIMEOUT,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "fa-IR,fa;q=0.9,en-US;q=0.8,en;q=0.7",
-                    "Accept-Encoding": "gzip, deflate",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                }
-            )
-        return self.http_session
-
-    async def _fetch_with_retry(
-        self,
-        url: str,
-        max_retries: int = HTTP_RETRIES,
-        request_type: str = "article",
-    ) -> Optional[bytes]:
-        """
-        Fetch URL with retries and rate limiting.
-
-        Args:
-            url: URL to fetch
-            max_retries: Maximum number of retry attempts
-            request_type: Type of request (listing, article, image) for logging
-
-        Returns:
-            Response content as bytes, or None if all retries failed
-        """
-        session = await self._get_http_session()
-        for attempt in range(max_retries):
-            try:
-                # Apply rate limiting before making request
-                await self.rate_limiter.acquire(
-                    source=self.source_name,
-                    request_type=request_type
-                )
-                
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        content = await response.read()
-                        self.logger.debug(
-                            f"Successfully fetched {url}",
-                            extra={
-                                "source": self.source_name,
-                                "request_type": request_type,
-                                "article_url": url if request_type == "article" else None,
-                            }
-                        )
-                        return content
-                    elif response.status == 404:
-                        self.logger.warning(
-                            f"404 Not Found: {url}",
-                            extra={
-                                "source": self.source_name,
-                                "request_type": request_type,
-                            }
-                        )
-                        return None
-                    else:
-                        self.logger.warning(
-                            f"HTTP {response.status} for {url}, attempt {attempt + 1}/{max_retries}",
-                            extra={
-                                "source": self.source_name,
-                                "request_type": request_type,
-                            }
-                        )
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(2 ** attempt)
-            except asyncio.TimeoutError:
-                self.logger.warning(
-                    f"Timeout fetching {url}, attempt {attempt + 1}/{max_retries}",
-                    extra={
-                        "source": self.source_name,
-                        "request_type": request_type,
-                    }
-                )
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-            except Exception as e:
-                self.logger.warning(
-                    f"Error fetching {url}: {e}, attempt {attempt + 1}/{max_retries}",
-                    extra={
-                        "source": self.source_name,
-                        "request_type": request_type,
-                    }
-                )
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    self.logger.error(
-                        f"Failed to fetch {url} after {max_retries} attempts",
-                        extra={
-                            "source": self.source_name,
-                            "request_type": request_type,
-                            "article_url": url if request_type == "article" else None,
-                        }
-                    )
-                    return None
-        
-        return None
-
     async def _parse_archive_page(self) -> list[dict]:
         """
         Parse the archive page to extract article links.
@@ -2,15 +2,22 @@
 
 import asyncio
 import hashlib
+import random
 import re
-from datetime import datetime
-from io import BytesIO
-from typing import Optional
-from urllib.parse import urljoin, urlparse, urlunparse
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple, Union
+from urllib.parse import urljoin
 
 import aiohttp
 import feedparser
+import jdatetime
 from bs4 import BeautifulSoup
+from charset_normalizer import from_bytes
+from dateutil import parser as date_parser
+from dateutil.tz import gettz
+from lxml import etree
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,7 +26,9 @@ from app.core.logging import setup_logging
 from app.core.category_normalizer import normalize_category
 from app.db.base import AsyncSessionLocal
 from app.db.models import News
-from app.storage.s3 import get_s3_session, init_s3
+from app.services.news_repository import NewsRepository
+from app.storage.s3 import get_s3_client, init_s3
+from app.workers.adaptive_limiter import AdaptiveConcurrencyLimiter
 from app.workers.base_worker import BaseWorker
 from app.workers.rate_limiter import RateLimiter
 
@@ -31,6 +40,249 @@ YJC_RSS_URL = "https://www.yjc.ir/fa/rss/allnews"
 # HTTP client settings
 HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
 HTTP_RETRIES = 3
+STREAM_CHUNK_SIZE = 64 * 1024
+MAX_RESPONSE_BYTES = 20 * 1024 * 1024
+MAX_BACKOFF_SECONDS = 30
+# Longest Retry-After we honor; a larger value would hold an article slot for the whole delay
+MAX_RETRY_AFTER = 60.0
+# Processed articles are saved in batches of this size as they complete
+SAVE_BATCH_SIZE = 20
+# Leading bytes needed to recognize every supported image format
+IMAGE_SNIFF_BYTES = 12
+
+# Category text normalization patterns
+# "word1 > و > word2", "word1 > و word2" and "word1 و > word2" all collapse to "word1 و word2"
+_WAW_NORM = re.compile(r'\s*>\s*و\s*>\s*|\s*>\s*و\s+|\s+و\s*>\s*')
+_CATEGORY_SEP = re.compile(r'[/|\-]+')
+_WHITESPACE = re.compile(r'\s+')
+
+# Persian publish date, e.g. "12 دی 1404 ساعت 00:10"
+_PERSIAN_MONTHS = {
+    'فروردین': 1, 'اردیبهشت': 2, 'خرداد': 3, 'تیر': 4, 'مرداد': 5, 'شهریور': 6,
+    'مهر': 7, 'آبان': 8, 'آذر': 9, 'دی': 10, 'بهمن': 11, 'اسفند': 12
+}
+_TEHRAN_TZ = gettz('Asia/Tehran')
+# Persian and Arabic-Indic digits mapped to ASCII
+_PERSIAN_DIGITS = str.maketrans('۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩', '01234567890123456789')
+_PERSIAN_DATE_RE = re.compile(
+    r'(\d{1,2})\s*(' + '|'.join(_PERSIAN_MONTHS) + r')\s*(\d{4})\s*ساعت\s*(\d{1,2}):(\d{2})'
+)
+
+
+def _class_xpath(class_name: str, tag: str = "*") -> str:
+    """Build an XPath matching elements whose class list contains ``class_name``."""
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Compiled XPath expressions for the YJC page layout
+_XP_ARTICLE_BODY = etree.XPath('//*[@id="root"]/div/div[11]')
+_XP_CATEGORY = etree.XPath('//*[@id="root"]/div/div[7]')
+_XP_TIME = etree.XPath('//*[@id="root"]/div/div[6]/div[1]/div[1]/span/span')
+_XP_FIRST_H1 = etree.XPath('(//h1)[1]')
+_XP_END_MARKER = etree.XPath('(.//text()[contains(., $marker)])[1]')
+
+# Main image lookups; "/ads/" also covers "/redirect/ads/" links
+_IMG_SRC_ATTRS = ("src", "data-src", "data-lazy-src", "data-original")
+_XP_OG_IMAGE = etree.XPath('(//meta[@property="og:image"])[1]/@content')
+_XP_FIGURE_IMAGE = etree.XPath(
+    '((//article)[1]//figure[not(.//a[contains(@href, "/ads/")])]'
+    '/descendant::img[1][' + " or ".join(f'@{attr} != ""' for attr in _IMG_SRC_ATTRS) + '])[1]'
+)
+_XP_NON_AD_IMAGES = etree.XPath('//img[not(ancestor::a[contains(@href, "/ads/")])]')
+_XP_AD_LINK_IMAGES = etree.XPath('.//a[contains(@href, "/ads/")]//img')
+# Advertisement link targets ("/ads/" also covers "/redirect/ads/")
+_AD_HREF_RE = re.compile(r'/ads/|(?i:advertisement)')
+# Image URLs containing these are site chrome rather than article images
+_SKIP_IMAGE_HINTS = ("logo", "barcode")
+
+# Article body candidates tried after the primary XPath, as (label, compiled XPath) pairs
+ARTICLE_BODY_XPATHS = [
+    (selector, etree.XPath(selector_xpath))
+    for selector, selector_xpath in (
+        ("article", "//article"),
+        (".article-body", _class_xpath("article-body")),
+        (".content", _class_xpath("content")),
+        (".post-content", _class_xpath("post-content")),
+        ("#content", "//*[@id='content']"),
+        (".news-content", _class_xpath("news-content")),
+        (".article-content", _class_xpath("article-content")),
+        ("main", "//main"),
+        ("[role='main']", "//*[@role='main']"),
+        (".main-content", _class_xpath("main-content")),
+        (".news-body", _class_xpath("news-body")),
+        (".news-text", _class_xpath("news-text")),
+        ("div.news", _class_xpath("news", "div")),
+        ("div[class*='news']", "//div[contains(@class, 'news')]"),
+        ("div[class*='content']", "//div[contains(@class, 'content')]"),
+        ("div[class*='article']", "//div[contains(@class, 'article')]"),
+    )
+]
+
+# First div after the page's h1 with substantial text and no navigation-like class
+_LOWER_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+H1_CONTENT_DIV_XPATH = (
+    "(//h1)[1]/following-sibling::div["
+    "string-length(normalize-space(.)) > 200 and not("
+    + " or ".join(
+        f"contains({_LOWER_CLASS}, '{skip}')"
+        for skip in ("nav", "menu", "header", "footer", "sidebar")
+    )
+    + ")][1]"
+)
+_XP_H1_CONTENT_DIV = etree.XPath(H1_CONTENT_DIV_XPATH)
+
+# Article body cleanup rules
+UNWANTED_TAGS = frozenset({"script", "style", "iframe"})
+UNWANTED_CLASSES = (
+    "ad", "advertisement", "social", "share",
+    "comment", "comments", "related", "sidebar",
+)
+UNWANTED_HEADINGS = ("اخبار مرتبط", "برچسب", "برچسب‌ها", "نظر شما", "این مطالب را از دست ندهید")
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+# Class names are matched as whole words (split on anything but letters/digits)
+# so e.g. "header" or "shadow" don't count as "ad"
+_UNWANTED_CLASS_RE = re.compile(
+    r'(?<![a-z0-9])(?:' + '|'.join(map(re.escape, UNWANTED_CLASSES)) + r')(?![a-z0-9])',
+    re.IGNORECASE,
+)
+_UNWANTED_HEADING_RE = re.compile('|'.join(map(re.escape, UNWANTED_HEADINGS)))
+END_MARKER = "انتهای پیام"
+
+# lxml parsers must not be shared between threads, so each parsing thread
+# lazily creates and then reuses its own (see _get_html_parser)
+_parser_local = threading.local()
+
+# Number of leading bytes inspected when the page is not valid UTF-8
+ENCODING_SNIFF_BYTES = 8192
+
+# Image magic bytes as (prefix, file extension, content type); WebP is
+# checked separately because its signature is split around the file size
+_IMAGE_MAGIC = (
+    (b'\xff\xd8', '.jpg', 'image/jpeg'),
+    (b'\x89PNG', '.png', 'image/png'),
+    (b'GIF8', '.gif', 'image/gif'),
+    (b'GIF9', '.gif', 'image/gif'),
+)
+
+
+def _sniff_image(content: Union[bytes, bytearray]) -> Optional[Tuple[str, str]]:
+    """
+    Identify an image format from its leading bytes.
+
+    Args:
+        content: Image data
+
+    Returns:
+        (file extension, content type) tuple, or None if not a supported image
+    """
+    for magic, ext, content_type in _IMAGE_MAGIC:
+        if content.startswith(magic):
+            return ext, content_type
+    if content[:4] == b'RIFF' and content[8:12] == b'WEBP':
+        return '.webp', 'image/webp'
+    return None
+
+
+def _get_html_parser() -> etree.HTMLParser:
+    """Get the calling thread's lxml HTML parser, creating it on first use."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = etree.HTMLParser(encoding='utf-8', recover=True)
+        _parser_local.parser = parser
+    return parser
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Normalize an article URL for storage and duplicate checks.
+
+    Removes the trailing slash, query string and fragment.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Normalized URL
+    """
+    return url.rstrip('/').split('?')[0].split('#')[0]
+
+
+def _text_length(element) -> int:
+    """Length of an element's text with each text node stripped (like BeautifulSoup's get_text(strip=True))."""
+    return sum(len(text.strip()) for text in element.itertext())
+
+
+def _is_ad_href(href: Optional[str]) -> bool:
+    """Check whether a link target points to an advertisement."""
+    return bool(href) and _AD_HREF_RE.search(href) is not None
+
+
+def _remove_element(element) -> None:
+    """Detach an lxml element from its parent, keeping its tail text in the document."""
+    parent = element.getparent()
+    if parent is None:
+        return
+    if element.tail:
+        previous = element.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + element.tail
+        else:
+            parent.text = (parent.text or "") + element.tail
+    parent.remove(element)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (at most MAX_RETRY_AFTER), or None if the header is
+        missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        delay = float(value)
+        if delay != delay:  # "nan"
+            return None
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+def _decode_html(content: bytes) -> str:
+    """
+    Decode an HTML page with a single full-buffer decode.
+
+    UTF-8 (with or without BOM) is tried first since it covers virtually all
+    YJC pages. Otherwise the encoding is detected from a short prefix and the
+    page is decoded once, falling back to windows-1256 for legacy Persian pages.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Decoded HTML text
+    """
+    try:
+        return content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        pass
+
+    best_match = from_bytes(content[:ENCODING_SNIFF_BYTES]).best()
+    encoding = best_match.encoding if best_match else None
+    if not encoding or encoding in ("ascii", "utf_8"):
+        encoding = "windows-1256"
+    return content.decode(encoding, errors="replace")
 
 
 class YJCWorker(BaseWorker):
@@ -42,18 +294,38 @@ class YJCWorker(BaseWorker):
         self.rss_url = YJC_RSS_URL
         self.http_session: Optional[aiohttp.ClientSession] = None
         self._s3_initialized = False
+        # Normalized URLs known to be stored; preloaded each feed run and
+        # extended with the rows saved in it
+        self._seen_urls: set[str] = set()
         
         # Initialize rate limiter
         self.rate_limiter = RateLimiter(
             max_requests_per_minute=settings.max_requests_per_minute,
             delay_between_requests=settings.delay_between_requests,
         )
+        self.adaptive_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=4,
+            max_limit=settings.article_concurrency,
+        )
 
     async def _get_http_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
-        if self.http_session is None or self.http_session.closed:
+        """
+        Get the worker's HTTP session, creating it on first use.
+
+        The session lives for the whole worker lifetime so TCP/TLS connections
+        and DNS lookups to yjc.ir are reused across polling cycles; it is only
+        closed in cleanup().
+        """
+        if self.http_session is None:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=settings.article_concurrency,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
             self.http_session = aiohttp.ClientSession(
                 timeout=HTTP_TIMEOUT,
+                connector=connector,
                 headers={
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 }
@@ -79,6 +351,7 @@ class YJCWorker(BaseWorker):
         """
         session = await self._get_http_session()
         for attempt in range(max_retries):
+            retry_after = None
             try:
                 # Apply rate limiting before making request
                 await self.rate_limiter.acquire(
@@ -86,9 +359,34 @@ class YJCWorker(BaseWorker):
                     request_type=request_type
                 )
                 
-                async with session.get(url) as response:
+                # Concurrency adapts to observed latency; the rate limiter above stays the hard ceiling
+                async with self.adaptive_limiter.use() as limiter_request, session.get(url) as response:
+                    if response.status == 429 or response.status >= 500:
+                        # Throttling counts as a failure even though no exception is raised
+                        limiter_request.mark_failed()
                     if response.status == 200:
-                        content = await response.read()
+                        # Stream the body in chunks so oversized responses (and
+                        # images with an unknown signature) are abandoned early
+                        # instead of being buffered whole
+                        buffer = bytearray()
+                        sniffed = request_type != "image"
+                        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                            buffer.extend(chunk)
+                            if not sniffed and len(buffer) >= IMAGE_SNIFF_BYTES:
+                                sniffed = True
+                                if _sniff_image(buffer) is None:
+                                    self.logger.warning(
+                                        f"Response is not a supported image, skipping: {url}",
+                                        extra={"source": self.source_name, "request_type": request_type, "article_url": url}
+                                    )
+                                    return None
+                            if len(buffer) > MAX_RESPONSE_BYTES:
+                                self.logger.warning(
+                                    f"Response for {request_type} exceeds {MAX_RESPONSE_BYTES} bytes, skipping: {url}",
+                                    extra={"source": self.source_name, "request_type": request_type, "article_url": url}
+                                )
+                                return None
+                        content = bytes(buffer)
                         self.logger.debug(
                             f"Successfully fetched {request_type}: {url}",
                             extra={"source": self.source_name, "request_type": request_type, "article_url": url}
@@ -105,6 +403,8 @@ class YJCWorker(BaseWorker):
                             f"HTTP {response.status} for {request_type}: {url}",
                             extra={"source": self.source_name, "request_type": request_type, "article_url": url}
                         )
+                        if response.status == 429:
+                            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
             except asyncio.TimeoutError:
                 self.logger.warning(
                     f"Timeout fetching {request_type} (attempt {attempt + 1}/{max_retries}): {url}",
@@ -117,7 +417,13 @@ class YJCWorker(BaseWorker):
                 )
             
             if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                if retry_after is not None:
+                    # Server told us exactly how long to wait
+                    delay = retry_after
+                else:
+                    # Capped exponential backoff with jitter so concurrent retries don't align
+                    delay = min(MAX_BACKOFF_SECONDS, 2 ** attempt) * (0.5 + random.random())
+                await asyncio.sleep(delay)
         
         self.logger.error(
             f"Failed to fetch {request_type} after {max_retries} attempts: {url}",
@@ -125,10 +431,43 @@ class YJCWorker(BaseWorker):
         )
         return None
 
+    async def cleanup(self) -> None:
+        """Close the HTTP session on worker shutdown."""
+        if self.http_session and not self.http_session.closed:
+            try:
+                await asyncio.wait_for(self.http_session.close(), timeout=2.0)
+            except Exception as e:
+                self.logger.warning(f"Error closing HTTP session: {e}")
+        self.http_session = None
+
+    async def _load_recent_urls(self, db: AsyncSession, limit: int = 500) -> set[str]:
+        """
+        Load the most recently stored article URLs for this source.
+
+        Args:
+            db: Database session
+            limit: Maximum number of URLs to load
+
+        Returns:
+            Set of stored (normalized) article URLs
+        """
+        result = await db.execute(
+            select(News.url)
+            .where(News.source == "yjc")
+            .order_by(News.created_at.desc())
+            .limit(limit)
+        )
+        return set(result.scalars().all())
+
     async def _parse_rss_feed(self) -> list[dict]:
         """
         Parse RSS feed and extract article information.
 
+        Articles that are already stored are skipped (not treated as the end
+        of the new items: an older article can still be missing when a newer
+        one from the same cycle was stored), and no more than
+        ``settings.max_items_per_feed`` new items are collected.
+
         Returns:
             List of dictionaries containing article data
         """
@@ -137,14 +476,30 @@ class YJCWorker(BaseWorker):
             self.logger.error("Failed to fetch RSS feed")
             return []
 
+        try:
+            async with AsyncSessionLocal() as db:
+                known_urls = await self._load_recent_urls(db)
+        except Exception as e:
+            self.logger.warning(f"Could not load recent URLs, parsing full feed: {e}")
+            known_urls = set()
+        self._seen_urls = known_urls
+
         try:
             feed = feedparser.parse(content)
             items = []
             
             for entry in feed.entries:
+                if len(items) >= settings.max_items_per_feed:
+                    self.logger.debug(f"Reached max_items_per_feed ({settings.max_items_per_feed}), stopping")
+                    break
+
+                link = entry.get("link", "")
+                if _normalize_url(link) in known_urls:
+                    continue
+
                 item = {
                     "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
+                    "link": link,
                     "description": entry.get("description", ""),
                     "pubDate": "",
                     "category": "",
@@ -152,9 +507,10 @@ class YJCWorker(BaseWorker):
                 }
                 
                 # Extract published date
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
+                published_parsed = entry.get("published_parsed")
+                if published_parsed:
                     try:
-                        pub_date = datetime(*entry.published_parsed[:6])
+                        pub_date = datetime(*published_parsed[:6])
                         item["pubDate"] = pub_date.isoformat()
                     except Exception as e:
                         self.logger.debug(f"Could not parse published_parsed: {e}")
@@ -163,47 +519,44 @@ class YJCWorker(BaseWorker):
                 if not item["pubDate"]:
                     for date_field in ["published", "updated", "pubDate"]:
                         if entry.get(date_field):
+                            # RSS dates are RFC 2822 (with or without the weekday prefix)
                             try:
-                                item["pubDate"] = datetime.strptime(
-                                    entry[date_field], "%d %b %Y %H:%M:%S %z"
-                                ).isoformat()
+                                item["pubDate"] = parsedate_to_datetime(entry[date_field]).isoformat()
                                 break
-                            except Exception:
-                                try:
-                                    item["pubDate"] = datetime.strptime(
-                                        entry[date_field], "%a, %d %b %Y %H:%M:%S %z"
-                                    ).isoformat()
-                                    break
-                                except Exception:
-                                    pass
+                            except (TypeError, ValueError):
+                                pass
                 
                 # Extract category from tags, category, or dc:subject
                 category = ""
-                if hasattr(entry, "tags") and entry.tags:
-                    category = entry.tags[0].get("term", "")
-                elif hasattr(entry, "category"):
-                    category = entry.category
-                elif hasattr(entry, "dc_subject"):
-                    category = entry.dc_subject
+                tags = entry.get("tags")
+                if tags:
+                    category = tags[0].get("term", "")
+                elif entry.get("category"):
+                    category = entry["category"]
+                elif entry.get("dc_subject"):
+                    category = entry["dc_subject"]
                 
                 item["category"] = category
                 
                 # Extract image from enclosure
-                if hasattr(entry, "enclosures") and entry.enclosures:
-                    for enclosure in entry.enclosures:
+                enclosures = entry.get("enclosures")
+                if enclosures:
+                    for enclosure in enclosures:
                         if enclosure.get("type", "").startswith("image/"):
                             item["image_url"] = enclosure.get("url", "")
                             break
                 
                 # Also check for media:content or media:thumbnail
                 if not item["image_url"]:
-                    if hasattr(entry, "media_content") and entry.media_content:
-                        for media in entry.media_content:
+                    media_content = entry.get("media_content")
+                    media_thumbnail = entry.get("media_thumbnail")
+                    if media_content:
+                        for media in media_content:
                             if media.get("type", "").startswith("image/"):
                                 item["image_url"] = media.get("url", "")
                                 break
-                    elif hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-                        item["image_url"] = entry.media_thumbnail[0].get("url", "")
+                    elif media_thumbnail:
+                        item["image_url"] = media_thumbnail[0].get("url", "")
                 
                 items.append(item)
             
@@ -225,8 +578,7 @@ class YJCWorker(BaseWorker):
             True if URL exists, False otherwise
         """
         # Normalize URL: remove trailing slash and query parameters for comparison
-        # This must match the normalization in _save_article
-        normalized_url = url.rstrip('/').split('?')[0].split('#')[0]
+        normalized_url = _normalize_url(url)
         
         # Check with source filter to avoid conflicts with other sources
         # Since we always store normalized URLs, check normalized URL first
@@ -275,30 +627,38 @@ class YJCWorker(BaseWorker):
         """
         Extract article content from HTML page.
 
+        The page is fetched on the event loop; the CPU-bound parsing and
+        cleanup run in a worker thread so concurrent fetches keep flowing.
+
         Args:
             url: Article URL
 
         Returns:
             Dictionary with article content or None if extraction failed
         """
-        try:
-            content = await self._fetch_with_retry(url, request_type="article")
-            if content is None:
-                return None
+        content = await self._fetch_with_retry(url, request_type="article")
+        if content is None:
+            return None
+        return await asyncio.to_thread(self._parse_article_html, content, url)
 
-            # Try different encodings
-            html_content = None
-            for encoding in ['utf-8', 'utf-8-sig', 'windows-1256', 'iso-8859-1']:
-                try:
-                    html_content = content.decode(encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if html_content is None:
-                html_content = content.decode('utf-8', errors='ignore')
+    def _parse_article_html(self, content: bytes, url: str) -> Optional[dict]:
+        """
+        Parse article content from a fetched HTML page.
+
+        Runs in a worker thread (see _extract_article_content), so it must not
+        touch the event loop.
+
+        Args:
+            content: Raw HTML page
+            url: Article URL
+
+        Returns:
+            Dictionary with article content or None if extraction failed
+        """
+        try:
+            html_content = _decode_html(content)
 
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
 
             # Extract title
             title = ""
@@ -330,194 +690,14 @@ class YJCWorker(BaseWorker):
                     if " - " in title:
                         title = title.split(" - ")[0].strip()
 
-            # Extract article body using XPath (Priority 1)
             body_html = ""
-            article_tag = None
-            
-            # Priority 1: XPath //*[@id="root"]/div/div[11]
+
+            # Parse once with lxml; the tree is reused for all XPath lookups below
             try:
-                from lxml import etree
-                parser = etree.HTMLParser(encoding='utf-8')
-                # Use content (bytes) for lxml parsing
-                tree = etree.fromstring(content, parser=parser)
-                xpath_result = tree.xpath('//*[@id="root"]/div/div[11]')
-                if xpath_result and len(xpath_result) > 0:
-                    # Convert lxml element to BeautifulSoup
-                    xpath_elem = xpath_result[0]
-                    # Get HTML string from lxml element
-                    xpath_html = etree.tostring(xpath_elem, encoding='unicode', method='html')
-                    # Parse with BeautifulSoup for further processing
-                    xpath_soup = BeautifulSoup(xpath_html, 'html.parser')
-                    # Check if it has meaningful content
-                    text_content = xpath_soup.get_text(strip=True)
-                    if len(text_content) > 100:
-                        article_tag = xpath_soup
-                        self.logger.debug(f'Found article body using XPath //*[@id="root"]/div/div[11]', extra={"article_url": url})
+                tree = etree.fromstring(content, parser=_get_html_parser())
             except Exception as e:
-                self.logger.debug(f"Error extracting article body using XPath: {e}", extra={"article_url": url})
-            
-            # Priority 2: Try CSS selectors
-            if not article_tag:
-                article_selectors = [
-                    "article",
-                    ".article-body",
-                    ".content",
-                    ".post-content",
-                    "#content",
-                    ".news-content",
-                    ".article-content",
-                    "main",
-                    "[role='main']",
-                    ".main-content",
-                    ".news-body",
-                    ".news-text",
-                    "div.news",
-                    "div[class*='news']",
-                    "div[class*='content']",
-                    "div[class*='article']",
-                ]
-                
-                for selector in article_selectors:
-                    try:
-                        article_tag = soup.select_one(selector)
-                        if article_tag:
-                            # Check if it has meaningful content (at least 100 characters)
-                            text_content = article_tag.get_text(strip=True)
-                            if len(text_content) > 100:
-                                self.logger.debug(f"Found article body with selector: {selector}", extra={"article_url": url})
-                                break
-                            else:
-                                article_tag = None
-                    except Exception as e:
-                        self.logger.debug(f"Error with selector {selector}: {e}", extra={"article_url": url})
-                        continue
-            
-            # Try to find the main content area by looking for divs with substantial text
-            if not article_tag:
-                # Find h1 first
-                h1_tag = soup.find("h1")
-                if h1_tag:
-                    # Look for divs after h1 that contain substantial text
-                    current = h1_tag.next_sibling
-                    while current:
-                        if hasattr(current, 'name') and current.name == 'div':
-                            text_content = current.get_text(strip=True)
-                            # Check if this div has substantial content and doesn't look like navigation/menu
-                            if len(text_content) > 200 and not any(skip in str(current.get('class', [])).lower() for skip in ['nav', 'menu', 'header', 'footer', 'sidebar']):
-                                article_tag = current
-                                self.logger.debug("Found article body by searching after h1", extra={"article_url": url})
-                                break
-                        current = current.next_sibling if hasattr(current, 'next_sibling') else None
-                    
-                    # If still not found, try finding parent of h1 and look for content divs
-                    if not article_tag and h1_tag:
-                        parent = h1_tag.parent
-                        if parent:
-                            # Look for divs with substantial text in the parent
-                            content_divs = parent.find_all('div', recursive=False)
-                            for div in content_divs:
-                                text_content = div.get_text(strip=True)
-                                if len(text_content) > 200:
-                                    article_tag = div
-                                    self.logger.debug("Found article body in parent container", extra={"article_url": url})
-                                    break
-
-            if article_tag:
-                # Remove script and style tags
-                for tag in article_tag.find_all(["script", "style", "iframe"]):
-                    tag.decompose()
-                
-                # Remove specific unwanted classes
-                unwanted_classes = [
-                    "ad", "advertisement", "social", "share",
-                    "comment", "comments", "related", "sidebar"
-                ]
-                
-                # Remove elements with unwanted classes
-                for tag in article_tag.find_all(class_=lambda x: x and any(skip in x.lower() for skip in unwanted_classes)):
-                    tag.decompose()
-                
-                # Remove advertisement links (links containing /redirect/ads/ or similar)
-                for ad_link in article_tag.find_all("a", href=lambda x: x and ("/redirect/ads/" in x or "/ads/" in x or "advertisement" in x.lower())):
-                    # Remove the entire parent element (usually figure or listitem)
-                    parent = ad_link.find_parent()
-                    if parent:
-                        parent.decompose()
-                
-                # Remove sections with headings like "اخبار مرتبط", "برچسب‌ها", etc.
-                unwanted_headings = ["اخبار مرتبط", "برچسب", "برچسب‌ها", "نظر شما", "این مطالب را از دست ندهید"]
-                for heading in article_tag.find_all(["h2", "h3"]):
-                    heading_text = heading.get_text(strip=True)
-                    if any(unwanted in heading_text for unwanted in unwanted_headings):
-                        # Find the parent container (usually a div or section)
-                        parent = heading.find_parent()
-                        if parent:
-                            # If the parent contains the heading and its siblings, remove the parent
-                            # Otherwise, remove the heading and its following siblings
-                            # Check if parent is a direct child of article_tag
-                            if parent.parent == article_tag or parent in article_tag.descendants:
-                                # Try to find the container div that holds this section
-                                container = heading.find_parent("div")
-                                if container and container != article_tag:
-                                    # Check if this container seems to be a section (has list or multiple elements)
-                                    if container.find("ul") or container.find("ol") or len(container.find_all()) > 2:
-                                        container.decompose()
-                                        continue
-                                # Otherwise, remove heading and following siblings until next heading
-                                current = heading
-                                while current:
-                                    next_sibling = current.next_sibling
-                                    if hasattr(current, 'decompose'):
-                                        current.decompose()
-                                    current = next_sibling
-                                    # Stop if we hit another heading or reach end
-                                    if not current:
-                                        break
-                                    if hasattr(current, 'name'):
-                                        if current.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                                            break
-                                        if current.name == 'div':
-                                            # Check if this div contains another heading
-                                            if current.find(["h1", "h2", "h3", "h4", "h5", "h6"]):
-                                                break
-                
-                # Remove content after "انتهای پیام" (end of message marker)
-                end_marker = article_tag.find(string=lambda text: text and "انتهای پیام" in text)
-                if end_marker:
-                    marker_parent = end_marker.find_parent()
-                    if marker_parent:
-                        # Remove all siblings after the marker parent
-                        for sibling in list(marker_parent.next_siblings):
-                            if hasattr(sibling, 'decompose'):
-                                sibling.decompose()
-                        # Keep the marker parent itself but remove its content after the marker
-                        marker_text = marker_parent.get_text()
-                        if "انتهای پیام" in marker_text:
-                            # Find the position of "انتهای پیام" in the text
-                            marker_index = marker_text.find("انتهای پیام")
-                            if marker_index > 0:
-                                # Remove text after "انتهای پیام" from the marker parent
-                                for text_node in marker_parent.find_all(string=True):
-                                    if "انتهای پیام" in text_node:
-                                        # Split the text and keep only up to "انتهای پیام"
-                                        parts = text_node.split("انتهای پیام", 1)
-                                        if len(parts) > 1:
-                                            text_node.replace_with(parts[0] + "انتهای پیام")
-                
-                body_html = str(article_tag)
-            else:
-                self.logger.warning(f"Could not find article body content", extra={"article_url": url})
-
-            # Extract summary from meta description or first paragraph
-            summary = ""
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            if meta_desc and meta_desc.get("content"):
-                summary = meta_desc["content"]
-            elif body_html:
-                # Fallback: first paragraph
-                first_p = soup.find("p")
-                if first_p:
-                    summary = first_p.get_text(strip=True)[:500]
+                tree = None
+                self.logger.debug(f"Error parsing page with lxml: {e}", extra={"article_url": url})
 
             # Extract category and published date
             category = ""
@@ -525,13 +705,11 @@ class YJCWorker(BaseWorker):
             
             # Extract category and published date using XPath
             try:
-                from lxml import etree
-                parser = etree.HTMLParser(encoding='utf-8')
-                tree = etree.fromstring(content, parser=parser)
-                
+                if tree is None:
+                    raise ValueError("page could not be parsed with lxml")
+
                 # Extract category from XPath //*[@id="root"]/div/div[7]
-                category_xpath = '//*[@id="root"]/div/div[7]'
-                category_elements = tree.xpath(category_xpath)
+                category_elements = _XP_CATEGORY(tree)
                 if category_elements and len(category_elements) > 0:
                     # Get all text content from the element (including text in child elements)
                     category_text = ''.join(category_elements[0].itertext()).strip()
@@ -542,9 +720,7 @@ class YJCWorker(BaseWorker):
                         # Handle "و" (and) - combine it with adjacent words
                         # Pattern: "word1 > و > word2" or "word1 > و word2" or "word1 و > word2"
                         # Should become: "word1 > word2 و word3" or "word1 و word2"
-                        category_text = re.sub(r'\s*>\s*و\s*>\s*', ' و ', category_text)
-                        category_text = re.sub(r'\s*>\s*و\s+', ' و ', category_text)
-                        category_text = re.sub(r'\s+و\s*>\s*', ' و ', category_text)
+                        category_text = _WAW_NORM.sub(' و ', category_text)
                         
                         # Split by > but preserve multi-word parts and commas
                         # First, split by > to get main parts
@@ -560,14 +736,14 @@ class YJCWorker(BaseWorker):
                             
                             # Split by other separators but preserve commas and "و"
                             # Split by /, |, - but keep commas and "و" as part of the text
-                            sub_parts = re.split(r'[/|\-]+', part)
+                            sub_parts = _CATEGORY_SEP.split(part)
                             sub_parts = [p.strip() for p in sub_parts if p.strip()]
                             
                             # Combine sub_parts if they contain "و" or commas
                             combined_part = ' '.join(sub_parts)
                             
                             # Clean up multiple spaces
-                            combined_part = re.sub(r'\s+', ' ', combined_part)
+                            combined_part = _WHITESPACE.sub(' ', combined_part)
                             
                             if combined_part:
                                 processed_parts.append(combined_part)
@@ -621,57 +797,35 @@ class YJCWorker(BaseWorker):
                         self.logger.debug(f"Found category from XPath: {category}", extra={"article_url": url})
                 
                 # Extract published date from XPath //*[@id="root"]/div/div[6]/div[1]/div[1]/span/span
-                time_xpath = '//*[@id="root"]/div/div[6]/div[1]/div[1]/span/span'
-                time_elements = tree.xpath(time_xpath)
+                time_elements = _XP_TIME(tree)
                 if time_elements and len(time_elements) > 0:
                     # Get all text content from the element (including text in child elements)
-                    time_text = ''.join(time_elements[0].itertext()).strip()
+                    time_text = ''.join(time_elements[0].itertext()).strip().translate(_PERSIAN_DIGITS)
                     if time_text:
                         self.logger.debug(f"Found time text from XPath: {time_text}", extra={"article_url": url})
                         # Try to parse Persian date format
                         # Format examples: "12 دی 1404 ساعت 00:10" or "02 Jan 2026 16:37:50 +0330"
-                        date_match = re.search(r'(\d{1,2})\s*(دی|بهمن|اسفند|فروردین|اردیبهشت|خرداد|تیر|مرداد|شهریور|مهر|آبان|آذر)\s*(\d{4})\s*ساعت\s*(\d{1,2}):(\d{2})', time_text)
+                        date_match = _PERSIAN_DATE_RE.search(time_text)
                         if date_match:
-                            day, month_name, year, hour, minute = date_match.groups()
+                            day, year, hour, minute = map(int, date_match.group(1, 3, 4, 5))
                             
                             # Convert Persian month to number
-                            persian_months = {
-                                'فروردین': 1, 'اردیبهشت': 2, 'خرداد': 3, 'تیر': 4, 'مرداد': 5, 'شهریور': 6,
-                                'مهر': 7, 'آبان': 8, 'آذر': 9, 'دی': 10, 'بهمن': 11, 'اسفند': 12
-                            }
+                            month = _PERSIAN_MONTHS.get(date_match.group(2), 1)
                             
-                            month = persian_months.get(month_name, 1)
-                            
-                            # Convert to Gregorian date using jdatetime library for accurate conversion
+                            # Convert to Gregorian with jdatetime; the page time is already in Iran's timezone
                             try:
-                                import jdatetime
-                                from dateutil.tz import gettz
-                                
-                                # Create Persian datetime object
-                                persian_dt = jdatetime.datetime(
-                                    year=int(year),
-                                    month=month,
-                                    day=int(day),
-                                    hour=int(hour),
-                                    minute=int(minute)
+                                published_at = (
+                                    jdatetime.datetime(year, month, day, hour, minute)
+                                    .togregorian()
+                                    .replace(tzinfo=_TEHRAN_TZ)
+                                    .isoformat()
                                 )
-                                
-                                # Convert to Gregorian
-                                gregorian_dt = persian_dt.togregorian()
-                                
-                                # Set timezone to Asia/Tehran (time is already in Iran's timezone)
-                                tehran_tz = gettz('Asia/Tehran')
-                                gregorian_dt = gregorian_dt.replace(tzinfo=tehran_tz)
-                                
-                                # Format as ISO string
-                                published_at = gregorian_dt.isoformat()
                                 self.logger.debug(f"Converted Persian date to Gregorian: {published_at}", extra={"article_url": url})
                             except Exception as e:
                                 self.logger.debug(f"Error converting Persian date: {e}", extra={"article_url": url})
                         else:
                             # Try to parse Gregorian date format (e.g., "02 Jan 2026 16:37:50 +0330")
                             try:
-                                from dateutil import parser as date_parser
                                 parsed_date = date_parser.parse(time_text)
                                 published_at = parsed_date.isoformat()
                                 self.logger.debug(f"Parsed Gregorian date: {published_at}", extra={"article_url": url})
@@ -680,51 +834,173 @@ class YJCWorker(BaseWorker):
             except Exception as e:
                 self.logger.debug(f"Error extracting category/published date using XPath: {e}", extra={"article_url": url})
 
+            # Priority 1: XPath //*[@id="root"]/div/div[11]
+            article_el = None
+            try:
+                xpath_result = _XP_ARTICLE_BODY(tree)
+                if xpath_result and _text_length(xpath_result[0]) > 100:
+                    article_el = xpath_result[0]
+                    self.logger.debug(f'Found article body using XPath //*[@id="root"]/div/div[11]', extra={"article_url": url})
+            except Exception as e:
+                self.logger.debug(f"Error extracting article body using XPath: {e}", extra={"article_url": url})
+            
+            # Priority 2: Try common content containers
+            if article_el is None and tree is not None:
+                for selector, selector_xpath in ARTICLE_BODY_XPATHS:
+                    try:
+                        candidates = selector_xpath(tree)
+                        # Check if it has meaningful content (at least 100 characters)
+                        if candidates and _text_length(candidates[0]) > 100:
+                            article_el = candidates[0]
+                            self.logger.debug(f"Found article body with selector: {selector}", extra={"article_url": url})
+                            break
+                    except Exception as e:
+                        self.logger.debug(f"Error with selector {selector}: {e}", extra={"article_url": url})
+                        continue
+            
+            # Try to find the main content area by looking for divs with substantial text
+            if article_el is None and tree is not None:
+                # Look for the first div after h1 with substantial text that doesn't look like navigation/menu
+                content_divs = _XP_H1_CONTENT_DIV(tree)
+                if content_divs:
+                    article_el = content_divs[0]
+                    self.logger.debug("Found article body by searching after h1", extra={"article_url": url})
+                else:
+                    # If not found, try finding parent of h1 and look for content divs
+                    h1_elements = _XP_FIRST_H1(tree)
+                    if h1_elements:
+                        parent = h1_elements[0].getparent()
+                        if parent is not None:
+                            # Look for divs with substantial text in the parent
+                            for div in parent.iterchildren('div'):
+                                if _text_length(div) > 200:
+                                    article_el = div
+                                    self.logger.debug("Found article body in parent container", extra={"article_url": url})
+                                    break
+
+            if article_el is not None:
+                # Single sweep removing scripts/styles/iframes, elements with unwanted
+                # classes, and the containers of advertisement links
+                to_remove = []
+                for el in article_el.iterdescendants():
+                    tag = el.tag
+                    if not isinstance(tag, str):
+                        # Comments and processing instructions
+                        continue
+                    if tag in UNWANTED_TAGS:
+                        to_remove.append(el)
+                        continue
+                    el_class = el.get('class')
+                    if el_class and _UNWANTED_CLASS_RE.search(el_class):
+                        to_remove.append(el)
+                        continue
+                    if tag == 'a' and _is_ad_href(el.get('href')):
+                        # Remove the entire parent element (usually figure or listitem)
+                        parent = el.getparent()
+                        to_remove.append(el if parent is article_el else parent)
+                for el in to_remove:
+                    _remove_element(el)
+                
+                # Remove sections with headings like "اخبار مرتبط", "برچسب‌ها", etc.
+                for heading in list(article_el.iter('h2', 'h3')):
+                    heading_text = ''.join(heading.itertext()).strip()
+                    if not _UNWANTED_HEADING_RE.search(heading_text):
+                        continue
+                    # Skip headings inside a section that was already removed
+                    if not any(ancestor is article_el for ancestor in heading.iterancestors()):
+                        continue
+                    # Headings directly under the article root are left in place
+                    if heading.getparent() is article_el:
+                        continue
+                    # Try to find the container div that holds this section
+                    container = next(heading.iterancestors('div'), None)
+                    if container is not None and container is not article_el:
+                        # Check if this container seems to be a section (has list or multiple elements)
+                        if (container.find('.//ul') is not None or container.find('.//ol') is not None
+                                or sum(1 for _ in container.iterdescendants('*')) > 2):
+                            _remove_element(container)
+                            continue
+                    # Otherwise, remove heading and following siblings until next heading.
+                    # Collect the range first so the tree isn't mutated while walking it.
+                    to_drop = [heading]
+                    for sibling in heading.itersiblings():
+                        if sibling.tag in HEADING_TAGS:
+                            break
+                        # Stop at a div that contains another heading
+                        if sibling.tag == 'div' and next(sibling.iter(*HEADING_TAGS), None) is not None:
+                            break
+                        to_drop.append(sibling)
+                    for el in to_drop:
+                        _remove_element(el)
+                
+                # Remove content after "انتهای پیام" (end of message marker)
+                end_markers = _XP_END_MARKER(article_el, marker=END_MARKER)
+                if end_markers:
+                    end_marker = end_markers[0]
+                    marker_parent = end_marker.getparent()
+                    if end_marker.is_tail:
+                        marker_parent = marker_parent.getparent()
+                    if marker_parent is not None:
+                        # Remove all siblings after the marker parent
+                        for sibling in list(marker_parent.itersiblings()):
+                            _remove_element(sibling)
+                        # Keep the marker parent itself but remove its content after the marker
+                        marker_text = ''.join(marker_parent.itertext())
+                        if marker_text.find(END_MARKER) > 0:
+                            # Split the text and keep only up to "انتهای پیام"
+                            for node in marker_parent.iter():
+                                if node.text and END_MARKER in node.text:
+                                    node.text = node.text.split(END_MARKER, 1)[0] + END_MARKER
+                                if node is not marker_parent and node.tail and END_MARKER in node.tail:
+                                    node.tail = node.tail.split(END_MARKER, 1)[0] + END_MARKER
+                
+                body_html = etree.tostring(article_el, encoding='unicode', method='html')
+            else:
+                self.logger.warning(f"Could not find article body content", extra={"article_url": url})
+
+            # Extract summary from meta description or first paragraph
+            summary = ""
+            meta_desc = soup.find("meta", attrs={"name": "description"})
+            if meta_desc and meta_desc.get("content"):
+                summary = meta_desc["content"]
+            elif body_html:
+                # Fallback: first paragraph
+                first_p = soup.find("p")
+                if first_p:
+                    summary = first_p.get_text(strip=True)[:500]
+
             # Extract image
             image_url = ""
             
             # Priority 1: og:image
-            og_image = soup.find("meta", attrs={"property": "og:image"})
-            if og_image and og_image.get("content"):
-                image_url = og_image["content"]
+            og_images = _XP_OG_IMAGE(tree) if tree is not None else []
+            if og_images and og_images[0]:
+                image_url = str(og_images[0])
                 self.logger.debug(f"Found image from og:image: {image_url}", extra={"article_url": url})
             
             # Priority 2: Image within article > figure > img (first figure, not ads)
-            if not image_url:
-                article_elem = soup.find("article")
-                if article_elem:
-                    # Find all figures, but skip those with ad links
-                    figures = article_elem.find_all("figure")
-                    for figure_tag in figures:
-                        # Skip if this figure contains an ad link
-                        ad_link = figure_tag.find("a", href=lambda x: x and ("/redirect/ads/" in x or "/ads/" in x))
-                        if ad_link:
-                            continue
-                        
-                        img_tag = figure_tag.find("img")
-                        if img_tag:
-                            for attr in ["src", "data-src", "data-lazy-src", "data-original"]:
-                                if img_tag.get(attr):
-                                    image_url = img_tag[attr]
-                                    self.logger.debug(f"Found image from article figure: {image_url}", extra={"article_url": url})
-                                    break
-                        if image_url:
-                            break
+            if not image_url and tree is not None:
+                figure_images = _XP_FIGURE_IMAGE(tree)
+                if figure_images:
+                    img_el = figure_images[0]
+                    image_url = next(img_el.get(attr) for attr in _IMG_SRC_ATTRS if img_el.get(attr))
+                    self.logger.debug(f"Found image from article figure: {image_url}", extra={"article_url": url})
             
             # Priority 3: First image in article content (not in ad links)
-            if not image_url and article_tag:
-                all_imgs = article_tag.find_all("img")
-                for img_tag in all_imgs:
+            if not image_url and article_el is not None:
+                # Images inside ad links, collected in one pass
+                ad_images = set(_XP_AD_LINK_IMAGES(article_el))
+                for img_el in article_el.iter("img"):
                     # Skip if image is inside an ad link
-                    parent_link = img_tag.find_parent("a", href=lambda x: x and ("/redirect/ads/" in x or "/ads/" in x))
-                    if parent_link:
+                    if img_el in ad_images:
                         continue
                     
-                    for attr in ["src", "data-src", "data-lazy-src", "data-original"]:
-                        if img_tag.get(attr):
-                            src = img_tag[attr]
+                    for attr in _IMG_SRC_ATTRS:
+                        if img_el.get(attr):
+                            src = img_el.get(attr)
                             # Skip if it's a logo or barcode
-                            if "logo" in src.lower() or "barcode" in src.lower():
+                            src_lower = src.lower()
+                            if any(hint in src_lower for hint in _SKIP_IMAGE_HINTS):
                                 continue
                             image_url = src
                             self.logger.debug(f"Found image from article content: {image_url}", extra={"article_url": url})
@@ -733,18 +1009,13 @@ class YJCWorker(BaseWorker):
                         break
             
             # Priority 4: Any large image on the page from CDN (not ads)
-            if not image_url:
-                all_images = soup.find_all("img")
-                for img in all_images:
-                    # Skip if image is inside an ad link
-                    parent_link = img.find_parent("a", href=lambda x: x and ("/redirect/ads/" in x or "/ads/" in x))
-                    if parent_link:
-                        continue
-                    
-                    src = img.get("src") or img.get("data-src") or img.get("data-lazy-src") or img.get("data-original")
+            if not image_url and tree is not None:
+                for img in _XP_NON_AD_IMAGES(tree):
+                    src = next((img.get(attr) for attr in _IMG_SRC_ATTRS if img.get(attr)), None)
                     if src and "cdn.yjc.ir" in src:
                         # Skip logos and barcodes
-                        if "logo" in src.lower() or "barcode" in src.lower():
+                        src_lower = src.lower()
+                        if any(hint in src_lower for hint in _SKIP_IMAGE_HINTS):
                             continue
                         # Check if it's a reasonable size (not an icon)
                         width = img.get("width")
@@ -769,10 +1040,7 @@ class YJCWorker(BaseWorker):
             
             # Remove query string from image URL to avoid issues with presigned URLs
             # The query string (like ?ts=...) is not needed for downloading
-            if image_url:
-                parsed_img = urlparse(image_url)
-                # Reconstruct URL without query string and fragment
-                image_url = urlunparse((parsed_img.scheme, parsed_img.netloc, parsed_img.path, '', '', ''))
+            image_url = image_url.split('?', 1)[0].split('#', 1)[0]
 
             return {
                 "title": title,
@@ -790,7 +1058,7 @@ class YJCWorker(BaseWorker):
             )
             return None
 
-    async def _download_image(self, image_url: str) -> Optional[bytes]:
+    async def _download_image(self, image_url: str) -> Optional[Tuple[bytes, str, str]]:
         """
         Download image from URL.
 
@@ -798,7 +1066,8 @@ class YJCWorker(BaseWorker):
             image_url: Image URL
 
         Returns:
-            Image data as bytes, or None if download failed
+            (image data, file extension, content type) tuple, or None if
+            download failed or the data is not a supported image
         """
         if not image_url:
             return None
@@ -807,12 +1076,9 @@ class YJCWorker(BaseWorker):
             content = await self._fetch_with_retry(image_url, request_type="image")
             if content:
                 # Validate image content
-                if (content.startswith(b'\xff\xd8') or  # JPEG
-                    content.startswith(b'\x89PNG') or  # PNG
-                    content.startswith(b'GIF8') or     # GIF
-                    content.startswith(b'GIF9') or     # GIF
-                    content.startswith(b'RIFF') and len(content) > 12 and content[8:12] == b'WEBP'):  # WebP
-                    return content
+                image_format = _sniff_image(content)
+                if image_format:
+                    return (content, *image_format)
                 else:
                     self.logger.warning(f"Invalid image format for {image_url}", extra={"article_url": image_url})
             return None
@@ -821,7 +1087,13 @@ class YJCWorker(BaseWorker):
             return None
 
     async def _upload_image_to_s3(
-        self, image_data: bytes, source: str, url: str
+        self,
+        image_data: bytes,
+        source: str,
+        url: str,
+        ext: str,
+        content_type: str,
+        when: Optional[datetime] = None,
     ) -> Optional[str]:
         """
         Upload image to S3.
@@ -830,68 +1102,45 @@ class YJCWorker(BaseWorker):
             image_data: Image data as bytes
             source: News source name
             url: Article URL (for generating unique filename)
+            ext: File extension detected by _download_image
+            content_type: Content type detected by _download_image
+            when: Date used for the key's yyyy/mm/dd prefix (default: now)
 
         Returns:
             S3 key (path) if successful, None otherwise
         """
         try:
             # Generate S3 path: news-images/{source}/{yyyy}/{mm}/{dd}/{filename}
-            now = datetime.now()
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-            
-            # Determine file extension from image data
-            if image_data.startswith(b'\xff\xd8'):
-                ext = '.jpg'
-            elif image_data.startswith(b'\x89PNG'):
-                ext = '.png'
-            elif image_data.startswith(b'GIF8') or image_data.startswith(b'GIF9'):
-                ext = '.gif'
-            elif image_data.startswith(b'RIFF') and len(image_data) > 12 and image_data[8:12] == b'WEBP':
-                ext = '.webp'
-            else:
-                ext = '.jpg'  # Default to jpg
+            when = when or datetime.now()
+            url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
             
-            s3_key = f"news-images/{source}/{now.year}/{now.month:02d}/{now.day:02d}/{url_hash}{ext}"
+            s3_key = f"news-images/{source}/{when.year}/{when.month:02d}/{when.day:02d}/{url_hash}{ext}"
             
             # Initialize S3 if not already done
             if not self._s3_initialized:
                 await init_s3()
                 self._s3_initialized = True
             
-            # Upload to S3
-            s3_session = get_s3_session()
-            endpoint_uses_https = settings.s3_endpoint.startswith("https://")
-            
-            from botocore.config import Config
-            boto_config = Config(
-                connect_timeout=60,
-                read_timeout=60,
-                retries={'max_attempts': 3}
+            # Upload to S3 with the shared long-lived client
+            s3_client = await get_s3_client()
+            await s3_client.put_object(
+                Bucket=settings.s3_bucket,
+                Key=s3_key,
+                Body=image_data,
+                ContentType=content_type,
+                ContentLength=len(image_data),
             )
             
-            client_kwargs = {
-                "endpoint_url": settings.s3_endpoint,
-                "aws_access_key_id": settings.s3_access_key,
-                "aws_secret_access_key": settings.s3_secret_key,
-                "region_name": settings.s3_region,
-                "use_ssl": settings.s3_use_ssl,
-                "config": boto_config,
-            }
-            
-            if endpoint_uses_https:
-                client_kwargs["verify"] = settings.s3_verify_ssl
-            
-            async with s3_session.client('s3', **client_kwargs) as s3_client:
-                await s3_client.upload_fileobj(
-                    BytesIO(image_data),
-                    settings.s3_bucket,
-                    s3_key,
-                    ExtraArgs={"ContentType": f"image/{ext[1:]}" if ext != '.webp' else "image/webp"}
+            # Generate presigned URL with the same client; the key needs no parsing
+            try:
+                presigned_url = await s3_client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": settings.s3_bucket, "Key": s3_key},
+                    ExpiresIn=3600,
                 )
-            
-            # Generate presigned URL
-            from app.storage.s3 import generate_presigned_url
-            presigned_url = await generate_presigned_url(s3_key)
+            except Exception as e:
+                self.logger.warning(f"Error generating presigned URL for {s3_key}: {e}", extra={"article_url": url})
+                presigned_url = None
             
             if presigned_url:
                 self.logger.info(f"Successfully uploaded image to S3: {s3_key}", extra={"article_url": url})
@@ -905,70 +1154,187 @@ class YJCWorker(BaseWorker):
             self.logger.error(f"Error uploading image to S3: {e}", extra={"article_url": url}, exc_info=True)
             return None
 
-    async def _save_article(
+    def _build_article_row(
         self, rss_item: dict, article_content: dict, s3_image_url: str
-    ) -> None:
+    ) -> dict:
         """
-        Save article to database.
+        Build a News row for bulk insertion.
 
         Args:
             rss_item: RSS feed item data
             article_content: Extracted article content
             s3_image_url: S3 URL for the image
+
+        Returns:
+            Mapping of News column names to values
         """
-        async with AsyncSessionLocal() as db:
-            try:
-                # Check if URL already exists (with source filter)
-                # Logging is handled inside _check_url_exists
-                if await self._check_url_exists(rss_item["link"], db):
-                    return
+        # Get raw category
+        raw_category = article_content.get("category") or rss_item.get("category", "")
+        
+        # Normalize category
+        normalized_category, preserved_raw_category = normalize_category("yjc", raw_category)
+        
+        # Use published_at from article_content (extracted from page) if available,
+        # otherwise fall back to rss_item pubDate
+        published_at = article_content.get("published_at") or rss_item.get("pubDate", "")
+        
+        return {
+            "source": "yjc",
+            "title": article_content.get("title") or rss_item["title"],
+            "body_html": article_content.get("body_html", ""),
+            "summary": article_content.get("summary") or rss_item.get("description", ""),
+            "url": _normalize_url(rss_item["link"]),  # Store normalized URL
+            "published_at": published_at,
+            "image_url": s3_image_url,
+            "category": normalized_category,  # Store normalized category
+            "raw_category": preserved_raw_category,  # Store original category
+            "language": "fa",  # Persian language
+        }
 
-                # Get raw category
-                raw_category = article_content.get("category") or rss_item.get("category", "")
-                
-                # Normalize category
-                normalized_category, preserved_raw_category = normalize_category("yjc", raw_category)
-                
-                # Create news article
-                # Use published_at from article_content (extracted from page) if available,
-                # otherwise fall back to rss_item pubDate
-                published_at = article_content.get("published_at") or rss_item.get("pubDate", "")
-                
-                # Normalize URL for storage (remove trailing slash and query parameters)
-                normalized_url = rss_item["link"].rstrip('/').split('?')[0].split('#')[0]
-                
-                news = News(
-                    source="yjc",
-                    title=article_content.get("title") or rss_item["title"],
-                    body_html=article_content.get("body_html", ""),
-                    summary=article_content.get("summary") or rss_item.get("description", ""),
-                    url=normalized_url,  # Store normalized URL
-                    published_at=published_at,
-                    image_url=s3_image_url,
-                    category=normalized_category,  # Store normalized category
-                    raw_category=preserved_raw_category,  # Store original category
-                    language="fa",  # Persian language
+    async def _prepare_article(
+        self, idx: int, total: int, rss_item: dict
+    ) -> Optional[Tuple[dict, Optional[Tuple[bytes, str, str]]]]:
+        """
+        Fetch an RSS item's article page and main image.
+
+        Args:
+            idx: 1-based position of the item in the feed (for logging)
+            total: Total number of items in the feed (for logging)
+            rss_item: RSS feed item data
+
+        Returns:
+            (article content, downloaded image or None) tuple, or None if
+            the item was skipped
+        """
+        if not self.running:
+            return None
+
+        self.logger.info(
+            f"Processing article {idx}/{total}: {rss_item['title'][:50]}...",
+            extra={"article_url": rss_item["link"]}
+        )
+
+        # Quick check if URL already exists before extracting content;
+        # the database is only queried for URLs not seen in this run
+        if _normalize_url(rss_item["link"]) in self._seen_urls:
+            self.logger.debug(
+                f"Skipping article (already stored): {rss_item['title'][:50]}...",
+                extra={"article_url": rss_item["link"]}
+            )
+            return None
+        async with AsyncSessionLocal() as quick_db:
+            if await self._check_url_exists(rss_item["link"], quick_db):
+                self.logger.debug(
+                    f"Skipping article (already exists): {rss_item['title'][:50]}...",
+                    extra={"article_url": rss_item["link"]}
                 )
+                return None
 
-                db.add(news)
-                await db.commit()
-                
+        # Extract article content
+        article_content = await self._extract_article_content(rss_item["link"])
+        if not article_content:
+            self.logger.warning(
+                f"Failed to extract content for article: {rss_item['link']}",
+                extra={"article_url": rss_item["link"]}
+            )
+            return None
+
+        # Download image if available
+        # Priority: article_content (from HTML) > RSS enclosure > RSS image_url
+        image = None
+        image_url = article_content.get("image_url") or rss_item.get("image_url", "")
+        if not image_url and rss_item.get("image_url"):
+            # Try RSS image_url as fallback
+            image_url = rss_item.get("image_url")
+        if image_url:
+            self.logger.debug(
+                f"Processing main image for article: {image_url}",
+                extra={"article_url": rss_item["link"]}
+            )
+            image = await self._download_image(image_url)
+
+        return article_content, image
+
+    async def _process_article(
+        self,
+        idx: int,
+        total: int,
+        rss_item: dict,
+        slots: asyncio.Semaphore,
+        when: Optional[datetime] = None,
+    ) -> Optional[dict]:
+        """
+        Fetch and enrich a single RSS item.
+
+        The page fetch and image download hold one of ``slots``; the S3
+        upload runs after the slot is released so it overlaps with the
+        next article's downloads.
+
+        Args:
+            idx: 1-based position of the item in the feed (for logging)
+            total: Total number of items in the feed (for logging)
+            rss_item: RSS feed item data
+            slots: Semaphore bounding concurrently fetched articles
+            when: Feed run date used for the image's S3 key
+
+        Returns:
+            News row ready for insertion, or None if the item was skipped
+        """
+        async with slots:
+            prepared = await self._prepare_article(idx, total, rss_item)
+        if prepared is None:
+            return None
+        article_content, image = prepared
+
+        # Upload image to S3
+        s3_image_url = ""
+        if image:
+            image_data, ext, content_type = image
+            self.logger.debug(
+                f"Downloaded main image ({len(image_data)} bytes), uploading to S3...",
+                extra={"article_url": rss_item["link"]}
+            )
+            s3_image_url = await self._upload_image_to_s3(
+                image_data, self.source_name, rss_item["link"], ext, content_type, when
+            )
+            if s3_image_url:
                 self.logger.info(
-                    f"Successfully saved article: {news.title[:50]}...",
+                    f"Successfully uploaded main image to S3: {s3_image_url}",
                     extra={"article_url": rss_item["link"]}
                 )
-            except Exception as e:
-                self.logger.error(
-                    f"Error saving article to database: {e}",
-                    extra={"article_url": rss_item["link"]},
-                    exc_info=True
-                )
-                await db.rollback()
-                raise
+
+        self.logger.info(
+            f"Successfully processed article: {rss_item['title'][:50]}...",
+            extra={"article_url": rss_item["link"]}
+        )
+        return self._build_article_row(rss_item, article_content, s3_image_url or "")
+
+    async def _save_rows(self, rows: dict[str, dict]) -> int:
+        """
+        Save processed articles in one round-trip.
+
+        Existing URLs are skipped by the database.
+
+        Args:
+            rows: News rows keyed by normalized URL
+
+        Returns:
+            Number of rows inserted
+        """
+        inserted = await NewsRepository.bulk_insert_ignore_duplicates(list(rows.values()))
+        self._seen_urls.update(rows)
+        return inserted
 
     async def fetch_news(self) -> None:
         """
         Fetch news from YJC RSS feed.
+
+        Articles are fetched concurrently, bounded by
+        ``settings.article_concurrency``; image uploads overlap with
+        later fetches. Per-request politeness is still enforced by the
+        rate limiter inside ``_fetch_with_retry``. Processed articles are
+        saved every ``SAVE_BATCH_SIZE`` rows as they complete, and the rest
+        when the cycle ends or is cancelled, so finished work is kept.
         """
         if not self.running:
             return
@@ -981,83 +1347,61 @@ class YJCWorker(BaseWorker):
                 self.logger.warning("No items found in RSS feed")
                 return
 
-            self.logger.info(f"Processing {len(rss_items)} articles from RSS feed")
+            total = len(rss_items)
+            self.logger.info(f"Processing {total} articles from RSS feed")
 
-            # Process each article
-            for idx, rss_item in enumerate(rss_items, 1):
-                if not self.running:
-                    self.logger.info("Worker stopped, cancelling fetch operation")
-                    break
+            slots = asyncio.Semaphore(settings.article_concurrency or 16)
+            # One date for every image key in this run
+            today = datetime.now()
 
-                self.logger.info(
-                    f"Processing article {idx}/{len(rss_items)}: {rss_item['title'][:50]}...",
-                    extra={"article_url": rss_item["link"]}
-                )
+            async def _run(idx: int, rss_item: dict) -> tuple[dict, object]:
+                try:
+                    return rss_item, await self._process_article(idx, total, rss_item, slots, today)
+                except Exception as e:
+                    return rss_item, e
 
-                # Quick check if URL already exists before extracting content
-                async with AsyncSessionLocal() as quick_db:
-                    if await self._check_url_exists(rss_item["link"], quick_db):
-                        self.logger.debug(
-                            f"Skipping article (already exists): {rss_item['title'][:50]}...",
-                            extra={"article_url": rss_item["link"]}
+            tasks = [
+                asyncio.create_task(_run(idx, rss_item))
+                for idx, rss_item in enumerate(rss_items, 1)
+            ]
+            rows: dict[str, dict] = {}
+            inserted = processed = 0
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    rss_item, result = await next_done
+                    if isinstance(result, Exception):
+                        self.logger.error(
+                            f"Error processing article: {result}",
+                            extra={"article_url": rss_item["link"]},
+                            exc_info=result
                         )
-                        continue
+                    elif result:
+                        rows.setdefault(result["url"], result)
 
-                # Extract article content
-                article_content = await self._extract_article_content(rss_item["link"])
-                if not article_content:
-                    self.logger.warning(
-                        f"Failed to extract content for article: {rss_item['link']}",
-                        extra={"article_url": rss_item["link"]}
-                    )
-                    continue
-
-                # Download and upload image if available
-                # Priority: article_content (from HTML) > RSS enclosure > RSS image_url
-                s3_image_url = ""
-                image_url = article_content.get("image_url") or rss_item.get("image_url", "")
-                if not image_url and rss_item.get("image_url"):
-                    # Try RSS image_url as fallback
-                    image_url = rss_item.get("image_url")
-                if image_url:
-                    self.logger.debug(
-                        f"Processing main image for article: {image_url}",
-                        extra={"article_url": rss_item["link"]}
-                    )
-                    image_data = await self._download_image(image_url)
-                    if image_data:
-                        self.logger.debug(
-                            f"Downloaded main image ({len(image_data)} bytes), uploading to S3...",
-                            extra={"article_url": rss_item["link"]}
-                        )
-                        s3_image_url = await self._upload_image_to_s3(
-                            image_data, self.source_name, rss_item["link"]
-                        )
-                        if s3_image_url:
-                            self.logger.info(
-                                f"Successfully uploaded main image to S3: {s3_image_url}",
-                                extra={"article_url": rss_item["link"]}
-                            )
+                    if len(rows) >= SAVE_BATCH_SIZE:
+                        processed += len(rows)
+                        inserted += await self._save_rows(rows)
+                        rows = {}
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Await every task before saving, so none is left pending if the save fails
+                outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+                # Articles that finished but were not consumed before a cancellation
+                for outcome in outcomes:
+                    if isinstance(outcome, tuple) and isinstance(outcome[1], dict):
+                        url = outcome[1]["url"]
+                        if url not in self._seen_urls:
+                            rows.setdefault(url, outcome[1])
+                # Keep the articles finished so far even if the cycle was cancelled
+                if rows:
+                    processed += len(rows)
+                    inserted += await self._save_rows(rows)
+                if processed:
+                    self.logger.info(f"Saved {inserted} new articles ({processed} processed)")
 
-                # Save article to database
-                try:
-                    await self._save_article(rss_item, article_content, s3_image_url)
-                    self.logger.info(
-                        f"Successfully processed article: {rss_item['title'][:50]}...",
-                        extra={"article_url": rss_item["link"]}
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        f"Error saving article: {e}",
-                        extra={"article_url": rss_item["link"]},
-                        exc_info=True
-                    )
-
-                # Small delay between articles to avoid overwhelming the server
-                await asyncio.sleep(0.5)
-                
-                # Yield control to allow cancellation
-                await asyncio.sleep(0)
+            if not self.running:
+                self.logger.info("Worker stopped, cancelling fetch operation")
 
         except Exception as e:
             self.logger.error(f"Error in fetch_news: {e}", exc_info=True)
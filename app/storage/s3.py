@@ -1,6 +1,7 @@
 """S3-compatible storage client wrapper."""
 
-from typing import Optional
+import asyncio
+from typing import Any, Optional
 
 import aioboto3
 from botocore.config import Config
@@ -14,6 +15,42 @@ logger = setup_logging()
 # Global session
 _session: Optional[aioboto3.Session] = None
 
+# Long-lived client shared by uploads and presigning (see get_s3_client)
+_client_cm: Optional[Any] = None
+_client: Optional[Any] = None
+_client_lock = asyncio.Lock()
+
+
+# Client settings depend only on configuration, so they are built once at import
+_BOTO_CONFIG = Config(
+    connect_timeout=60,
+    read_timeout=60,
+    retries={'max_attempts': 3}
+)
+
+_CLIENT_KWARGS = {
+    "endpoint_url": settings.s3_endpoint,
+    "aws_access_key_id": settings.s3_access_key,
+    "aws_secret_access_key": settings.s3_secret_key,
+    "region_name": settings.s3_region,
+    "use_ssl": settings.s3_use_ssl,
+    "config": _BOTO_CONFIG,
+}
+
+# Set verify parameter for SSL verification control
+if settings.s3_endpoint.startswith("https://"):
+    _CLIENT_KWARGS["verify"] = settings.s3_verify_ssl
+
+
+def get_s3_client_kwargs() -> dict:
+    """
+    Get keyword arguments for creating an S3 client.
+
+    Returns:
+        Keyword arguments for ``Session.client("s3", ...)`` (shared, do not modify)
+    """
+    return _CLIENT_KWARGS
+
 
 async def init_s3() -> None:
     """Initialize S3 client and test connection."""
@@ -21,58 +58,31 @@ async def init_s3() -> None:
 
     _session = aioboto3.Session()
 
-    # Test connection using async context manager
+    # Test connection with the shared client
     try:
-        # Prepare botocore config for SSL verification
-        endpoint_uses_https = settings.s3_endpoint.startswith("https://")
-        if endpoint_uses_https and not settings.s3_verify_ssl:
-            # Disable SSL verification using Config
-            boto_config = Config(
-                connect_timeout=60,
-                read_timeout=60,
-                retries={'max_attempts': 3}
-            )
+        if settings.s3_endpoint.startswith("https://") and not settings.s3_verify_ssl:
             logger.warning("SSL certificate verification is disabled for S3 connection")
             logger.warning(f"Connecting to: {settings.s3_endpoint}")
-        else:
-            boto_config = Config(
-                connect_timeout=60,
-                read_timeout=60,
-                retries={'max_attempts': 3}
-            )
-        
-        # Prepare client config
-        client_kwargs = {
-            "endpoint_url": settings.s3_endpoint,
-            "aws_access_key_id": settings.s3_access_key,
-            "aws_secret_access_key": settings.s3_secret_key,
-            "region_name": settings.s3_region,
-            "use_ssl": settings.s3_use_ssl,
-            "config": boto_config,
-        }
-        
-        # Set verify parameter for SSL verification control
-        if endpoint_uses_https:
-            client_kwargs["verify"] = settings.s3_verify_ssl
-        
-        async with _session.client("s3", **client_kwargs) as s3_client:
-            # Test connection
-            try:
-                await s3_client.head_bucket(Bucket=settings.s3_bucket)
-                logger.info(f"S3 connection successful to bucket: {settings.s3_bucket}")
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "Unknown")
-                if error_code == "404":
-                    # Bucket doesn't exist, try to create it
-                    try:
-                        await s3_client.create_bucket(Bucket=settings.s3_bucket)
-                        logger.info(f"Created S3 bucket: {settings.s3_bucket}")
-                    except ClientError as create_error:
-                        logger.error(f"Failed to create S3 bucket: {create_error}")
-                        raise
-                else:
-                    logger.error(f"S3 connection test failed: {e}")
+
+        s3_client = await get_s3_client()
+
+        # Test connection
+        try:
+            await s3_client.head_bucket(Bucket=settings.s3_bucket)
+            logger.info(f"S3 connection successful to bucket: {settings.s3_bucket}")
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code == "404":
+                # Bucket doesn't exist, try to create it
+                try:
+                    await s3_client.create_bucket(Bucket=settings.s3_bucket)
+                    logger.info(f"Created S3 bucket: {settings.s3_bucket}")
+                except ClientError as create_error:
+                    logger.error(f"Failed to create S3 bucket: {create_error}")
                     raise
+            else:
+                logger.error(f"S3 connection test failed: {e}")
+                raise
     except Exception as e:
         logger.error(f"Unexpected error testing S3 connection: {e}")
         raise
@@ -80,7 +90,13 @@ async def init_s3() -> None:
 
 async def close_s3() -> None:
     """Close S3 client connections."""
-    global _session
+    global _session, _client_cm, _client
+
+    if _client_cm is not None:
+        client_cm = _client_cm
+        _client_cm = None
+        _client = None
+        await client_cm.__aexit__(None, None, None)
 
     if _session:
         _session = None
@@ -88,6 +104,34 @@ async def close_s3() -> None:
     logger.info("S3 connections closed")
 
 
+async def get_s3_client() -> Any:
+    """
+    Get the shared S3 client, creating it on first use.
+
+    The client (and its connection pool) stays open until ``close_s3()``,
+    so uploads and presigned URLs don't pay for client setup and a new
+    TLS handshake each time.
+
+    Returns:
+        S3 client instance
+
+    Raises:
+        RuntimeError: If S3 session is not initialized
+    """
+    global _client_cm, _client
+
+    if _client is not None:
+        return _client
+
+    session = get_s3_session()
+    async with _client_lock:
+        if _client is None:
+            client_cm = session.client("s3", **_CLIENT_KWARGS)
+            _client = await client_cm.__aenter__()
+            _client_cm = client_cm
+    return _client
+
+
 def get_s3_session() -> aioboto3.Session:
     """
     Get the S3 session instance.
@@ -155,33 +199,13 @@ async def generate_presigned_url(s3_path: str, expiration: int = 3600) -> Option
             # Assume it's already an S3 key
             key = s3_path
 
-        endpoint_uses_https = settings.s3_endpoint.startswith("https://")
-        
-        from botocore.config import Config
-        boto_config = Config(
-            connect_timeout=60,
-            read_timeout=60,
-            retries={'max_attempts': 3}
+        s3_client = await get_s3_client()
+        presigned_url = await s3_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=expiration
         )
-        
-        client_kwargs = {
-            "endpoint_url": settings.s3_endpoint,
-            "aws_access_key_id": settings.s3_access_key,
-            "aws_secret_access_key": settings.s3_secret_key,
-            "region_name": settings.s3_region,
-            "use_ssl": settings.s3_use_ssl,
-            "config": boto_config,
-        }
-        if endpoint_uses_https:
-            client_kwargs["verify"] = settings.s3_verify_ssl
-
-        async with _session.client("s3", **client_kwargs) as s3_client:
-            presigned_url = await s3_client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": bucket, "Key": key},
-                ExpiresIn=expiration
-            )
-            return presigned_url
+        return presigned_url
 
     except Exception as e:
         logger.error(f"Error generating presigned URL for {s3_path}: {e}", exc_info=True)
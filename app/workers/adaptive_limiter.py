@@ -0,0 +1,137 @@
+"""Latency-based adaptive concurrency limiter for worker HTTP requests."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+
+class LimiterRequest:
+    """Handle for one request held by ``AdaptiveConcurrencyLimiter.use``."""
+
+    __slots__ = ("failed",)
+
+    def __init__(self):
+        """Initialize request handle."""
+        self.failed = False
+
+    def mark_failed(self) -> None:
+        """Count the request as failed even though no exception was raised."""
+        self.failed = True
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limiter that adapts to observed request latency.
+
+    Implements a TCP Vegas style rule: the fastest latency seen so far is
+    treated as the no-load latency of the origin. After every request the
+    limiter estimates how many requests are queueing at the server
+    (``limit * (1 - min_rtt / rtt)``). The limit grows while that estimate
+    stays below ``alpha`` and shrinks once it exceeds ``beta``. Failed
+    requests halve the limit; callers can also mark a request as failed
+    without raising (e.g. on HTTP 429/5xx).
+
+    This only bounds concurrency; the per-source ``RateLimiter`` still
+    enforces the politeness ceiling.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        alpha: float = 3.0,
+        beta: float = 6.0,
+    ):
+        """
+        Initialize adaptive limiter.
+
+        Args:
+            initial_limit: Concurrency limit to start with
+            min_limit: Lowest concurrency limit
+            max_limit: Highest concurrency limit
+            alpha: Queue estimate below which the limit is increased
+            beta: Queue estimate above which the limit is decreased
+        """
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.limit = min(max(initial_limit, min_limit), self.max_limit)
+        self.alpha = alpha
+        self.beta = beta
+
+        self._in_flight = 0
+        self._min_rtt: Optional[float] = None
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def use(self) -> AsyncIterator[LimiterRequest]:
+        """
+        Hold a concurrency slot for the duration of a request.
+
+        The time spent inside the block is recorded as the request latency.
+        An exception raised inside the block, or calling ``mark_failed`` on
+        the yielded handle, counts as a failed request; cancellation is not
+        recorded.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        start = time.perf_counter()
+        request = LimiterRequest()
+        outcome = None
+        try:
+            yield request
+            outcome = "failure" if request.failed else "success"
+        except asyncio.CancelledError:
+            # Cancelled requests say nothing about the origin's latency
+            raise
+        except Exception:
+            outcome = "failure"
+            raise
+        finally:
+            rtt = time.perf_counter() - start
+            async with self._condition:
+                self._in_flight -= 1
+                if outcome == "success":
+                    self._on_sample(rtt)
+                elif outcome == "failure":
+                    self._on_failure()
+                self._condition.notify_all()
+
+    def _on_sample(self, rtt: float) -> None:
+        """
+        Update the limit from a successful request latency.
+
+        Args:
+            rtt: Request latency in seconds
+        """
+        if rtt <= 0:
+            return
+        if self._min_rtt is None or rtt < self._min_rtt:
+            self._min_rtt = rtt
+
+        queue = self.limit * (1 - self._min_rtt / rtt)
+        if queue < self.alpha:
+            self.limit = min(self.limit + 1, self.max_limit)
+        elif queue > self.beta:
+            self.limit = max(self.limit - 1, self.min_limit)
+
+    def _on_failure(self) -> None:
+        """Back off after a failed request."""
+        self.limit = max(self.limit // 2, self.min_limit)
+
+    def get_stats(self) -> dict:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary with limiter stats
+        """
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "min_rtt": self._min_rtt,
+        }
+
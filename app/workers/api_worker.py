@@ -2,10 +2,13 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 import aiohttp
+import orjson
+from yarl import URL
 
 from app.workers.base_worker import BaseWorker
+from app.workers.http_session import get_http_session
 from app.workers.rate_limiter import RateLimiter
 from app.core.config import settings
 
@@ -25,7 +28,9 @@ class APIWorker(BaseWorker, ABC):
             source_name: Name of the news source
         """
         super().__init__(source_name)
-        self.api_base_url: str = ""
+        self.api_base_url = ""
+        # Request headers shared by calls without custom headers (see _get_base_headers)
+        self._base_headers: Optional[Dict[str, str]] = None
         self.auth_token: Optional[str] = None
         self.http_session: Optional[aiohttp.ClientSession] = None
         
@@ -35,20 +40,72 @@ class APIWorker(BaseWorker, ABC):
             delay_between_requests=settings.delay_between_requests,
         )
 
+    @property
+    def api_base_url(self) -> str:
+        """Base URL that API endpoints are appended to."""
+        return self._api_base_url
+
+    @api_base_url.setter
+    def api_base_url(self, value: str) -> None:
+        self._api_base_url = value
+        # Parsed once so request URLs don't have to be re-parsed by aiohttp
+        self._base_url: Optional[URL] = URL(value) if value else None
+
+    def _build_url(self, endpoint: str) -> Union[URL, str]:
+        """
+        Build the request URL for an endpoint.
+        
+        Args:
+            endpoint: API endpoint (appended to base_url)
+            
+        Returns:
+            Request URL
+        """
+        # yarl would re-quote these, so build them as strings as before
+        if self._base_url is None or endpoint.startswith("/") or any(c in endpoint for c in "%?#"):
+            return f"{self.api_base_url}/{endpoint}"
+        return self._base_url / endpoint
+
+    @property
+    def auth_token(self) -> Optional[str]:
+        """Bearer token sent with API requests."""
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, value: Optional[str]) -> None:
+        self._auth_token = value
+        # Authorization header value, formatted once per token
+        self._auth_header: Optional[str] = f"Bearer {value}" if value else None
+        # Headers embed the token, so rebuild them on next use
+        self._base_headers = None
+
+    def _get_base_headers(self) -> Dict[str, str]:
+        """
+        Get the default request headers, built once per auth token.
+        
+        Returns:
+            Headers dictionary (shared, do not modify)
+        """
+        if self._base_headers is None:
+            base_headers = {
+                "Accept": "application/json",
+            }
+            
+            # Add authentication if available
+            if self._auth_header:
+                base_headers["Authorization"] = self._auth_header
+            
+            self._base_headers = base_headers
+        return self._base_headers
+
     async def _get_http_session(self) -> aiohttp.ClientSession:
         """
-        Get or create HTTP session with common headers.
+        Get the shared HTTP session with common headers.
         
         Returns:
-            Configured aiohttp.ClientSession
-        """
-        if self.http_session is None or self.http_session.closed:
-            self.http_session = aiohttp.ClientSession(
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "application/json",
-                }
-            )
+            Process-wide aiohttp.ClientSession (see app.workers.http_session)
+        """
+        self.http_session = await get_http_session()
         return self.http_session
 
     async def _authenticate(self) -> bool:
@@ -71,16 +128,17 @@ class APIWorker(BaseWorker, ABC):
         Returns:
             Error information dictionary or None
         """
+        body = await response.read()
         try:
-            error_data = await response.json()
+            error_data = orjson.loads(body)
             return {
                 "status": response.status,
                 "error": error_data
             }
-        except Exception:
+        except orjson.JSONDecodeError:
             return {
                 "status": response.status,
-                "error": await response.text()
+                "error": body.decode(response.charset or "utf-8", errors="replace")
             }
 
     async def _make_api_request(
@@ -115,21 +173,15 @@ class APIWorker(BaseWorker, ABC):
             )
             
             session = await self._get_http_session()
-            url = f"{self.api_base_url}/{endpoint}"
-            
-            # Prepare headers
-            request_headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-            
-            # Add authentication if available
-            if self.auth_token:
-                request_headers["Authorization"] = f"Bearer {self.auth_token}"
+            url = self._build_url(endpoint)
             
-            # Merge with custom headers
+            # Prepare headers; only copy the cached defaults when merging custom headers
+            request_headers = self._get_base_headers()
+            if json is not None or data is not None:
+                # Body-less requests (GETs) go out without a Content-Type
+                request_headers = {**request_headers, "Content-Type": "application/json"}
             if headers:
-                request_headers.update(headers)
+                request_headers = {**request_headers, **headers}
             
             # Make the request
             async with session.request(
@@ -140,9 +192,10 @@ class APIWorker(BaseWorker, ABC):
                 json=json,
                 headers=request_headers
             ) as response:
-                
+            
                 if response.status == 200:
-                    return await response.json()
+                    # orjson decodes large (Persian UTF-8) payloads much faster than json
+                    return orjson.loads(await response.read())
                 else:
                     error_info = await self._handle_api_error(response)
                     self.logger.error(
@@ -154,7 +207,7 @@ class APIWorker(BaseWorker, ABC):
                         }
                     )
                     return None
-                    
+                
         except Exception as e:
             self.logger.error(
                 f"Error making API request: {e}",
@@ -168,7 +221,9 @@ class APIWorker(BaseWorker, ABC):
 
     async def close(self) -> None:
         """
-        Close HTTP session and perform cleanup.
+        Release this worker's reference to the shared HTTP session.
+
+        The session and its connection pool are shared by every worker in the
+        process, so they are closed by close_http_session on shutdown, not here.
         """
-        if self.http_session and not self.http_session.closed:
-            await self.http_session.close()
+        self.http_session = None
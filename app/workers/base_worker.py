@@ -1,17 +1,18 @@
 """Base worker class for news sources."""
 
 import asyncio
+import logging
 import platform
 import signal
 import time
-from typing import Optional
-from datetime import timedelta
+from typing import Coroutine, Optional, Set
 
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.db.session import init_db, close_db
 from app.db.base import engine
 from app.storage.s3 import close_s3
+from app.workers.http_session import close_http_session
 
 # Check if running on Windows
 IS_WINDOWS = platform.system() == "Windows"
@@ -36,6 +37,12 @@ class BaseWorker:
         self.logger = setup_logging(source=source_name)
         self.running = False
         self._shutdown_event = asyncio.Event()
+        # Poll-interval sleep, cancelled on shutdown (see run)
+        self._sleep_task: Optional[asyncio.Task] = None
+        # Signal handlers are installed once per worker (see run)
+        self._signals_installed = False
+        # Tasks spawned by this worker, cancelled on shutdown (see _spawn)
+        self._owned_tasks: Set[asyncio.Task] = set()
 
     async def fetch_news(self) -> None:
         """
@@ -46,6 +53,21 @@ class BaseWorker:
         """
         self.logger.info(f"Placeholder: fetch_news() called for {self.source_name}")
 
+    async def cleanup(self) -> None:
+        """
+        Release source-specific resources when the worker stops.
+
+        Calls close() by default; override in subclasses that need more.
+        """
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close source-specific connections (e.g. the worker's HTTP session).
+
+        Does nothing by default; override in subclasses that hold connections.
+        """
+
     async def run(self) -> None:
         """
         Main worker loop.
@@ -68,12 +90,11 @@ class BaseWorker:
         # Setup signal handlers for graceful shutdown (Unix only)
         if not IS_WINDOWS:
             try:
-                loop = asyncio.get_event_loop()
-                for sig in (signal.SIGTERM, signal.SIGINT):
-                    loop.add_signal_handler(
-                        sig,
-                        lambda s=sig: asyncio.create_task(self._shutdown(s))
-                    )
+                if not self._signals_installed:
+                    loop = asyncio.get_running_loop()
+                    for sig in (signal.SIGTERM, signal.SIGINT):
+                        loop.add_signal_handler(sig, self._handle_signal, sig)
+                    self._signals_installed = True
             except NotImplementedError:
                 # Signal handlers not available on this platform
                 pass
@@ -90,7 +111,7 @@ class BaseWorker:
 
                 try:
                     # Run fetch_news with cancellation support
-                    fetch_task = asyncio.create_task(self.fetch_news())
+                    fetch_task = self._spawn(self.fetch_news())
                     await fetch_task
                     fetch_task = None  # Clear reference after successful completion
                 except asyncio.CancelledError:
@@ -125,22 +146,24 @@ class BaseWorker:
                     time_remaining = settings.poll_interval - cycle_duration
                     
                     if time_remaining > 0:
-                        # Format time remaining
-                        remaining_td = timedelta(seconds=int(time_remaining))
-                        hours, remainder = divmod(remaining_td.seconds, 3600)
-                        minutes, seconds = divmod(remainder, 60)
-                        
-                        if hours > 0:
-                            time_str = f"{hours} ساعت و {minutes} دقیقه و {seconds} ثانیه"
-                        elif minutes > 0:
-                            time_str = f"{minutes} دقیقه و {seconds} ثانیه"
-                        else:
-                            time_str = f"{seconds} ثانیه"
-                        
-                        self.logger.info(
-                            f"Cycle completed in {cycle_duration:.1f}s. "
-                            f"Waiting {time_str} until next cycle..."
-                        )
+                        # Only build the message when INFO logging is enabled
+                        if self.logger.isEnabledFor(logging.INFO):
+                            # Format time remaining
+                            hours, remainder = divmod(int(time_remaining), 3600)
+                            minutes, seconds = divmod(remainder, 60)
+                            
+                            if hours > 0:
+                                time_str = f"{hours} ساعت و {minutes} دقیقه و {seconds} ثانیه"
+                            elif minutes > 0:
+                                time_str = f"{minutes} دقیقه و {seconds} ثانیه"
+                            else:
+                                time_str = f"{seconds} ثانیه"
+                            
+                            self.logger.info(
+                                "Cycle completed in %.1fs. Waiting %s until next cycle...",
+                                cycle_duration,
+                                time_str,
+                            )
                     else:
                         self.logger.warning(
                             f"Cycle took {cycle_duration:.1f}s (longer than poll interval of {settings.poll_interval}s). "
@@ -152,21 +175,17 @@ class BaseWorker:
 
                 # Wait for poll interval or shutdown signal
                 try:
-                    if time_remaining > 0:
-                        await asyncio.wait_for(
-                            self._shutdown_event.wait(),
-                            timeout=time_remaining
-                        )
-                        # Shutdown event was set
+                    if time_remaining > 0 and not self._shutdown_event.is_set():
+                        # Sleep task; shutdown cancels it to wake the loop early
+                        self._sleep_task = self._spawn(self._sleep_between_polls(time_remaining))
+                        await self._sleep_task
+                    # Check if shutdown was requested
+                    if self._shutdown_event.is_set():
                         break
-                    else:
-                        # Check if shutdown was requested
-                        if self._shutdown_event.is_set():
-                            break
-                except asyncio.TimeoutError:
-                    # Timeout is expected, continue loop
-                    pass
                 except asyncio.CancelledError:
+                    if self._shutdown_event.is_set():
+                        # Woken up by shutdown
+                        break
                     self.logger.info("Wait operation cancelled, shutting down...")
                     self.running = False
                     break
@@ -174,6 +193,8 @@ class BaseWorker:
                     self.logger.info("KeyboardInterrupt received during wait, shutting down...")
                     self.running = False
                     break
+                finally:
+                    self._sleep_task = None
 
         except KeyboardInterrupt:
             self.logger.info("KeyboardInterrupt received in main loop, shutting down...")
@@ -200,16 +221,15 @@ class BaseWorker:
                 except (asyncio.CancelledError, asyncio.TimeoutError, Exception):
                     pass
             
-            # Cleanup resources if cleanup method exists
-            if hasattr(self, "cleanup"):
-                try:
-                    self.logger.info("Running cleanup...")
-                    # Add timeout to cleanup to prevent hanging
-                    await asyncio.wait_for(self.cleanup(), timeout=10.0)
-                except asyncio.TimeoutError:
-                    self.logger.warning("Cleanup timed out, forcing exit...")
-                except Exception as cleanup_error:
-                    self.logger.error(f"Error during cleanup: {cleanup_error}", exc_info=True)
+            # Cleanup source-specific resources
+            try:
+                self.logger.info("Running cleanup...")
+                # Add timeout to cleanup to prevent hanging
+                await asyncio.wait_for(self.cleanup(), timeout=10.0)
+            except asyncio.TimeoutError:
+                self.logger.warning("Cleanup timed out, forcing exit...")
+            except Exception as cleanup_error:
+                self.logger.error(f"Error during cleanup: {cleanup_error}", exc_info=True)
             
             # Close database connections
             try:
@@ -229,10 +249,16 @@ class BaseWorker:
             except (asyncio.TimeoutError, Exception) as s3_error:
                 self.logger.warning(f"Error closing S3: {s3_error}")
             
-            # Cancel any remaining background tasks
+            # Close the shared HTTP session (once per process)
             try:
-                loop = asyncio.get_running_loop()
-                tasks = [t for t in asyncio.all_tasks(loop) if not t.done() and t is not asyncio.current_task()]
+                await asyncio.wait_for(close_http_session(), timeout=2.0)
+            except (asyncio.TimeoutError, Exception) as http_error:
+                self.logger.warning(f"Error closing HTTP session: {http_error}")
+            
+            # Cancel any remaining tasks this worker spawned; library tasks
+            # (connection pools, keep-alives) are left to their owners
+            try:
+                tasks = [t for t in self._owned_tasks if not t.done()]
                 if tasks:
                     self.logger.debug(f"Cancelling {len(tasks)} remaining tasks...")
                     for task in tasks:
@@ -244,10 +270,13 @@ class BaseWorker:
             
             self.logger.info(f"Worker stopped for source: {self.source_name}")
 
-    async def _shutdown(self, signum: int) -> None:
+    def _handle_signal(self, signum: int) -> None:
         """
         Handle shutdown signal.
 
+        Runs directly in the event loop, so it only flips state instead of
+        scheduling a shutdown coroutine.
+
         Args:
             signum: Signal number
         """
@@ -255,6 +284,7 @@ class BaseWorker:
         self.logger.info(f"Received {signal_name}, initiating graceful shutdown...")
         self.running = False
         self._shutdown_event.set()
+        self._cancel_sleep()
     
     def shutdown(self) -> None:
         """
@@ -264,4 +294,48 @@ class BaseWorker:
         self.logger.info("Shutdown requested, initiating graceful shutdown...")
         self.running = False
         self._shutdown_event.set()
+        self._cancel_sleep()
+
+    async def _sleep_between_polls(self, seconds: float) -> None:
+        """
+        Sleep until the next poll.
+
+        On Windows the Proactor loop only delivers Ctrl+C when it wakes up,
+        so the wait is split into one-second steps there.
+
+        Args:
+            seconds: Time to sleep in seconds
+        """
+        if not IS_WINDOWS:
+            await asyncio.sleep(seconds)
+            return
+
+        deadline = time.monotonic() + seconds
+        while not self._shutdown_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(1.0, remaining))
+
+    def _spawn(self, coro: Coroutine) -> asyncio.Task:
+        """
+        Start a task owned by this worker.
+
+        Owned tasks are cancelled when the worker stops.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The created task
+        """
+        task = asyncio.create_task(coro)
+        self._owned_tasks.add(task)
+        task.add_done_callback(self._owned_tasks.discard)
+        return task
+
+    def _cancel_sleep(self) -> None:
+        """Wake the run loop if it is sleeping between polls."""
+        if self._sleep_task is not None and not self._sleep_task.done():
+            self._sleep_task.cancel()
 
@@ -0,0 +1,89 @@
+"""Shared aiohttp session and connection pool for workers."""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+# Default headers sent with every request on the shared session
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "application/json",
+}
+
+# Global connection pool and session (one per worker process)
+_connector: Optional[aiohttp.TCPConnector] = None
+_session: Optional[aiohttp.ClientSession] = None
+_session_lock = asyncio.Lock()
+
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """
+    Get the process-wide connection pool, creating it on first use.
+
+    Sessions built on it must pass ``connector_owner=False`` so closing them
+    leaves the pool open; the pool is closed by close_http_session. Sharing
+    it lets every session in the process reuse keep-alive connections and
+    the DNS cache for hosts they have in common (e.g. shared CDNs).
+
+    Returns:
+        Shared aiohttp.TCPConnector
+    """
+    global _connector
+
+    if _connector is None or _connector.closed:
+        # Keep idle connections around between bursts of fetches so
+        # TCP/TLS handshakes are reused
+        _connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            keepalive_timeout=75,
+            # Workers poll the same few hosts all day, so cache lookups for an hour
+            use_dns_cache=True,
+            ttl_dns_cache=3600,
+            enable_cleanup_closed=True,
+        )
+    return _connector
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide HTTP session, creating it on first use.
+
+    The session uses the shared connection pool (keep-alive, DNS cache), so
+    every API worker in the process reuses the same TCP/TLS connections.
+
+    Returns:
+        Shared aiohttp.ClientSession
+    """
+    global _session
+
+    if _session is not None and not _session.closed:
+        return _session
+
+    async with _session_lock:
+        if _session is None or _session.closed:
+            _session = aiohttp.ClientSession(
+                connector=get_shared_connector(),
+                connector_owner=False,
+                timeout=aiohttp.ClientTimeout(total=30, connect=10),
+                headers=DEFAULT_HEADERS,
+            )
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the process-wide HTTP session and connection pool if they are open."""
+    global _session, _connector
+
+    if _session is not None:
+        session = _session
+        _session = None
+        if not session.closed:
+            await session.close()
+
+    if _connector is not None:
+        connector = _connector
+        _connector = None
+        if not connector.closed:
+            await connector.close()
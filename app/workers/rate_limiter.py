@@ -2,17 +2,43 @@
 
 import asyncio
 import time
-from collections import defaultdict
+from collections import deque
 from typing import Optional
 
+# Acquires between sweeps of idle per-source state
+GC_INTERVAL = 1000
+# Length of the sliding window the per-minute limit applies to, in seconds
+WINDOW = 60.0
+# Seconds a source must be idle before its state is dropped; longer than a
+# full bucket refill, so dropping it doesn't change any later decision
+STALE_AFTER = 300.0
+
 
 class RateLimiter:
     """
     Async-compatible rate limiter for HTTP requests.
     
-    Supports per-source rate limiting with configurable limits.
+    Supports per-source rate limiting with configurable limits. The
+    per-minute limit is a token bucket: each source may burst up to
+    ``max_requests_per_minute`` requests, refilled at that rate. A sliding
+    window of recent request times additionally keeps any 60-second span
+    at or below ``max_requests_per_minute`` (a bucket alone allows a full
+    burst plus its refill).
     """
 
+    __slots__ = (
+        "max_requests_per_minute",
+        "delay_between_requests",
+        "_refill_rate",
+        "_tokens",
+        "_last_refill",
+        "_last_request_time",
+        "_windows",
+        "_paused_until",
+        "_locks",
+        "_acquires_since_gc",
+    )
+
     def __init__(
         self,
         max_requests_per_minute: int = 60,
@@ -28,10 +54,18 @@ class RateLimiter:
         self.max_requests_per_minute = max_requests_per_minute
         self.delay_between_requests = delay_between_requests
         
-        # Track request timestamps per source
-        self._request_timestamps: dict[str, list[float]] = defaultdict(list)
-        self._last_request_time: dict[str, float] = defaultdict(float)
-        self._lock = asyncio.Lock()
+        # Token bucket state per source
+        self._refill_rate = max_requests_per_minute / 60.0
+        self._tokens: dict[str, float] = {}
+        self._last_refill: dict[str, float] = {}
+        self._last_request_time: dict[str, float] = {}
+        # Start times of the most recent requests per source (sliding window)
+        self._windows: dict[str, deque[float]] = {}
+        # Times before which a source must not be requested (see pause_until)
+        self._paused_until: dict[str, float] = {}
+        # One lock per source so sources never wait on each other
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._acquires_since_gc = 0
 
     async def acquire(
         self,
@@ -42,41 +76,152 @@ class RateLimiter:
         Acquire permission to make a request.
 
         This method will block until the rate limit allows the request.
+        The request's slot is reserved under the source's lock and the
+        wait happens after the lock is released, so concurrent callers
+        queue up behind each other without holding the lock while asleep.
 
         Args:
             source: Source name for rate limiting
             request_type: Type of request (rss, article, etc.) for logging
         """
-        async with self._lock:
-            now = time.time()
-            
-            # Clean old timestamps (older than 1 minute)
-            timestamps = self._request_timestamps[source]
-            timestamps[:] = [ts for ts in timestamps if now - ts < 60]
+        # Hoisted lookups; acquire runs before every HTTP request
+        delay = self.delay_between_requests
+        last_request_time = self._last_request_time
+        windows = self._windows
+        paused_until = self._paused_until
+        monotonic = time.monotonic
+        
+        # Monotonic clock so wall-clock adjustments can't skew waits
+        now = monotonic()
+        
+        self._acquires_since_gc += 1
+        if self._acquires_since_gc >= GC_INTERVAL:
+            self._gc_if_stale(now)
+        
+        # Fast path: a token is available, the window has room and the
+        # minimum spacing has passed. Nothing here awaits, so the check and
+        # the reservation are atomic on the event loop without taking the lock.
+        tokens = self._available_tokens(source, now)
+        last_request = last_request_time.get(source)
+        window = windows.get(source)
+        if (
+            tokens >= 1
+            and (last_request is None or now - last_request >= delay)
+            and (window is None or len(window) < window.maxlen or now - window[0] >= WINDOW)
+            and now >= paused_until.get(source, now)
+        ):
+            self._reserve(source, now, tokens)
+            return
+        
+        lock = self._locks.get(source)
+        if lock is None:
+            lock = self._locks[source] = asyncio.Lock()
+        async with lock:
+            now = monotonic()
+            start = now
             
             # Check if we've exceeded the per-minute limit
-            if len(timestamps) >= self.max_requests_per_minute:
-                # Calculate wait time until oldest request expires
-                oldest_timestamp = min(timestamps)
-                wait_time = 60 - (now - oldest_timestamp) + 0.1  # Add small buffer
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
-                    # Clean timestamps again after waiting
-                    now = time.time()
-                    timestamps[:] = [ts for ts in timestamps if now - ts < 60]
+            tokens = self._available_tokens(source, now)
+            if tokens < 1:
+                # Wait until one token has been refilled
+                start = now + (1 - tokens) / self._refill_rate
+            
+            # Wait until the oldest request in a full window has aged out
+            window = windows.get(source)
+            if window is not None and len(window) == window.maxlen:
+                start = max(start, window[0] + WINDOW)
+            
+            # Hold off while the source is paused
+            start = max(start, paused_until.get(source, start))
             
             # Apply delay between requests
-            last_request = self._last_request_time[source]
-            if last_request > 0:
-                time_since_last = now - last_request
-                if time_since_last < self.delay_between_requests:
-                    delay = self.delay_between_requests - time_since_last
-                    await asyncio.sleep(delay)
-                    now = time.time()
+            last_request = last_request_time.get(source)
+            if last_request is not None:
+                start = max(start, last_request + delay)
             
-            # Record this request
-            timestamps.append(now)
-            self._last_request_time[source] = now
+            # Reserve the slot before waiting so later callers are scheduled after it
+            self._reserve(source, start, self._available_tokens(source, start))
+        
+        wait_time = start - now
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def pause_until(self, source: str, until: float) -> None:
+        """
+        Hold back requests to a source until a given time.
+
+        Used when the server reports its rate limit is (nearly) exhausted.
+        Pauses only ever extend; an earlier time than the current pause is
+        ignored.
+
+        Args:
+            source: Source name
+            until: ``time.monotonic()`` value before which no request may start
+        """
+        if until > self._paused_until.get(source, 0.0):
+            self._paused_until[source] = until
+
+    def _reserve(self, source: str, start: float, tokens: float) -> None:
+        """
+        Record a request slot for a source.
+
+        Args:
+            source: Source name
+            start: Time the request may start
+            tokens: Tokens available at ``start`` (before this request)
+        """
+        self._tokens[source] = tokens - 1
+        self._last_refill[source] = start
+        self._last_request_time[source] = start
+        window = self._windows.get(source)
+        if window is None:
+            window = self._windows[source] = deque(maxlen=max(1, self.max_requests_per_minute))
+        window.append(start)
+
+    def _gc_if_stale(self, now: float) -> None:
+        """
+        Drop state for sources idle for longer than ``STALE_AFTER``.
+
+        An idle source's bucket is full again, so forgetting it is the same
+        as keeping it; this only stops the dicts growing in long-running
+        processes.
+
+        Args:
+            now: Current ``time.monotonic()`` value
+        """
+        self._acquires_since_gc = 0
+        cutoff = now - STALE_AFTER
+        stale = [
+            source
+            for source, last_request in self._last_request_time.items()
+            if last_request < cutoff
+            and self._paused_until.get(source, now) <= now
+            and not (source in self._locks and self._locks[source].locked())
+        ]
+        for source in stale:
+            del self._tokens[source]
+            del self._last_refill[source]
+            del self._last_request_time[source]
+            del self._windows[source]
+            self._paused_until.pop(source, None)
+            self._locks.pop(source, None)
+
+    def _available_tokens(self, source: str, now: float) -> float:
+        """
+        Compute the tokens a source has available at a given time.
+
+        Args:
+            source: Source name
+            now: Current ``time.monotonic()`` value
+
+        Returns:
+            Number of available tokens (capped at the per-minute limit)
+        """
+        capacity = self.max_requests_per_minute
+        if source not in self._tokens:
+            return float(capacity)
+        elapsed = now - self._last_refill[source]
+        return min(capacity, self._tokens[source] + elapsed * self._refill_rate)
 
     def get_stats(self, source: str) -> dict:
         """
@@ -88,13 +233,12 @@ class RateLimiter:
         Returns:
             Dictionary with rate limit stats
         """
-        now = time.time()
-        timestamps = self._request_timestamps[source]
-        # Clean old timestamps
-        timestamps[:] = [ts for ts in timestamps if now - ts < 60]
+        now = time.monotonic()
+        window = self._windows.get(source, ())
         
         return {
-            "requests_last_minute": len(timestamps),
+            # Requests started in the last minute (reserved future slots excluded)
+            "requests_last_minute": sum(1 for t in window if now - WINDOW < t <= now),
             "max_requests_per_minute": self.max_requests_per_minute,
             "delay_between_requests": self.delay_between_requests,
         }
@@ -1,41 +1,47 @@
 """Worker runner entry point."""
 
 import asyncio
+import importlib
 import sys
 
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.workers.base_worker import BaseWorker
 
-# Import source-specific workers
-from app.sources.isna import ISNAWorker
-from app.sources.mehrnews import MehrNewsWorker
-from app.sources.irna import IRNAWorker
-from app.sources.fars import FarsWorker
-from app.sources.tasnim import TasnimWorker
-from app.sources.iribnews import IRIBNewsWorker
-from app.sources.ilna import ILNAWorker
-from app.sources.kayhan import KayhanWorker
-from app.sources.mizan import MizanWorker
-from app.sources.varzesh3 import Varzesh3Worker
-from app.sources.mashreghnews import MashreghNewsWorker
-from app.sources.yjc import YJCWorker
-from app.sources.iqna import IQNAWorker
-from app.sources.hamshahri import HamshahriWorker
-from app.sources.donyaeqtesad import DonyaEqtesadWorker
-from app.sources.snn import SNNWorker
-from app.sources.ipna import IPNAWorker
-from app.sources.tabnak import TabnakWorker
-from app.sources.eghtesadonline import EghtesadOnlineWorker
-from app.sources.reuters_photos import ReutersPhotosWorker
-from app.sources.reuters_text import ReutersTextWorker
-from app.sources.reuters_video import ReutersVideoWorker
-from app.sources.afp_text import AFPTextWorker
-from app.sources.afp_photo import AFPPhotoWorker
-from app.sources.afp_video import AFPVideoWorker
-from app.sources.aptn_text import APTextWorker
-from app.sources.aptn_video import APVideoWorker
-from app.sources.aptn_photo import APPhotoWorker
+
+# Worker module and class for each WORKER_SOURCE value. Only the selected
+# source is imported, so a worker process doesn't load every source's
+# dependencies.
+WORKERS: dict[str, tuple[str, str]] = {
+    "mehrnews": ("app.sources.mehrnews", "MehrNewsWorker"),
+    "isna": ("app.sources.isna", "ISNAWorker"),
+    "irna": ("app.sources.irna", "IRNAWorker"),
+    "fars": ("app.sources.fars", "FarsWorker"),
+    "tasnim": ("app.sources.tasnim", "TasnimWorker"),
+    "iribnews": ("app.sources.iribnews", "IRIBNewsWorker"),
+    "ilna": ("app.sources.ilna", "ILNAWorker"),
+    "kayhan": ("app.sources.kayhan", "KayhanWorker"),
+    "mizan": ("app.sources.mizan", "MizanWorker"),
+    "varzesh3": ("app.sources.varzesh3", "Varzesh3Worker"),
+    "mashreghnews": ("app.sources.mashreghnews", "MashreghNewsWorker"),
+    "yjc": ("app.sources.yjc", "YJCWorker"),
+    "iqna": ("app.sources.iqna", "IQNAWorker"),
+    "hamshahri": ("app.sources.hamshahri", "HamshahriWorker"),
+    "donyaeqtesad": ("app.sources.donyaeqtesad", "DonyaEqtesadWorker"),
+    "snn": ("app.sources.snn", "SNNWorker"),
+    "ipna": ("app.sources.ipna", "IPNAWorker"),
+    "tabnak": ("app.sources.tabnak", "TabnakWorker"),
+    "eghtesadonline": ("app.sources.eghtesadonline", "EghtesadOnlineWorker"),
+    "reuters_photos": ("app.sources.reuters_photos", "ReutersPhotosWorker"),
+    "reuters_text": ("app.sources.reuters_text", "ReutersTextWorker"),
+    "reuters_video": ("app.sources.reuters_video", "ReutersVideoWorker"),
+    "afp_text": ("app.sources.afp_text", "AFPTextWorker"),
+    "afp_photo": ("app.sources.afp_photo", "AFPPhotoWorker"),
+    "afp_video": ("app.sources.afp_video", "AFPVideoWorker"),
+    "aptn_text": ("app.sources.aptn_text", "APTextWorker"),
+    "aptn_video": ("app.sources.aptn_video", "APVideoWorker"),
+    "aptn_photo": ("app.sources.aptn_photo", "APPhotoWorker"),
+}
 
 
 async def main() -> None:
@@ -47,63 +53,10 @@ async def main() -> None:
         sys.exit(1)
 
     # Instantiate appropriate worker based on source
-    worker = None
-    if settings.worker_source == "mehrnews":
-        worker = MehrNewsWorker()
-    elif settings.worker_source == "isna":
-        worker = ISNAWorker()
-    elif settings.worker_source == "irna":
-        worker = IRNAWorker()
-    elif settings.worker_source == "fars":
-        worker = FarsWorker()
-    elif settings.worker_source == "tasnim":
-        worker = TasnimWorker()
-    elif settings.worker_source == "iribnews":
-        worker = IRIBNewsWorker()
-    elif settings.worker_source == "ilna":
-        worker = ILNAWorker()
-    elif settings.worker_source == "kayhan":
-        worker = KayhanWorker()
-    elif settings.worker_source == "mizan":
-        worker = MizanWorker()
-    elif settings.worker_source == "varzesh3":
-        worker = Varzesh3Worker()
-    elif settings.worker_source == "mashreghnews":
-        worker = MashreghNewsWorker()
-    elif settings.worker_source == "yjc":
-        worker = YJCWorker()
-    elif settings.worker_source == "iqna":
-        worker = IQNAWorker()
-    elif settings.worker_source == "hamshahri":
-        worker = HamshahriWorker()
-    elif settings.worker_source == "donyaeqtesad":
-        worker = DonyaEqtesadWorker()
-    elif settings.worker_source == "snn":
-        worker = SNNWorker()
-    elif settings.worker_source == "ipna":
-        worker = IPNAWorker()
-    elif settings.worker_source == "tabnak":
-        worker = TabnakWorker()
-    elif settings.worker_source == "eghtesadonline":
-        worker = EghtesadOnlineWorker()
-    elif settings.worker_source == "reuters_photos":
-        worker = ReutersPhotosWorker()
-    elif settings.worker_source == "reuters_text":
-        worker = ReutersTextWorker()
-    elif settings.worker_source == "reuters_video":
-        worker = ReutersVideoWorker()
-    elif settings.worker_source == "afp_text":
-        worker = AFPTextWorker()
-    elif settings.worker_source == "afp_photo":
-        worker = AFPPhotoWorker()
-    elif settings.worker_source == "afp_video":
-        worker = AFPVideoWorker()
-    elif settings.worker_source == "aptn_text":
-        worker = APTextWorker()
-    elif settings.worker_source == "aptn_video":
-        worker = APVideoWorker()
-    elif settings.worker_source == "aptn_photo":
-        worker = APPhotoWorker()
+    worker_spec = WORKERS.get(settings.worker_source)
+    if worker_spec is not None:
+        module_name, class_name = worker_spec
+        worker = getattr(importlib.import_module(module_name), class_name)()
     else:
         # Fallback to base worker for unknown sources
         worker = BaseWorker(settings.worker_source)
@@ -1,14 +1,64 @@
 """Web scraping worker base class for news sources."""
 
 import asyncio
+import logging
+import random
+import time
 from abc import ABC
-from typing import Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
 import aiohttp
+from multidict import CIMultiDict
 
+from app.workers.adaptive_limiter import AdaptiveConcurrencyLimiter
 from app.workers.base_worker import BaseWorker
+from app.workers.http_session import get_shared_connector
 from app.workers.rate_limiter import RateLimiter
 from app.core.config import settings
 
+try:
+    # aiohttp decodes brotli responses only when a brotli package is installed
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+# Built once and shared by every scraper session
+_DEFAULT_HEADERS = CIMultiDict({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "fa-IR,fa;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "Upgrade-Insecure-Requests": "1",
+})
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+# Shortest retry backoff, in seconds
+BACKOFF_BASE = 0.5
+# Longest Retry-After wait honored before retrying, in seconds
+MAX_RETRY_AFTER = 60.0
+# Hard ceiling on one fetch attempt, in seconds (on top of the session timeout)
+FETCH_HARD_TIMEOUT = 35.0
+# Largest response body read, in bytes; bigger responses are dropped
+MAX_BODY_BYTES = 8 * 1024 * 1024
+# Size of the chunks response bodies are streamed in
+READ_CHUNK_SIZE = 64 * 1024
+# Errors from reusing a keep-alive connection the server already closed
+_STALE_CONNECTION_ERRORS = (
+    aiohttp.ServerDisconnectedError,
+    aiohttp.ClientOSError,
+    aiohttp.ClientPayloadError,
+)
+# Immediate (no backoff) retries allowed per fetch for stale connections
+MAX_STALE_RETRIES = 2
+# Rate-limit header prefixes (legacy X- form and the IETF draft form)
+_RATE_HEADER_PREFIXES = ("x-ratelimit-", "ratelimit-")
+
 
 class WebScraperWorker(BaseWorker, ABC):
     """
@@ -17,6 +67,10 @@ class WebScraperWorker(BaseWorker, ABC):
     Provides common functionality for workers that scrape news from HTML pages.
     """
 
+    # Longest server-requested wait (Retry-After, rate-limit reset) honored
+    # before retrying; sources known to throttle for longer raise it
+    max_retry_after: float = MAX_RETRY_AFTER
+
     def __init__(self, source_name: str):
         """
         Initialize web scraper worker.
@@ -33,6 +87,8 @@ class WebScraperWorker(BaseWorker, ABC):
             max_requests_per_minute=settings.max_requests_per_minute,
             delay_between_requests=settings.delay_between_requests,
         )
+        # Backs fetch concurrency off when the origin slows down or throttles (429/5xx, timeouts)
+        self._limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=32)
 
     async def _get_http_session(self) -> aiohttp.ClientSession:
         """
@@ -42,19 +98,134 @@ class WebScraperWorker(BaseWorker, ABC):
             Configured aiohttp.ClientSession
         """
         if self.http_session is None or self.http_session.closed:
+            # Own session (headers, cookies) on the process-wide connection
+            # pool, which outlives the session and is closed with the worker
             self.http_session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30, connect=10),
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "fa-IR,fa;q=0.9,en-US;q=0.8,en;q=0.7",
-                    "Accept-Encoding": "gzip, deflate",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                }
+                connector=get_shared_connector(),
+                connector_owner=False,
+                timeout=_DEFAULT_TIMEOUT,
+                headers=_DEFAULT_HEADERS,
             )
         return self.http_session
 
+    @staticmethod
+    def _backoff_delay(previous: float, base: float = BACKOFF_BASE, cap: float = 30.0) -> float:
+        """
+        Compute a decorrelated-jitter backoff delay.
+        
+        Each delay is drawn from ``[base, 3 * previous]``, so delays grow
+        across retries while concurrent fetches that failed together don't
+        retry in lockstep.
+        
+        Args:
+            previous: Previous delay in seconds (``base`` before the first retry)
+            base: Minimum delay in seconds
+            cap: Maximum delay in seconds
+            
+        Returns:
+            Delay in seconds
+        """
+        return min(cap, random.uniform(base, previous * 3))
+
+    def _retry_after_delay(self, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Parse a Retry-After header.
+        
+        Args:
+            headers: Response headers
+            
+        Returns:
+            Delay in seconds (at most max_retry_after), or None if absent or invalid
+        """
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            # HTTP-date form
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, 0.0), self.max_retry_after)
+
+    def _throttle_delay(self, status: int, headers: Mapping[str, str], attempt: int) -> Optional[float]:
+        """
+        Get the wait before retrying a 429/503 response.
+        
+        Args:
+            status: Response status code (429 or 503)
+            headers: Response headers
+            attempt: Zero-based attempt number of the throttled request
+            
+        Returns:
+            Delay in seconds, or None to use the normal retry backoff
+        """
+        return self._retry_after_delay(headers)
+
+    def _consume_rate_headers(self, headers: Mapping[str, str], status: int) -> None:
+        """
+        Pause the rate limiter when the server says its limit is (nearly) used up.
+        
+        Reads Retry-After on 429/503 and the ``*-RateLimit-Remaining``,
+        ``-Limit`` and ``-Reset`` headers, so the next requests wait for the
+        reset instead of running into a 429.
+        
+        Args:
+            headers: Response headers
+            status: Response status code
+        """
+        delay = None
+        if status in (429, 503):
+            delay = self._retry_after_delay(headers)
+        
+        if delay is None:
+            for prefix in _RATE_HEADER_PREFIXES:
+                remaining = headers.get(prefix + "remaining")
+                reset = headers.get(prefix + "reset")
+                if remaining is None or reset is None:
+                    continue
+                try:
+                    remaining_count = float(remaining)
+                    reset_value = float(reset)
+                    limit = float(headers.get(prefix + "limit") or 0)
+                except ValueError:
+                    break
+                if remaining_count <= max(2.0, 0.10 * limit):
+                    # Reset is either an epoch timestamp or seconds from now
+                    if reset_value > 1e9:
+                        reset_value -= time.time()
+                    delay = min(max(reset_value, 0.0), self.max_retry_after)
+                break
+        
+        if delay:
+            self.rate_limiter.pause_until(self.source_name, time.monotonic() + delay)
+
+    @staticmethod
+    async def _read_body(response: aiohttp.ClientResponse) -> Optional[bytes]:
+        """
+        Read a response body in chunks, up to MAX_BODY_BYTES.
+        
+        Args:
+            response: Response to read
+            
+        Returns:
+            Response body, or None if it exceeds MAX_BODY_BYTES
+        """
+        if response.content_length is not None and response.content_length > MAX_BODY_BYTES:
+            return None
+        
+        buf = bytearray()
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            buf.extend(chunk)
+            if len(buf) > MAX_BODY_BYTES:
+                return None
+        return bytes(buf)
+
     async def _fetch_with_retry(
         self,
         url: str,
@@ -73,8 +244,11 @@ class WebScraperWorker(BaseWorker, ABC):
             Response content as bytes, or None if all retries failed
         """
         session = await self._get_http_session()
+        backoff = BACKOFF_BASE
+        stale_retries = 0
         
-        for attempt in range(max_retries):
+        attempt = 0
+        while attempt < max_retries:
             try:
                 # Apply rate limiting before making request
                 await self.rate_limiter.acquire(
@@ -82,60 +256,131 @@ class WebScraperWorker(BaseWorker, ABC):
                     request_type=request_type
                 )
                 
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        content = await response.read()
-                        self.logger.debug(
-                            f"Successfully fetched {url}",
-                            extra={
-                                "source": self.source_name,
-                                "request_type": request_type,
-                                "article_url": url if request_type == "article" else None,
-                            }
-                        )
-                        return content
-                    elif response.status == 404:
-                        self.logger.warning(
-                            f"404 Not Found: {url}",
-                            extra={
-                                "source": self.source_name,
-                                "request_type": request_type,
-                            }
-                        )
-                        return None
-                    else:
-                        self.logger.warning(
-                            f"HTTP {response.status} for {url}, attempt {attempt + 1}/{max_retries}",
-                            extra={
-                                "source": self.source_name,
-                                "request_type": request_type,
-                            }
-                        )
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(2 ** attempt)
+                retry_delay = None
+                async with self._limiter.use() as limiter_request:
+                    async with asyncio.timeout(FETCH_HARD_TIMEOUT), session.get(url) as response:
+                        self._consume_rate_headers(response.headers, response.status)
+                        if response.status == 429 or response.status >= 500:
+                            limiter_request.mark_failed()
+                        
+                        if response.status == 200:
+                            content = await self._read_body(response)
+                            if content is None:
+                                self.logger.warning(
+                                    "Response larger than %d bytes, skipping: %s",
+                                    MAX_BODY_BYTES,
+                                    url,
+                                    extra={
+                                        "source": self.source_name,
+                                        "request_type": request_type,
+                                    }
+                                )
+                                return None
+                            # Skip building the extra dict when DEBUG is off
+                            if self.logger.isEnabledFor(logging.DEBUG):
+                                self.logger.debug(
+                                    "Successfully fetched %s",
+                                    url,
+                                    extra={
+                                        "source": self.source_name,
+                                        "request_type": request_type,
+                                        "article_url": url if request_type == "article" else None,
+                                    }
+                                )
+                            return content
+                        elif response.status == 404:
+                            self.logger.warning(
+                                "404 Not Found: %s",
+                                url,
+                                extra={
+                                    "source": self.source_name,
+                                    "request_type": request_type,
+                                }
+                            )
+                            return None
+                        elif 400 <= response.status < 500 and response.status not in (408, 425, 429):
+                            # Other client errors won't change on retry
+                            self.logger.warning(
+                                "HTTP %d for %s, not retrying",
+                                response.status,
+                                url,
+                                extra={
+                                    "source": self.source_name,
+                                    "request_type": request_type,
+                                }
+                            )
+                            return None
+                        else:
+                            self.logger.warning(
+                                "HTTP %d for %s, attempt %d/%d",
+                                response.status,
+                                url,
+                                attempt + 1,
+                                max_retries,
+                                extra={
+                                    "source": self.source_name,
+                                    "request_type": request_type,
+                                }
+                            )
+                            if attempt < max_retries - 1:
+                                if response.status in (429, 503):
+                                    # Honor the server's own retry hint first
+                                    retry_delay = self._throttle_delay(
+                                        response.status, response.headers, attempt
+                                    )
+                                if retry_delay is None:
+                                    retry_delay = backoff = self._backoff_delay(backoff)
+                
+                # Back off without holding a concurrency slot or the connection
+                if retry_delay is not None:
+                    await asyncio.sleep(retry_delay)
             except asyncio.TimeoutError:
                 self.logger.warning(
-                    f"Timeout fetching {url}, attempt {attempt + 1}/{max_retries}",
+                    "Timeout fetching %s, attempt %d/%d",
+                    url,
+                    attempt + 1,
+                    max_retries,
                     extra={
                         "source": self.source_name,
                         "request_type": request_type,
                     }
                 )
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-            except Exception as e:
+                    backoff = self._backoff_delay(backoff)
+                    await asyncio.sleep(backoff)
+            except asyncio.CancelledError:
+                # Never retry through a shutdown
+                raise
+            except (aiohttp.ClientError, OSError) as e:
+                if (
+                    isinstance(e, _STALE_CONNECTION_ERRORS)
+                    and not isinstance(e, aiohttp.ClientConnectorError)
+                    and stale_retries < MAX_STALE_RETRIES
+                ):
+                    # A pooled keep-alive connection was closed by the server;
+                    # retry straight away on a fresh one without using an attempt
+                    stale_retries += 1
+                    self.logger.debug("Stale connection fetching %s, retrying: %s", url, e)
+                    continue
                 self.logger.warning(
-                    f"Error fetching {url}: {e}, attempt {attempt + 1}/{max_retries}",
+                    "Error fetching %s: %s, attempt %d/%d",
+                    url,
+                    e,
+                    attempt + 1,
+                    max_retries,
                     extra={
                         "source": self.source_name,
                         "request_type": request_type,
                     }
                 )
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    backoff = self._backoff_delay(backoff)
+                    await asyncio.sleep(backoff)
                 else:
                     self.logger.error(
-                        f"Failed to fetch {url} after {max_retries} attempts",
+                        "Failed to fetch %s after %d attempts",
+                        url,
+                        max_retries,
                         extra={
                             "source": self.source_name,
                             "request_type": request_type,
@@ -143,6 +388,7 @@ class WebScraperWorker(BaseWorker, ABC):
                         }
                     )
                     return None
+            attempt += 1
         
         return None
 
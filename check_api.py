@@ -2,8 +2,13 @@
 import requests
 import json
 
-response = requests.get("http://localhost:3000/news/latest?limit=1")
-data = response.json()
+API_BASE_URL = "http://localhost:3000"
+
+# One session so repeated checks reuse the same keep-alive connection
+with requests.Session() as session:
+    response = session.get(f"{API_BASE_URL}/news/latest", params={"limit": 1}, timeout=10.0)
+    response.raise_for_status()
+    data = response.json()
 
 item = data.get('items', [{}])[0]
 print('First article:')
@@ -1,19 +1,51 @@
+"""Delete stored news items for one or more sources.
+
+Usage:
+    python cleanup.py --source ilna --source aptn_text [--dry-run]
+"""
+
+import argparse
 import asyncio
-import os
-from dotenv import load_dotenv
 
-# Load environment variables BEFORE importing app modules
-load_dotenv()
-os.environ["USE_ENV_FILE"] = "true"
+from sqlalchemy import delete, func, select
 
-from sqlalchemy import delete
 from app.db.base import AsyncSessionLocal
 from app.db.models import News
 
-async def main():
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Delete stored news items for the given sources.")
+    parser.add_argument(
+        "--source",
+        action="append",
+        required=True,
+        dest="sources",
+        help="Source to delete news for (repeat for several sources)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count the news items that would be deleted",
+    )
+    return parser.parse_args()
+
+
+async def main(sources: list[str], dry_run: bool) -> None:
+    """Delete (or count) news items for the given sources in one statement."""
     async with AsyncSessionLocal() as db:
-        result = await db.execute(delete(News).where(News.source == "aptn_video"))
+        if dry_run:
+            count = await db.scalar(
+                select(func.count()).select_from(News).where(News.source.in_(sources))
+            )
+            print(f"Would delete {count} news items from {', '.join(sources)}")
+            return
+
+        result = await db.execute(delete(News).where(News.source.in_(sources)))
         await db.commit()
-        print(f"Deleted {result.rowcount} news items from IPNA")
+        print(f"Deleted {result.rowcount} news items from {', '.join(sources)}")
+
 
-asyncio.run(main())
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(main(args.sources, args.dry_run))
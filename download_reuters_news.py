@@ -21,23 +21,34 @@ Options:
     --s3-secret-key KEY        کلید مخفی S3
     --s3-region REGION         منطقه S3 (پیش‌فرض: us-east-1)
     --upload-to-s3             آپلود فایل‌ها به S3
+    --keep-local               نگه داشتن نسخه محلی ویدئوها و عکس‌ها هنگام آپلود به S3
+    --concurrency N            تعداد کانال‌هایی که همزمان پردازش می‌شوند (پیش‌فرض: 8)
+    --debug                    نمایش لاگ‌های DEBUG
 """
 
 import argparse
 import asyncio
-import json
+import hashlib
 import os
 import re
+import sqlite3
 import sys
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Set
 from urllib.parse import quote, urlencode
+from xml.sax.saxutils import escape
 
 import aiohttp
 import aioboto3
+import orjson
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
+from yarl import URL
 
 # URL های API رویترز
 AUTH_URL = "https://commerce.reuters.com/rmd/rest/xml/login"
@@ -45,19 +56,274 @@ CHANNELS_URL = "http://rmb.reuters.com/rmd/rest/xml/channels"
 ITEMS_URL = "http://rmb.reuters.com/rmd/rest/xml/items"
 ITEM_URL = "http://rmb.reuters.com/rmd/rest/xml/item"
 
+# حداکثر تعداد کانال‌هایی که همزمان پردازش می‌شوند (قابل تغییر با --concurrency)
+CHANNEL_CONCURRENCY = 8
+
+# حداکثر همزمانی هر مرحله از پردازش آیتم‌ها (در همه کانال‌ها)
+# meta: دریافت و ذخیره XML جزئیات، media: دانلود ویدئو/عکس، upload: آپلود فایل به S3
+META_CONCURRENCY = 20
+MEDIA_CONCURRENCY = 8
+UPLOAD_CONCURRENCY = 8
+
+# مدت اعتبار token و لیست کانال‌ها بین دورهای loop (ثانیه)؛ پاسخ login مدت اعتبار
+# token را برنمی‌گرداند، پس token زودتر از انقضای واقعی آن تازه می‌شود
+AUTH_TOKEN_TTL = 6 * 3600
+CHANNELS_TTL = 24 * 3600
+
+# نام فایل sqlite history (در پوشه هر نوع محتوا)
+HISTORY_DB_NAME = "downloaded_headlines.sqlite"
+
+# حداقل فاصله بین درخواست‌های API رویترز وقتی پاسخ هدر rate limit ندارد (ثانیه)
+API_MIN_INTERVAL = 0.05
+# تلاش مجدد برای پاسخ‌های 429 و 5xx با تأخیر نمایی (API_RETRY_BASE، دو برابر، ...)
+API_MAX_RETRIES = 3
+API_RETRY_BASE = 1.0
+
+# فایل‌های بزرگ‌تر از این حد (ویدئوها) به صورت multipart و با چند part همزمان آپلود می‌شوند
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=False,
+)
+
+# اندازه هر part و تعداد part های همزمان هنگام ارسال مستقیم ویدئو به S3 (pipe_to_s3)
+# حداقل اندازه part در S3 برابر 5 MiB است (به جز part آخر)
+PIPE_PART_SIZE = 8 * 1024 * 1024
+PIPE_PART_CONCURRENCY = 4
+
+# هدرهای درخواست دانلود ویدئو
+VIDEO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'video/mp4,video/*,*/*;q=0.8',
+}
+
+# هدرهای درخواست دانلود عکس
+IMAGE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
 # Namespace برای XML
 NAMESPACES = {
     'nar': 'http://iptc.org/std/nar/2006-10-01/',
     'rtr': 'http://www.reuters.com/ns/2003/08/content'
 }
 
+# XPathهای از پیش کامپایل شده برای استخراج از XML جزئیات آیتم
+_FILENAME_XP = ET.XPath(".//nar:itemMeta/nar:fileName", namespaces=NAMESPACES)
+_HEADLINE_XP = ET.XPath(".//nar:headline", namespaces=NAMESPACES)
+# tag کامل remoteContent برای پیمایش تنبل (lazy) با root.iter
+_REMOTE_CONTENT_TAG = f"{{{NAMESPACES['nar']}}}remoteContent"
+_ALL_RENDITIONS_XP = ET.XPath(".//nar:remoteContent/@rendition", namespaces=NAMESPACES)
+_ALT_LOC_XP = ET.XPath(".//rtr:altLoc", namespaces=NAMESPACES)
+_CHILD_ALT_LOC_XP = ET.XPath("rtr:altLoc", namespaces=NAMESPACES)
+# کاندیدهای شناسه کانال در پاسخ لیست کانال‌ها (alias اول هر channelInformation و result ها)
+_CHANNEL_CANDIDATES_XP = ET.XPath(".//channelInformation/alias[1] | .//result")
+
+# rendition های مورد نظر برای ویدئو و عکس
+VIDEO_RENDITION = "rend:stream:8256:16x9:mp4"
+IMAGE_RENDITION = "rend:baseImage"
+# نسخه lowercase هر rendition، یک بار هنگام load ماژول
+_RENDITION_LOWER = {
+    VIDEO_RENDITION: VIDEO_RENDITION.lower(),
+    IMAGE_RENDITION: IMAGE_RENDITION.lower(),
+}
+# چک سریع متنی (بدون حساسیت به حروف) پیش از پیمایش درخت: اگر rendition در متن XML نباشد،
+# در درخت هم نیست (مثلاً کانال‌هایی که نوع دیگری از محتوا برمی‌گردانند)
+_VIDEO_RENDITION_RE = re.compile(re.escape(VIDEO_RENDITION.encode()), re.IGNORECASE)
+_IMAGE_RENDITION_RE = re.compile(re.escape(IMAGE_RENDITION.encode()), re.IGNORECASE)
+
+
+# Session مشترک برای همه درخواست‌ها (استفاده مجدد از اتصال‌های keep-alive)
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """دریافت session مشترک HTTP (در اولین استفاده ساخته می‌شود)"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                # HTTP/1.1 هر درخواست همزمان یک اتصال لازم دارد؛ API رویترز (rmb) روی http
+                # ساده است و HTTP/2 روی آن قابل استفاده نیست، پس برای همه درخواست‌های
+                # همزمان meta و media به یک host اتصال کافی در نظر گرفته می‌شود
+                limit_per_host=META_CONCURRENCY + MEDIA_CONCURRENCY,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            ),
+            timeout=aiohttp.ClientTimeout(total=300),
+        )
+    return _session
+
+
+async def close_session():
+    """بستن session مشترک HTTP"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+# Client مشترک S3 (یک بار ساخته می‌شود و در همه آپلودها و دورها استفاده می‌شود)
+_s3_client_cm = None
+_s3_client = None
+
+
+async def get_s3_client(s3_config: Dict):
+    """دریافت client مشترک S3 (در اولین استفاده ساخته می‌شود)"""
+    global _s3_client_cm, _s3_client
+    if _s3_client is None:
+        # ساخت config
+        boto_config = Config(
+            connect_timeout=60,
+            read_timeout=60,
+            retries={'max_attempts': 3}
+        )
+        
+        # تنظیمات client
+        client_kwargs = {
+            "endpoint_url": s3_config["endpoint"],
+            "aws_access_key_id": s3_config["access_key"],
+            "aws_secret_access_key": s3_config["secret_key"],
+            "region_name": s3_config["region"],
+            "config": boto_config,
+        }
+        
+        # برای HTTPS، SSL verification را غیرفعال کن
+        if s3_config["endpoint"].startswith("https://"):
+            client_kwargs["verify"] = False
+        
+        client_cm = aioboto3.Session().client("s3", **client_kwargs)
+        _s3_client = await client_cm.__aenter__()
+        _s3_client_cm = client_cm
+    return _s3_client
+
+
+async def close_s3_client():
+    """بستن client مشترک S3"""
+    global _s3_client_cm, _s3_client
+    if _s3_client_cm is not None:
+        client_cm = _s3_client_cm
+        _s3_client_cm = None
+        _s3_client = None
+        await client_cm.__aexit__(None, None, None)
+
+
+# لاگ‌های DEBUG فقط با --debug چاپ می‌شوند. پیام‌های DEBUG پرهزینه (برش‌های XML و پیمایش
+# عناصر) باید پشت `if DEBUG_LOGGING:` ساخته شوند تا در حالت عادی اصلاً ساخته نشوند
+DEBUG_LOGGING = False
+
 
 def log(message: str, level: str = "INFO"):
     """تابع لاگ"""
+    if level == "DEBUG" and not DEBUG_LOGGING:
+        return
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{timestamp}] [{level}] {message}")
 
 
+def parse_xml(xml_bytes: bytes) -> ET._Element:
+    """Parse کردن XML با lxml مستقیماً از bytes پاسخ (بدون decode به str و encode دوباره)"""
+    return ET.fromstring(xml_bytes)
+
+
+def _header_seconds(value: Optional[str]) -> Optional[float]:
+    """تبدیل مقدار هدر Retry-After (ثانیه یا تاریخ HTTP) به تعداد ثانیه از الان"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class ApiRateLimiter:
+    """
+    محدودکننده نرخ درخواست‌های API رویترز بر اساس هدرهای پاسخ
+    
+    درخواست‌ها با فاصله interval از هم ارسال می‌شوند. interval از X-RateLimit-Remaining و
+    X-RateLimit-Reset محاسبه می‌شود (بودجه باقی‌مانده روی زمان باقی‌مانده پخش می‌شود) و اگر
+    این هدرها نباشند API_MIN_INTERVAL است. Retry-After و تمام شدن بودجه، درخواست بعدی را
+    تا زمان مشخص شده عقب می‌اندازند.
+    """
+    
+    def __init__(self, min_interval: float = API_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self.interval = min_interval
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """صبر تا نوبت درخواست بعدی"""
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self.interval
+    
+    def update(self, headers):
+        """به‌روزرسانی نرخ از هدرهای پاسخ API"""
+        now = time.monotonic()
+        
+        retry_after = _header_seconds(headers.get("Retry-After"))
+        if retry_after is not None:
+            self._next_at = max(self._next_at, now + retry_after)
+        
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset = float(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            self.interval = self.min_interval
+            return
+        
+        # Reset ممکن است زمان epoch باشد یا تعداد ثانیه تا reset
+        if reset > 1e9:
+            reset -= time.time()
+        reset = max(0.0, reset)
+        
+        if remaining <= 0:
+            self._next_at = max(self._next_at, now + reset)
+            self.interval = self.min_interval
+        else:
+            self.interval = max(self.min_interval, reset / remaining)
+
+
+# یک limiter مشترک برای همه درخواست‌های API (در همه کانال‌ها)
+_rate_limiter = ApiRateLimiter()
+
+
+@asynccontextmanager
+async def api_request(url: str, params: Dict[str, str]) -> AsyncIterator[aiohttp.ClientResponse]:
+    """درخواست GET به API رویترز با رعایت rate limit و تلاش مجدد برای 429/5xx"""
+    session = get_session()
+    for attempt in range(API_MAX_RETRIES + 1):
+        await _rate_limiter.acquire()
+        response = await session.get(url, params=params)
+        _rate_limiter.update(response.headers)
+        
+        if attempt == API_MAX_RETRIES or (response.status != 429 and response.status < 500):
+            break
+        
+        response.release()
+        delay = API_RETRY_BASE * 2 ** attempt
+        log(f"HTTP {response.status} از {url}، تلاش مجدد پس از {delay:g} ثانیه", "WARNING")
+        await asyncio.sleep(delay)
+    
+    try:
+        yield response
+    finally:
+        response.release()
+
+
 async def authenticate(username: str, password: str) -> Optional[str]:
     """احراز هویت با API رویترز"""
     log("در حال احراز هویت با API رویترز...")
@@ -68,22 +334,22 @@ async def authenticate(username: str, password: str) -> Optional[str]:
             "password": password
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(AUTH_URL, params=params) as response:
-                if response.status != 200:
-                    log(f"خطا در احراز هویت: HTTP {response.status}", "ERROR")
-                    return None
-                
-                xml_content = await response.text()
-                root = ET.fromstring(xml_content)
-                
-                if root.tag == "authToken" and root.text:
-                    token = root.text.strip()
-                    log("احراز هویت موفق. توکن دریافت شد.", "SUCCESS")
-                    return token
-                else:
-                    log("خطا: توکن در پاسخ یافت نشد.", "ERROR")
-                    return None
+        session = get_session()
+        async with session.get(AUTH_URL, params=params) as response:
+            if response.status != 200:
+                log(f"خطا در احراز هویت: HTTP {response.status}", "ERROR")
+                return None
+            
+            xml_bytes = await response.read()
+            root = parse_xml(xml_bytes)
+            
+            if root.tag == "authToken" and root.text:
+                token = root.text.strip()
+                log("احراز هویت موفق. توکن دریافت شد.", "SUCCESS")
+                return token
+            else:
+                log("خطا: توکن در پاسخ یافت نشد.", "ERROR")
+                return None
     except Exception as e:
         log(f"خطا در احراز هویت: {str(e)}", "ERROR")
         return None
@@ -106,70 +372,51 @@ async def get_channels(token: str, content_type: str) -> List[str]:
             "token": token
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(CHANNELS_URL, params=params) as response:
-                if response.status != 200:
-                    log(f"خطا در دریافت کانال‌ها: HTTP {response.status}", "ERROR")
-                    return []
-                
-                xml_content = await response.text()
-                
-                # Debug: نمایش XML برای بررسی
-                log(f"  XML Response (first 2000 chars): {xml_content[:2000]}", "DEBUG")
-                
-                root = ET.fromstring(xml_content)
+        async with api_request(CHANNELS_URL, params) as response:
+            if response.status != 200:
+                log(f"خطا در دریافت کانال‌ها: HTTP {response.status}", "ERROR")
+                return []
+            
+            xml_bytes = await response.read()
+            
+            # Debug: نمایش XML برای بررسی
+            if DEBUG_LOGGING:
+                log(f"  XML Response (first 2000 bytes): {xml_bytes[:2000].decode('utf-8', 'replace')}", "DEBUG")
+            
+            root = parse_xml(xml_bytes)
+            if DEBUG_LOGGING:
                 log(f"  Root tag: {root.tag}, Root attribs: {root.attrib}", "DEBUG")
-                
-                channels = []
-                
-                # استخراج کانال‌ها از XML
-                if content_type == "Text":
-                    # برای Text channels، از channelInformation و alias استفاده می‌شود
-                    for channel_info in root.findall(".//channelInformation"):
-                        alias = channel_info.find("alias")
-                        if alias is not None and alias.text:
-                            channel_id = alias.text.strip()
-                            if channel_id:
-                                channels.append(channel_id)
-                    
-                    # اگر با channelInformation پیدا نشد، از result امتحان کن
-                    if not channels:
-                        for result in root.findall(".//result"):
-                            channel_id = result.get("id")
-                            if channel_id:
-                                channels.append(channel_id)
+            
+            # استخراج کانال‌ها از XML (هر دو نوع کاندید در یک پیمایش جمع می‌شوند)
+            aliases = []
+            result_ids = []
+            for elem in _CHANNEL_CANDIDATES_XP(root):
+                if elem.tag == "alias":
+                    channel_id = elem.text.strip() if elem.text else ""
+                    if channel_id:
+                        aliases.append(channel_id)
                 else:
-                    # برای Video و Photo از result و id استفاده می‌شود
-                    for result in root.findall(".//result"):
-                        channel_id = result.get("id")
-                        if channel_id:
-                            channels.append(channel_id)
-                    
-                    # اگر با result پیدا نشد، از channelInformation امتحان کن
-                    if not channels:
-                        for channel_info in root.findall(".//channelInformation"):
-                            alias = channel_info.find("alias")
-                            if alias is not None and alias.text:
-                                channel_id = alias.text.strip()
-                                if channel_id:
-                                    channels.append(channel_id)
-                
-                # Debug: نمایش XML برای بررسی
-                if not channels:
-                    log(f"  XML Response (first 1000 chars): {xml_content[:1000]}", "DEBUG")
-                    log(f"  Root tag: {root.tag}, Root attribs: {root.attrib}", "DEBUG")
-                    # بررسی تمام عناصر
-                    for elem in root.iter():
-                        log(f"  Element: {elem.tag}, Text: {elem.text}, Attribs: {elem.attrib}", "DEBUG")
-                
-                # Debug: بررسی تمام عناصر سطح اول
-                if not channels:
-                    log("  بررسی عناصر سطح اول XML...", "DEBUG")
-                    for elem in list(root)[:20]:  # فقط 20 عنصر اول
-                        log(f"    Element: {elem.tag}, Text: {elem.text[:100] if elem.text else None}, Attribs: {elem.attrib}", "DEBUG")
-                
-                log(f"تعداد {len(channels)} کانال یافت شد.", "SUCCESS")
-                return channels
+                    channel_id = elem.get("id")
+                    if channel_id:
+                        result_ids.append(channel_id)
+            
+            if content_type == "Text":
+                # برای Text channels، از channelInformation و alias استفاده می‌شود
+                # (اگر پیدا نشد، از result)
+                channels = aliases or result_ids
+            else:
+                # برای Video و Photo از result و id استفاده می‌شود
+                # (اگر پیدا نشد، از channelInformation)
+                channels = result_ids or aliases
+            
+            # Debug: بررسی تمام عناصر سطح اول
+            if not channels and DEBUG_LOGGING:
+                log("  بررسی عناصر سطح اول XML...", "DEBUG")
+                for elem in list(root)[:20]:  # فقط 20 عنصر اول
+                    log(f"    Element: {elem.tag}, Text: {elem.text[:100] if elem.text else None}, Attribs: {elem.attrib}", "DEBUG")
+            
+            log(f"تعداد {len(channels)} کانال یافت شد.", "SUCCESS")
+            return channels
     except Exception as e:
         log(f"خطا در دریافت کانال‌ها: {str(e)}", "ERROR")
         return []
@@ -192,69 +439,72 @@ async def get_items(token: str, channel: str, limit: int, content_type: str) ->
             params["remoteContentComplete"] = "True"
         
         # Debug: نمایش URL و پارامترها
-        log(f"  URL: {ITEMS_URL}, Params: {params}", "DEBUG")
+        if DEBUG_LOGGING:
+            log(f"  URL: {ITEMS_URL}, Params: {params}", "DEBUG")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(ITEMS_URL, params=params) as response:
-                if response.status != 200:
-                    log(f"خطا در دریافت آیتم‌ها از کانال {channel}: HTTP {response.status}", "ERROR")
+        async with api_request(ITEMS_URL, params) as response:
+            if response.status != 200:
+                log(f"خطا در دریافت آیتم‌ها از کانال {channel}: HTTP {response.status}", "ERROR")
+                if DEBUG_LOGGING:
                     response_text = await response.text()
                     log(f"  Response body: {response_text[:500]}", "DEBUG")
-                    return []
-                
-                xml_content = await response.text()
-                
-                # Debug: نمایش XML برای بررسی
-                log(f"  XML Response (first 2000 chars): {xml_content[:2000]}", "DEBUG")
-                
-                root = ET.fromstring(xml_content)
+                return []
+            
+            xml_bytes = await response.read()
+            
+            # Debug: نمایش XML برای بررسی
+            if DEBUG_LOGGING:
+                log(f"  XML Response (first 2000 bytes): {xml_bytes[:2000].decode('utf-8', 'replace')}", "DEBUG")
+            
+            root = await asyncio.to_thread(parse_xml, xml_bytes)
+            if DEBUG_LOGGING:
                 log(f"  Root tag: {root.tag}, Root attribs: {root.attrib}", "DEBUG")
+            
+            items = []
+            
+            # استخراج آیتم‌ها از XML
+            # در XML رویترز، id و guid به صورت child elements هستند نه attributes
+            for result in root.findall(".//result"):
+                # اول از attribute امتحان کن
+                item_id = result.get("id")
+                item_guid = result.get("guid")
                 
-                items = []
-                
-                # استخراج آیتم‌ها از XML
-                # در XML رویترز، id و guid به صورت child elements هستند نه attributes
-                for result in root.findall(".//result"):
-                    # اول از attribute امتحان کن
-                    item_id = result.get("id")
-                    item_guid = result.get("guid")
-                    
-                    # اگر attribute نبود، از child elements استفاده کن
-                    if not item_id:
-                        id_elem = result.find("id")
-                        if id_elem is not None and id_elem.text:
-                            item_id = id_elem.text.strip()
-                    
-                    if not item_guid:
-                        guid_elem = result.find("guid")
-                        if guid_elem is not None and guid_elem.text:
-                            item_guid = guid_elem.text.strip()
-                    
-                    if item_id:
-                        items.append({
-                            "id": item_id,
-                            "guid": item_guid if item_guid else item_id
-                        })
+                # اگر attribute نبود، از child elements استفاده کن
+                if not item_id:
+                    id_elem = result.find("id")
+                    if id_elem is not None and id_elem.text:
+                        item_id = id_elem.text.strip()
                 
-                # Debug: بررسی تمام عناصر سطح اول
-                if not items:
-                    log("  بررسی عناصر سطح اول XML...", "DEBUG")
-                    for elem in list(root)[:20]:  # فقط 20 عنصر اول
-                        log(f"    Element: {elem.tag}, Text: {elem.text[:100] if elem.text else None}, Attribs: {elem.attrib}", "DEBUG")
-                    # بررسی تعداد result elements
-                    all_results = root.findall(".//result")
-                    log(f"  تعداد کل result elements: {len(all_results)}", "DEBUG")
-                    for idx, result in enumerate(all_results[:5]):  # فقط 5 نتیجه اول
-                        log(f"    Result {idx}: id={result.get('id')}, guid={result.get('guid')}, attribs={result.attrib}", "DEBUG")
+                if not item_guid:
+                    guid_elem = result.find("guid")
+                    if guid_elem is not None and guid_elem.text:
+                        item_guid = guid_elem.text.strip()
                 
-                log(f"تعداد {len(items)} آیتم از کانال {channel} دریافت شد.", "SUCCESS")
-                return items
+                if item_id:
+                    items.append({
+                        "id": item_id,
+                        "guid": item_guid if item_guid else item_id
+                    })
+            
+            # Debug: بررسی تمام عناصر سطح اول
+            if not items and DEBUG_LOGGING:
+                log("  بررسی عناصر سطح اول XML...", "DEBUG")
+                for elem in list(root)[:20]:  # فقط 20 عنصر اول
+                    log(f"    Element: {elem.tag}, Text: {elem.text[:100] if elem.text else None}, Attribs: {elem.attrib}", "DEBUG")
+                # بررسی تعداد result elements
+                all_results = root.findall(".//result")
+                log(f"  تعداد کل result elements: {len(all_results)}", "DEBUG")
+                for idx, result in enumerate(all_results[:5]):  # فقط 5 نتیجه اول
+                    log(f"    Result {idx}: id={result.get('id')}, guid={result.get('guid')}, attribs={result.attrib}", "DEBUG")
+            
+            log(f"تعداد {len(items)} آیتم از کانال {channel} دریافت شد.", "SUCCESS")
+            return items
     except Exception as e:
         log(f"خطا در دریافت آیتم‌ها از کانال {channel}: {str(e)}", "ERROR")
         return []
 
 
-async def get_item_detail(token: str, item_id: str, channel: str, content_type: str) -> Optional[str]:
+async def get_item_detail(token: str, item_id: str, channel: str, content_type: str) -> Optional[bytes]:
     """دریافت جزئیات آیتم"""
     try:
         params = {
@@ -265,31 +515,24 @@ async def get_item_detail(token: str, item_id: str, channel: str, content_type:
         if content_type == "Text" and channel:
             params["channel"] = channel
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(ITEM_URL, params=params) as response:
-                if response.status != 200:
-                    log(f"خطا در دریافت جزئیات آیتم {item_id}: HTTP {response.status}", "ERROR")
-                    return None
-                
-                # برای خبرهای متنی، XML خام را دریافت کن
-                if content_type == "Text":
-                    return await response.text()
-                else:
-                    return await response.text()
+        async with api_request(ITEM_URL, params) as response:
+            if response.status != 200:
+                log(f"خطا در دریافت جزئیات آیتم {item_id}: HTTP {response.status}", "ERROR")
+                return None
+            
+            # bytes خام پاسخ برگردانده می‌شود؛ parse و ذخیره هر دو مستقیماً با bytes کار می‌کنند
+            return await response.read()
     except Exception as e:
         log(f"خطا در دریافت جزئیات آیتم {item_id}: {str(e)}", "ERROR")
         return None
 
 
-def get_filename_from_xml(xml_content: str) -> Optional[str]:
-    """استخراج fileName از XML"""
+def get_filename_from_xml(root: ET._Element) -> Optional[str]:
+    """استخراج fileName از XML (ریشه parse شده)"""
     try:
-        root = ET.fromstring(xml_content)
-        
         # استخراج fileName از itemMeta/fileName
-        for item_meta in root.findall(".//{http://iptc.org/std/nar/2006-10-01/}itemMeta"):
-            filename = item_meta.find("{http://iptc.org/std/nar/2006-10-01/}fileName")
-            if filename is not None and filename.text:
+        for filename in _FILENAME_XP(root):
+            if filename.text:
                 file_name = filename.text.strip()
                 # اطمینان از اینکه extension .xml دارد
                 if not file_name.lower().endswith(".xml"):
@@ -319,15 +562,13 @@ def get_filename_from_xml(xml_content: str) -> Optional[str]:
         return None
 
 
-def get_headline_from_xml(xml_content: str) -> Optional[str]:
-    """استخراج headline از XML"""
+def get_headline_from_xml(root: ET._Element) -> Optional[str]:
+    """استخراج headline از XML (ریشه parse شده)"""
     try:
-        root = ET.fromstring(xml_content)
-        
         # استخراج headline
-        headline = root.find(".//{http://iptc.org/std/nar/2006-10-01/}headline")
-        if headline is not None and headline.text:
-            return headline.text.strip()
+        for headline in _HEADLINE_XP(root):
+            if headline.text:
+                return headline.text.strip()
         
         # اگر با namespace پیدا نشد، بدون namespace امتحان کن
         headline = root.find(".//headline")
@@ -339,46 +580,85 @@ def get_headline_from_xml(xml_content: str) -> Optional[str]:
         return None
 
 
+# الگوها و جدول translate برای normalize_headline (یک بار ساخته می‌شوند)
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+# حذف کاراکترهای ASCII که نه \w هستند و نه \s (معادل _NON_WORD_RE برای متن ASCII)
+_ASCII_NON_WORD_TABLE = str.maketrans("", "", "".join(
+    chr(c) for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) == "_")
+))
+
+
 def normalize_headline(headline: str) -> str:
     """Normalize کردن headline برای مقایسه"""
     if not headline:
         return ""
     
     # حذف فاصله‌های اضافی، تبدیل به lowercase، حذف کاراکترهای خاص
+    # (خروجی باید دقیقاً مثل قبل بماند چون کلیدهای history با آن ساخته شده‌اند)
     normalized = headline.lower().strip()
-    normalized = re.sub(r'\s+', ' ', normalized)  # چند فاصله به یک فاصله
-    normalized = re.sub(r'[^\w\s]', '', normalized)  # حذف کاراکترهای خاص
+    normalized = _WHITESPACE_RE.sub(' ', normalized)  # چند فاصله به یک فاصله
+    if normalized.isascii():
+        # مسیر سریع: translate در C و بدون regex
+        normalized = normalized.translate(_ASCII_NON_WORD_TABLE)
+    else:
+        normalized = _NON_WORD_RE.sub('', normalized)  # حذف کاراکترهای خاص
     return normalized
 
 
-def get_video_url_from_xml(xml_content: str, token: str) -> Optional[str]:
-    """استخراج URL ویدئو از XML"""
+def iter_renditions(root: ET._Element, target_rendition: str) -> Iterator[ET._Element]:
+    """
+    پیمایش remoteContent هایی که rendition آن‌ها (بدون حساسیت به حروف) برابر target است
+    
+    root.iter تنبل است، پس به محض اینکه فراخواننده return کند پیمایش سند متوقف می‌شود
+    (برخلاف XPath که همه تطابق‌ها را در کل سند پیدا می‌کند).
+    """
+    target = _RENDITION_LOWER.get(target_rendition) or target_rendition.lower()
+    for remote_content in root.iter(_REMOTE_CONTENT_TAG):
+        rendition = remote_content.get("rendition") or ""
+        # مقایسه مستقیم حالت رایج (همان نوشتار ثابت) را بدون ساخت رشته lowercase پیدا می‌کند
+        if rendition == target_rendition or rendition.lower() == target:
+            yield remote_content
+
+
+def set_url_token(url: str, token: str, replace: bool = False) -> str:
+    """
+    قرار دادن پارامتر token در query string یک URL
+    
+    اگر URL از قبل token داشته باشد، فقط با replace=True جایگزین می‌شود. query به صورت
+    رشته‌ای تکه‌تکه می‌شود (نه با urlencode) تا بقیه پارامترهای URL امضا شده دست نخورند؛
+    fragment (بعد از #) هم حفظ می‌شود.
+    """
+    base, hash_sep, fragment = url.partition("#")
+    path, _, query = base.partition("?")
+    params = [param for param in query.split("&") if param] if query else []
+    
+    has_token = any(param.startswith("token=") for param in params)
+    if has_token and not replace:
+        return url
+    if has_token:
+        params = [param for param in params if not param.startswith("token=")]
+    params.append(f"token={token}")
+    
+    return f"{path}?{'&'.join(params)}{hash_sep}{fragment}"
+
+
+def get_video_url_from_xml(root: ET._Element, token: str) -> Optional[str]:
+    """استخراج URL ویدئو از XML (ریشه parse شده)"""
     try:
-        root = ET.fromstring(xml_content)
-        
-        target_rendition = "rend:stream:8256:16x9:mp4"
-        
         # استخراج URL ویدئو با rendition="rend:stream:8256:16x9:mp4"
-        for remote_content in root.findall(".//{http://iptc.org/std/nar/2006-10-01/}remoteContent"):
-            rendition = remote_content.get("rendition", "")
-            if rendition and rendition.lower() == target_rendition.lower():
-                # اول altLoc را امتحان کن (authenticated URL)
-                alt_loc = remote_content.find(".//{http://www.reuters.com/ns/2003/08/content}altLoc")
-                if alt_loc is not None and alt_loc.text:
-                    url = alt_loc.text.strip()
-                    # اضافه کردن token اگر موجود نیست
-                    if "token=" not in url:
-                        separator = "&" if "?" in url else "?"
-                        url = f"{url}{separator}token={token}"
-                    return url
-                
-                # اگر altLoc نبود، از href استفاده کن
-                href = remote_content.get("href", "")
-                if href:
-                    if "token=" not in href:
-                        separator = "&" if "?" in href else "?"
-                        href = f"{href}{separator}token={token}"
-                    return href
+        for remote_content in iter_renditions(root, VIDEO_RENDITION):
+            # اول altLoc را امتحان کن (authenticated URL)
+            alt_loc = next(iter(_ALT_LOC_XP(remote_content)), None)
+            if alt_loc is not None and alt_loc.text:
+                # اضافه کردن token اگر موجود نیست
+                return set_url_token(alt_loc.text.strip(), token)
+            
+            # اگر altLoc نبود، از href استفاده کن
+            href = remote_content.get("href", "")
+            if href:
+                return set_url_token(href, token)
         
         return None
     except Exception as e:
@@ -386,62 +666,40 @@ def get_video_url_from_xml(xml_content: str, token: str) -> Optional[str]:
         return None
 
 
-def get_image_url_from_xml(xml_content: str, token: str) -> Optional[str]:
-    """استخراج URL عکس از XML با rendition="rend:baseImage" """
+def get_image_url_from_xml(root: ET._Element, token: str) -> Optional[str]:
+    """استخراج URL عکس از XML (ریشه parse شده) با rendition="rend:baseImage" """
     try:
-        root = ET.fromstring(xml_content)
-        
-        target_rendition = "rend:baseImage"
-        
         # استخراج URL عکس با rendition="rend:baseImage"
         # جستجو در تمام remoteContent elements
-        import re
-        for remote_content in root.findall(".//{http://iptc.org/std/nar/2006-10-01/}remoteContent"):
-            rendition = remote_content.get("rendition", "")
-            if rendition and rendition.lower() == target_rendition.lower():
-                # اول altLoc را امتحان کن (authenticated URL) - این اولویت دارد
-                # altLoc به صورت مستقیم child از remoteContent است
-                alt_loc = remote_content.find("{http://www.reuters.com/ns/2003/08/content}altLoc")
-                if alt_loc is not None and alt_loc.text:
-                    url = alt_loc.text.strip()
-                    # برای auth-server URLs، همیشه token را اضافه کن
-                    if "auth-server" in url:
-                        # حذف token موجود (اگر وجود دارد)
-                        url = re.sub(r'[?&]token=[^&]*', '', url)
-                        # اضافه کردن token جدید
-                        separator = "&" if "?" in url else "?"
-                        url = f"{url}{separator}token={token}"
-                    elif "token=" not in url:
-                        # اگر auth-server نیست اما token ندارد، اضافه کن
-                        separator = "&" if "?" in url else "?"
-                        url = f"{url}{separator}token={token}"
+        for remote_content in iter_renditions(root, IMAGE_RENDITION):
+            # اول altLoc را امتحان کن (authenticated URL) - این اولویت دارد
+            # altLoc به صورت مستقیم child از remoteContent است
+            alt_loc = next(iter(_CHILD_ALT_LOC_XP(remote_content)), None)
+            if alt_loc is not None and alt_loc.text:
+                url = alt_loc.text.strip()
+                # برای auth-server URLs، token همیشه با token جدید جایگزین می‌شود؛
+                # در غیر این صورت فقط اگر token ندارد اضافه می‌شود
+                url = set_url_token(url, token, replace="auth-server" in url)
+                if DEBUG_LOGGING:
                     log(f"  URL عکس از altLoc استخراج شد: {url[:100]}...", "DEBUG")
-                    return url
-                
-                # اگر altLoc نبود، از href استفاده کن
-                href = remote_content.get("href", "")
-                if href:
-                    # برای auth-server URLs، همیشه token را اضافه کن
-                    if "auth-server" in href:
-                        href = re.sub(r'[?&]token=[^&]*', '', href)
-                        separator = "&" if "?" in href else "?"
-                        href = f"{href}{separator}token={token}"
-                    elif "token=" not in href:
-                        separator = "&" if "?" in href else "?"
-                        href = f"{href}{separator}token={token}"
+                return url
+            
+            # اگر altLoc نبود، از href استفاده کن
+            href = remote_content.get("href", "")
+            if href:
+                # برای auth-server URLs، همیشه token را جایگزین کن
+                href = set_url_token(href, token, replace="auth-server" in href)
+                if DEBUG_LOGGING:
                     log(f"  URL عکس از href استخراج شد: {href[:100]}...", "DEBUG")
-                    return href
+                return href
         
         # اگر با rendition پیدا نشد، لاگ کن
-        log("  هشدار: remoteContent با rendition=rend:baseImage یافت نشد", "DEBUG")
-        # نمایش تمام rendition های موجود برای debugging
-        all_renditions = []
-        for remote_content in root.findall(".//{http://iptc.org/std/nar/2006-10-01/}remoteContent"):
-            rend = remote_content.get("rendition", "")
-            if rend:
-                all_renditions.append(rend)
-        if all_renditions:
-            log(f"  Rendition های موجود: {', '.join(all_renditions)}", "DEBUG")
+        if DEBUG_LOGGING:
+            log("  هشدار: remoteContent با rendition=rend:baseImage یافت نشد", "DEBUG")
+            # نمایش تمام rendition های موجود برای debugging
+            all_renditions = [rend for rend in _ALL_RENDITIONS_XP(root) if rend]
+            if all_renditions:
+                log(f"  Rendition های موجود: {', '.join(all_renditions)}", "DEBUG")
         
         return None
     except Exception as e:
@@ -449,6 +707,26 @@ def get_image_url_from_xml(xml_content: str, token: str) -> Optional[str]:
         return None
 
 
+async def write_response_to_file(response: aiohttp.ClientResponse, file_path: str, chunk_size: int):
+    """
+    نوشتن بدنه پاسخ در فایل به صورت تکه‌تکه
+    
+    نوشتن روی دیسک blocking است، پس open/write/close در thread pool اجرا می‌شوند
+    تا event loop برای دانلودهای همزمان دیگر آزاد بماند.
+    """
+    f = await asyncio.to_thread(open, file_path, 'wb')
+    completed = False
+    try:
+        async for chunk in response.content.iter_chunked(chunk_size):
+            await asyncio.to_thread(f.write, chunk)
+        completed = True
+    finally:
+        await asyncio.to_thread(f.close)
+        if not completed:
+            # فایل ناقص (خطا یا لغو task) نگه داشته نمی‌شود تا در اجرای بعدی دوباره دانلود شود
+            os.remove(file_path)
+
+
 async def download_video(video_url: str, output_path: str, filename: str) -> bool:
     """دانلود ویدئو"""
     try:
@@ -456,22 +734,18 @@ async def download_video(video_url: str, output_path: str, filename: str) -> boo
         
         file_path = os.path.join(output_path, filename)
         
-        async with aiohttp.ClientSession(
+        session = get_session()
+        async with session.get(
+            video_url,
             timeout=aiohttp.ClientTimeout(total=600),
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'video/mp4,video/*,*/*;q=0.8',
-            }
-        ) as session:
-            async with session.get(video_url) as response:
-                if response.status != 200:
-                    log(f"  خطا در دانلود ویدئو: HTTP {response.status}", "ERROR")
-                    return False
-                
-                # دانلود و ذخیره
-                with open(file_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        f.write(chunk)
+            headers=VIDEO_HEADERS
+        ) as response:
+            if response.status != 200:
+                log(f"  خطا در دانلود ویدئو: HTTP {response.status}", "ERROR")
+                return False
+            
+            # دانلود و ذخیره
+            await write_response_to_file(response, file_path, 1 << 20)
         
         log(f"  ویدئو با موفقیت دانلود شد: {filename}", "SUCCESS")
         return True
@@ -480,94 +754,202 @@ async def download_video(video_url: str, output_path: str, filename: str) -> boo
         return False
 
 
-async def download_image(image_url: str, output_path: str, filename: str, token: str = None) -> bool:
-    """دانلود عکس - استفاده از روش موفق reuters_photos.py با urllib.request"""
-    import urllib.request
+async def pipe_to_s3(
+    media_url,
+    s3_client,
+    s3_bucket: str,
+    s3_key: str,
+    mime_type: str = "video/mp4",
+    local_path: Optional[str] = None,
+    headers: Dict[str, str] = VIDEO_HEADERS
+) -> bool:
+    """
+    دانلود فایل (ویدئو یا عکس) و ارسال همزمان آن به S3 بدون ذخیره روی دیسک
+    
+    chunk های پاسخ در یک buffer جمع می‌شوند و هر PIPE_PART_SIZE بایت به عنوان یک part
+    از multipart upload ارسال می‌شود (حداکثر PIPE_PART_CONCURRENCY part همزمان، تا دانلود
+    و آپلود با هم پیش بروند). اگر کل فایل کوچک‌تر از یک part باشد (مثل اکثر عکس‌ها)، با
+    put_object آپلود می‌شود. اگر local_path داده شود، یک نسخه هم روی دیسک نوشته می‌شود.
+    """
+    upload_id = None
+    part_tasks: List[asyncio.Task] = []
+    part_semaphore = asyncio.Semaphore(PIPE_PART_CONCURRENCY)
+    local_file = None
+    
+    async def _upload_part(part_number: int, body: bytes) -> Dict:
+        try:
+            response = await s3_client.upload_part(
+                Bucket=s3_bucket,
+                Key=s3_key,
+                PartNumber=part_number,
+                UploadId=upload_id,
+                Body=body
+            )
+            return {"ETag": response["ETag"], "PartNumber": part_number}
+        finally:
+            part_semaphore.release()
+    
+    async def _start_part(body: bytes):
+        nonlocal upload_id
+        if upload_id is None:
+            mpu = await s3_client.create_multipart_upload(
+                Bucket=s3_bucket, Key=s3_key, ContentType=mime_type
+            )
+            upload_id = mpu["UploadId"]
+        # صبر برای یک جای خالی قبل از ادامه دانلود، تا حافظه محدود بماند
+        await part_semaphore.acquire()
+        part_tasks.append(asyncio.create_task(_upload_part(len(part_tasks) + 1, body)))
     
     try:
-        log(f"  در حال دانلود عکس: {filename}", "INFO")
+        log(f"  در حال دانلود و آپلود مستقیم به S3: {s3_key}", "INFO")
         
-        file_path = os.path.join(output_path, filename)
+        session = get_session()
+        async with session.get(
+            media_url,
+            timeout=aiohttp.ClientTimeout(total=600),
+            headers=headers
+        ) as response:
+            if response.status != 200:
+                log(f"  خطا در دانلود {s3_key}: HTTP {response.status}", "ERROR")
+                return False
+            
+            if local_path:
+                local_file = await asyncio.to_thread(open, local_path, 'wb')
+            
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(1 << 20):
+                buffer += chunk
+                if local_file is not None:
+                    await asyncio.to_thread(local_file.write, chunk)
+                if len(buffer) >= PIPE_PART_SIZE:
+                    await _start_part(bytes(buffer))
+                    buffer.clear()
         
-        # اطمینان از اینکه token در URL موجود است
-        # روش مشابه reuters_photos.py
-        final_url = image_url
-        if token:
-            # Add token to URL
-            final_url = f"{final_url}?token={token}"
+        if upload_id is None:
+            # فایل کوچک‌تر از یک part است؛ multipart لازم نیست
+            await s3_client.put_object(
+                Bucket=s3_bucket,
+                Key=s3_key,
+                Body=bytes(buffer),
+                ContentType=mime_type
+            )
+        else:
+            if buffer:
+                await _start_part(bytes(buffer))
+            parts = await asyncio.gather(*part_tasks)
+            await s3_client.complete_multipart_upload(
+                Bucket=s3_bucket,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts}
+            )
         
+        log(f"  فایل با موفقیت به S3 آپلود شد: {s3_key}", "SUCCESS")
+        return True
+    except (Exception, asyncio.CancelledError) as e:
+        # لغو task (مثلاً خطای آیتم دیگری در همان کانال) هم multipart upload را abort می‌کند
+        cancelled = isinstance(e, asyncio.CancelledError)
+        if not cancelled:
+            log(f"  خطا در دانلود/آپلود {s3_key}: {str(e)}", "ERROR")
+        for task in part_tasks:
+            task.cancel()
+        await asyncio.gather(*part_tasks, return_exceptions=True)
+        if upload_id is not None:
+            try:
+                await s3_client.abort_multipart_upload(
+                    Bucket=s3_bucket, Key=s3_key, UploadId=upload_id
+                )
+            except Exception as abort_error:
+                log(f"  خطا در لغو multipart upload {s3_key}: {str(abort_error)}", "WARNING")
+        if local_file is not None:
+            await asyncio.to_thread(local_file.close)
+            local_file = None
+            # فایل ناقص را نگه ندار تا در اجرای بعدی دوباره دانلود شود
+            os.remove(local_path)
+        if cancelled:
+            raise
+        return False
+    finally:
+        if local_file is not None:
+            await asyncio.to_thread(local_file.close)
+
+
+def image_request_url(image_url: str, token: str = None) -> URL:
+    """ساخت URL درخواست عکس (token اضافه می‌شود و URL بدون encode مجدد ارسال می‌شود)"""
+    # اطمینان از اینکه token در URL موجود است
+    # روش مشابه reuters_photos.py
+    final_url = image_url
+    if token:
+        # Add token to URL
+        final_url = f"{final_url}?token={token}"
+    
+    if DEBUG_LOGGING:
         log(f"  URL عکس: {final_url[:150]}...", "DEBUG")
+    
+    # URL همان‌طور که هست ارسال شود (مثل urllib، بدون encode مجدد token)
+    return URL(final_url, encoded=True)
+
+
+async def download_image(image_url: str, output_path: str, filename: str, token: str = None) -> bool:
+    """دانلود عکس با session مشترک aiohttp"""
+    try:
+        log(f"  در حال دانلود عکس: {filename}", "INFO")
         
-        # استفاده از همان روش reuters_photos.py - urllib.request در thread pool
-        def download_sync():
-            req = urllib.request.Request(
-                final_url,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                }
-            )
-            with urllib.request.urlopen(req, timeout=300) as response:
-                with open(file_path, 'wb') as f:
-                    f.write(response.read())
+        file_path = os.path.join(output_path, filename)
         
-        # Run download in thread pool (مشابه reuters_photos.py)
-        await asyncio.to_thread(download_sync)
+        session = get_session()
+        async with session.get(
+            image_request_url(image_url, token),
+            timeout=aiohttp.ClientTimeout(total=300),
+            headers=IMAGE_HEADERS
+        ) as response:
+            if response.status != 200:
+                log(f"  خطا در دانلود عکس: HTTP {response.status}", "ERROR")
+                return False
+            
+            # دانلود و ذخیره به صورت تکه‌تکه
+            await write_response_to_file(response, file_path, 1 << 16)
         
         file_size = os.path.getsize(file_path)
         log(f"  عکس با موفقیت دانلود شد: {filename} ({file_size / 1024 / 1024:.2f} MB)", "SUCCESS")
         return True
     except Exception as e:
         log(f"  خطا در دانلود عکس {filename}: {str(e)}", "ERROR")
-        import traceback
-        log(f"  Traceback: {traceback.format_exc()}", "DEBUG")
+        if DEBUG_LOGGING:
+            import traceback
+            log(f"  Traceback: {traceback.format_exc()}", "DEBUG")
         return False
 
 
 async def upload_file_to_s3(
+    s3_client,
     file_path: str,
     s3_key: str,
-    s3_endpoint: str,
     s3_bucket: str,
-    s3_access_key: str,
-    s3_secret_key: str,
-    s3_region: str,
     mime_type: str = "application/octet-stream"
 ) -> bool:
-    """آپلود فایل به S3"""
+    """آپلود فایل به S3 با client مشترک (get_s3_client)"""
     try:
         log(f"  در حال آپلود به S3: {s3_key}", "INFO")
         
-        # ساخت config
-        boto_config = Config(
-            connect_timeout=60,
-            read_timeout=60,
-            retries={'max_attempts': 3}
-        )
-        
-        # تنظیمات client
-        client_kwargs = {
-            "endpoint_url": s3_endpoint,
-            "aws_access_key_id": s3_access_key,
-            "aws_secret_access_key": s3_secret_key,
-            "region_name": s3_region,
-            "config": boto_config,
-        }
-        
-        # برای HTTPS، SSL verification را غیرفعال کن
-        if s3_endpoint.startswith("https://"):
-            client_kwargs["verify"] = False
-        
         # آپلود
-        async with aioboto3.Session().client("s3", **client_kwargs) as s3:
+        if os.path.getsize(file_path) > MULTIPART_THRESHOLD:
+            # فایل‌های بزرگ: multipart upload با part های همزمان
             with open(file_path, 'rb') as f:
-                await s3.put_object(
-                    Bucket=s3_bucket,
-                    Key=s3_key,
-                    Body=f,
-                    ContentType=mime_type
+                await s3_client.upload_fileobj(
+                    f, s3_bucket, s3_key,
+                    ExtraArgs={"ContentType": mime_type},
+                    Config=S3_TRANSFER_CONFIG
                 )
+        else:
+            # فایل‌های کوچک (XML و عکس) در thread pool خوانده می‌شوند تا event loop منتظر دیسک نماند
+            body = await asyncio.to_thread(Path(file_path).read_bytes)
+            await s3_client.put_object(
+                Bucket=s3_bucket,
+                Key=s3_key,
+                Body=body,
+                ContentType=mime_type
+            )
         
         log(f"  فایل با موفقیت به S3 آپلود شد: {s3_key}", "SUCCESS")
         return True
@@ -576,16 +958,22 @@ async def upload_file_to_s3(
         return False
 
 
-def save_xml_to_file(xml_content: str, file_path: str, save_as_raw: bool = False) -> bool:
-    """ذخیره XML به فایل"""
+def save_xml_to_file(
+    xml_bytes: bytes,
+    file_path: str,
+    save_as_raw: bool = False,
+    root: Optional[ET._Element] = None
+) -> bool:
+    """ذخیره XML به فایل (اگر root داده شود، XML دوباره parse نمی‌شود)"""
     try:
         # برای خبرهای متنی، XML را به صورت خام ذخیره کن
         if save_as_raw:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
+            with open(file_path, 'wb') as f:
+                f.write(xml_bytes)
         else:
             # برای سایر انواع، XML را parse و ذخیره کن
-            root = ET.fromstring(xml_content)
+            if root is None:
+                root = parse_xml(xml_bytes)
             tree = ET.ElementTree(root)
             tree.write(file_path, encoding='utf-8', xml_declaration=True)
         
@@ -596,29 +984,145 @@ def save_xml_to_file(xml_content: str, file_path: str, save_as_raw: bool = False
         return False
 
 
-def load_downloaded_headlines(history_file: str) -> Set[str]:
-    """بارگذاری history از فایل"""
-    downloaded = set()
-    if os.path.exists(history_file):
+def headline_key(normalized_headline: str) -> bytes:
+    """کلید history برای یک headline نرمال شده: hash ثابت ۱۶ بایتی"""
+    return hashlib.blake2b(normalized_headline.encode('utf-8'), digest_size=16).digest()
+
+
+def _import_legacy_history(history_db: sqlite3.Connection, json_file: str):
+    """
+    انتقال history قدیمی (فایل JSON و فایل .log آن) به پایگاه داده sqlite
+    
+    فایل‌های قدیمی فقط پس از commit موفق حذف می‌شوند.
+    """
+    log_file = json_file + ".log"
+    if not os.path.exists(json_file) and not os.path.exists(log_file):
+        return
+    
+    keys = set()
+    if os.path.exists(json_file):
+        try:
+            # orjson مستقیماً bytes فایل را parse می‌کند (بدون decode به str)
+            data = orjson.loads(Path(json_file).read_bytes())
+            if isinstance(data, list):
+                # فرمت JSON فشرده: لیست کلیدهای hex
+                keys.update(bytes.fromhex(key) for key in data)
+            elif isinstance(data, dict):
+                # فرمت قدیمی: {headline نرمال شده: true}
+                keys.update(headline_key(headline) for headline in data)
+        except Exception as e:
+            log(f"خطا در بارگذاری history قدیمی: {str(e)}", "WARNING")
+            return
+    
+    if os.path.exists(log_file):
         try:
-            with open(history_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    downloaded = set(data.keys())
-            log(f"تعداد {len(downloaded)} headline از history بارگذاری شد", "INFO")
+            with open(log_file, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        keys.add(bytes.fromhex(orjson.loads(line)))
         except Exception as e:
-            log(f"خطا در بارگذاری history: {str(e)}", "WARNING")
+            # خط ناقص آخر (مثلاً پس از crash) نادیده گرفته می‌شود
+            log(f"خطا در بارگذاری history log قدیمی: {str(e)}", "WARNING")
+    
+    with history_db:
+        history_db.executemany("INSERT OR IGNORE INTO seen (h) VALUES (?)", ((key,) for key in keys))
+    for path in (json_file, log_file):
+        if os.path.exists(path):
+            os.remove(path)
+    log(f"تعداد {len(keys)} headline از history قدیمی به {HISTORY_DB_NAME} منتقل شد", "INFO")
+
+
+def open_history_db(content_type_dir: str) -> sqlite3.Connection:
+    """
+    باز کردن پایگاه داده history (کلیدهای headline_key ویدئوهای دانلود شده)
+    
+    هر کلید جدید با یک INSERT به جدول اضافه می‌شود، پس برخلاف فایل JSON قبلی لازم نیست
+    کل history در پایان هر دور دوباره نوشته شود. history قدیمی JSON در اولین اجرا منتقل می‌شود.
+    """
+    history_db = sqlite3.connect(os.path.join(content_type_dir, HISTORY_DB_NAME), isolation_level=None)
+    # WAL: هر INSERT فقط به انتهای فایل WAL اضافه می‌شود و fsync در هر commit لازم نیست
+    history_db.execute("PRAGMA journal_mode=WAL")
+    history_db.execute("PRAGMA synchronous=NORMAL")
+    history_db.execute("CREATE TABLE IF NOT EXISTS seen (h BLOB PRIMARY KEY) WITHOUT ROWID")
+    _import_legacy_history(history_db, os.path.join(content_type_dir, "downloaded_headlines.json"))
+    return history_db
+
+
+def load_downloaded_headlines(history_db: sqlite3.Connection) -> Set[bytes]:
+    """بارگذاری history در حافظه (برای چک سریع و رزرو headline های در حال دانلود)"""
+    downloaded = {row[0] for row in history_db.execute("SELECT h FROM seen")}
+    if downloaded:
+        log(f"تعداد {len(downloaded)} headline از history بارگذاری شد", "INFO")
     return downloaded
 
 
-def save_downloaded_headlines(downloaded: Set[str], history_file: str):
-    """ذخیره history به فایل"""
+def record_headline(history_db: sqlite3.Connection, key: bytes):
+    """ثبت یک کلید جدید در history (autocommit، پس بلافاصله ماندگار می‌شود)"""
     try:
-        data = {headline: True for headline in downloaded}
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        history_db.execute("INSERT OR IGNORE INTO seen (h) VALUES (?)", (key,))
     except Exception as e:
-        log(f"خطا در ذخیره history: {str(e)}", "WARNING")
+        log(f"خطا در ثبت history: {str(e)}", "WARNING")
+
+
+class RunContext:
+    """
+    وضعیتی که بین دورهای loop حفظ می‌شود: token احراز هویت و لیست کانال‌ها
+    
+    هر کدام تا پایان TTL خود دوباره دریافت نمی‌شوند. invalidate() هر دو را پاک می‌کند تا
+    دور بعد دوباره login کند (مثلاً وقتی token منقضی شده باشد).
+    """
+    
+    def __init__(self):
+        self.token: Optional[str] = None
+        self.token_expires_at = 0.0
+        self.channels: Optional[List[str]] = None
+        self.channels_content_type: Optional[str] = None
+        self.channels_expires_at = 0.0
+    
+    async def get_token(self, username: str, password: str) -> Optional[str]:
+        """token معتبر (در صورت نیاز احراز هویت دوباره انجام می‌شود)"""
+        if self.token is None or time.monotonic() >= self.token_expires_at:
+            self.token = await authenticate(username, password)
+            self.token_expires_at = time.monotonic() + AUTH_TOKEN_TTL
+        else:
+            log("استفاده از token دور قبل")
+        return self.token
+    
+    async def get_channels(self, token: str, content_type: str) -> List[str]:
+        """لیست کانال‌ها (در صورت نیاز دوباره از API دریافت می‌شود)"""
+        if (
+            not self.channels
+            or self.channels_content_type != content_type
+            or time.monotonic() >= self.channels_expires_at
+        ):
+            self.channels = await get_channels(token, content_type)
+            self.channels_content_type = content_type
+            self.channels_expires_at = time.monotonic() + CHANNELS_TTL
+            if self.channels:
+                log(f"تعداد {len(self.channels)} کانال از API دریافت شد")
+        else:
+            log(f"استفاده از لیست {len(self.channels)} کانال دور قبل")
+        return self.channels
+    
+    def invalidate(self):
+        """پاک کردن token و لیست کانال‌ها تا در دور بعد دوباره دریافت شوند"""
+        self.token = None
+        self.channels = None
+
+
+class StageLimits:
+    """محدودیت همزمانی هر مرحله از پردازش آیتم‌ها (meta، media و upload)"""
+    
+    def __init__(
+        self,
+        meta: int = META_CONCURRENCY,
+        media: int = MEDIA_CONCURRENCY,
+        upload: int = UPLOAD_CONCURRENCY
+    ):
+        self.meta = asyncio.Semaphore(meta)
+        self.media = asyncio.Semaphore(media)
+        self.upload = asyncio.Semaphore(upload)
 
 
 async def process_channel(
@@ -628,11 +1132,27 @@ async def process_channel(
     limit: int,
     output_dir: str,
     today: str,
-    downloaded_headlines: Set[str],
+    downloaded_headlines: Set[bytes],
     upload_to_s3: bool,
-    s3_config: Optional[Dict]
+    s3_config: Optional[Dict],
+    limits: Optional[StageLimits] = None,
+    s3_client=None,
+    keep_local: bool = True,
+    history_db: Optional[sqlite3.Connection] = None,
+    upload_tasks: Optional[List[asyncio.Task]] = None,
+    existing_files: Optional[Set[str]] = None
 ):
-    """پردازش یک کانال"""
+    """
+    پردازش یک کانال (s3_client همان client مشترک get_s3_client است)
+    
+    اگر upload_tasks داده شود، آپلودهای پس‌زمینه به آن اضافه می‌شوند و فراخواننده منتظر
+    آن‌ها می‌ماند؛ در غیر این صورت process_channel در پایان کانال منتظر آن‌ها می‌ماند.
+    existing_files نام فایل‌های موجود در پوشه details است (به جای os.path.exists برای هر
+    آیتم)؛ اگر داده نشود، یک بار در ابتدای کانال خوانده می‌شود.
+    تعداد آیتم‌های دریافت شده از کانال برگردانده می‌شود.
+    """
+    if limits is None:
+        limits = StageLimits()
     log("----------------------------------------")
     log(f"پردازش کانال: {channel}")
     
@@ -643,16 +1163,15 @@ async def process_channel(
         log(f"هیچ آیتمی در کانال {channel} یافت نشد.")
         return 0
     
-    # ساختار پوشه‌ها
+    # ساختار پوشه‌ها (یک بار در ابتدای هر دور توسط run_download ساخته می‌شوند)
     content_type_dir = os.path.join(output_dir, content_type)
     date_dir = os.path.join(content_type_dir, today)
-    channels_dir = os.path.join(date_dir, "channels")
     items_dir = os.path.join(date_dir, "items")
     details_dir = os.path.join(date_dir, "details")
-    
-    # ایجاد پوشه‌ها
-    for dir_path in [channels_dir, items_dir, details_dir]:
-        os.makedirs(dir_path, exist_ok=True)
+    # پیشوند کلید S3 برای همه آیتم‌های کانال یکسان است و یک بار ساخته می‌شود
+    s3_prefix = f"{content_type}/{today}/"
+    if existing_files is None:
+        existing_files = list_existing_files(details_dir)
     
     # ذخیره لیست آیتم‌ها
     items_xml = ET.Element("items", channel=channel)
@@ -663,17 +1182,45 @@ async def process_channel(
     
     items_tree = ET.ElementTree(items_xml)
     items_file = os.path.join(items_dir, f"items_{channel}.xml")
-    items_tree.write(items_file, encoding='utf-8', xml_declaration=True)
+    await asyncio.to_thread(items_tree.write, items_file, encoding='utf-8', xml_declaration=True)
     
-    # دریافت جزئیات هر آیتم
-    for idx, item in enumerate(items, 1):
-        log(f"  [{idx}/{len(items)}] دریافت جزئیات آیتم: {item['id']}")
-        
-        detail_xml = await get_item_detail(token, item["id"], channel, content_type)
-        
-        if detail_xml:
+    # آپلودهای S3 به صورت task پس‌زمینه اجرا می‌شوند تا پردازش آیتم منتظر آن‌ها نماند
+    owns_uploads = upload_tasks is None
+    if owns_uploads:
+        upload_tasks = []
+    
+    async def _upload(file_path: str, s3_key: str, mime_type: str) -> bool:
+        async with limits.upload:
+            return await upload_file_to_s3(s3_client, file_path, s3_key, s3_config["bucket"], mime_type)
+    
+    def _schedule_upload(file_path: str, s3_key: str, mime_type: str):
+        upload_tasks.append(asyncio.create_task(_upload(file_path, s3_key, mime_type)))
+    
+    # هر آیتم از سه مرحله می‌گذرد و هر مرحله محدودیت همزمانی جداگانه دارد، پس یک دانلود
+    # ویدئوی کند جای دریافت XML آیتم‌های دیگر را نمی‌گیرد و مراحل به صورت pipeline پیش می‌روند
+    async def _process_item(idx: int, item: Dict[str, str]):
+        # مرحله meta: دریافت، parse و ذخیره XML جزئیات
+        async with limits.meta:
+            log(f"  [{idx}/{len(items)}] دریافت جزئیات آیتم: {item['id']}")
+            
+            detail_xml = await get_item_detail(token, item["id"], channel, content_type)
+            if not detail_xml:
+                return
+            
+            # XML فقط یک بار parse می‌شود و ریشه آن به همه توابع استخراج داده می‌شود؛
+            # parse در thread pool انجام می‌شود (lxml هنگام parse، GIL را آزاد می‌کند)
+            # تا دانلود آیتم‌ها و کانال‌های دیگر در event loop متوقف نشود
+            try:
+                root = await asyncio.to_thread(parse_xml, detail_xml)
+            except ET.ParseError as e:
+                log(f"  خطا در parse کردن XML آیتم {item['id']}: {str(e)}", "ERROR")
+                root = None
+            
             # استخراج fileName از XML
-            detail_filename = get_filename_from_xml(detail_xml)
+            detail_filename = (
+                get_filename_from_xml(root)
+                if root is not None and b"fileName" in detail_xml else None
+            )
             
             # اگر fileName یافت نشد، از GUID استفاده کن
             if not detail_filename:
@@ -682,98 +1229,143 @@ async def process_channel(
             
             # چک کردن وجود فایل
             file_path = os.path.join(details_dir, detail_filename)
-            file_exists = os.path.exists(file_path)
             
-            if file_exists:
+            if detail_filename in existing_files:
                 log(f"  فایل موجود است، از دانلود مجدد صرف‌نظر شد: {detail_filename}", "INFO")
                 # اگر فایل موجود است، همچنان به شمارش اضافه می‌شود
-                continue
+                return
+            # نام فایل از همین حالا رزرو می‌شود تا همین آیتم در کانال دیگری دوباره ذخیره نشود
+            existing_files.add(detail_filename)
             
             # ذخیره فایل
-            save_xml_to_file(detail_xml, file_path, save_as_raw=(content_type == "Text"))
-            
-            # آپلود XML به S3
-            if upload_to_s3 and s3_config:
-                s3_key = f"{content_type}/{today}/{detail_filename}"
-                await upload_file_to_s3(
-                    file_path, s3_key,
-                    s3_config["endpoint"], s3_config["bucket"],
-                    s3_config["access_key"], s3_config["secret_key"],
-                    s3_config["region"], "application/xml"
-                )
+            # نوشتن روی دیسک blocking است؛ در thread pool اجرا می‌شود
+            await asyncio.to_thread(
+                save_xml_to_file, detail_xml, file_path,
+                save_as_raw=(content_type == "Text"), root=root
+            )
+        
+        # مرحله upload: آپلود XML به S3 (در پس‌زمینه)
+        if upload_to_s3 and s3_client is not None:
+            s3_key = s3_prefix + detail_filename
+            _schedule_upload(file_path, s3_key, "application/xml")
+        
+        # مرحله media: برای ویدئو، دانلود فایل ویدئو
+        if content_type == "Video" and root is not None:
+            # استخراج headline برای چک کردن تکراری بودن
+            headline = get_headline_from_xml(root)
+            normalized_headline = normalize_headline(headline) if headline else ""
+            headline_id = headline_key(normalized_headline) if normalized_headline else b""
             
-            # برای ویدئو، دانلود فایل ویدئو
-            if content_type == "Video":
-                # استخراج headline برای چک کردن تکراری بودن
-                headline = get_headline_from_xml(detail_xml)
-                normalized_headline = normalize_headline(headline) if headline else ""
-                
-                # چک کردن اینکه آیا ویدئو با همین headline قبلاً دانلود شده یا نه
-                if normalized_headline and normalized_headline in downloaded_headlines:
-                    log(f"  ویدئو با headline مشابه قبلاً دانلود شده، از دانلود صرف‌نظر شد: {headline}", "INFO")
-                    continue
+            # چک کردن اینکه آیا ویدئو با همین headline قبلاً دانلود شده یا نه
+            if headline_id and headline_id in downloaded_headlines:
+                log(f"  ویدئو با headline مشابه قبلاً دانلود شده، از دانلود صرف‌نظر شد: {headline}", "INFO")
+                return
+            
+            # headline را از همین حالا رزرو کن تا آیتم‌های همزمان با همین headline دوباره دانلود نشوند
+            keep_headline = False
+            if headline_id:
+                downloaded_headlines.add(headline_id)
+            
+            video_url = (
+                get_video_url_from_xml(root, token)
+                if _VIDEO_RENDITION_RE.search(detail_xml) else None
+            )
+            if video_url:
+                # نام فایل ویدئو: همان نام XML اما با پسوند .mp4
+                video_filename = os.path.splitext(detail_filename)[0] + ".mp4"
+                video_file_path = os.path.join(details_dir, video_filename)
                 
-                video_url = get_video_url_from_xml(detail_xml, token)
-                if video_url:
-                    # نام فایل ویدئو: همان نام XML اما با پسوند .mp4
-                    video_filename = os.path.splitext(detail_filename)[0] + ".mp4"
-                    video_file_path = os.path.join(details_dir, video_filename)
-                    
-                    # چک کردن وجود فایل ویدئو
-                    if os.path.exists(video_file_path):
-                        log(f"  فایل ویدئو موجود است، از دانلود مجدد صرف‌نظر شد: {video_filename}", "INFO")
-                        if normalized_headline:
-                            downloaded_headlines.add(normalized_headline)
-                    else:
-                        download_success = await download_video(video_url, details_dir, video_filename)
-                        if download_success:
-                            if normalized_headline:
-                                downloaded_headlines.add(normalized_headline)
-                            
-                            # آپلود ویدئو به S3
-                            if upload_to_s3 and s3_config:
-                                s3_key = f"{content_type}/{today}/{video_filename}"
-                                await upload_file_to_s3(
-                                    video_file_path, s3_key,
-                                    s3_config["endpoint"], s3_config["bucket"],
-                                    s3_config["access_key"], s3_config["secret_key"],
-                                    s3_config["region"], "video/mp4"
-                                )
+                # چک کردن وجود فایل ویدئو
+                if video_filename in existing_files:
+                    log(f"  فایل ویدئو موجود است، از دانلود مجدد صرف‌نظر شد: {video_filename}", "INFO")
+                    keep_headline = True
+                elif upload_to_s3 and s3_client is not None:
+                    # ویدئو مستقیماً به S3 ارسال می‌شود (نسخه محلی فقط با --keep-local)
+                    s3_key = s3_prefix + video_filename
+                    async with limits.media:
+                        keep_headline = await pipe_to_s3(
+                            video_url, s3_client, s3_config["bucket"], s3_key, "video/mp4",
+                            local_path=video_file_path if keep_local else None
+                        )
                 else:
-                    log("  هشدار: URL ویدئو با rendition=rend:stream:8256:16x9:mp4 یافت نشد", "WARNING")
-            
-            # برای عکس، دانلود فایل عکس
-            if content_type == "Photo":
-                image_url = get_image_url_from_xml(detail_xml, token)
-                if image_url:
-                    # نام فایل عکس: همان نام XML اما با پسوند .jpg
-                    image_filename = os.path.splitext(detail_filename)[0] + ".jpg"
-                    image_file_path = os.path.join(details_dir, image_filename)
-                    
-                    # چک کردن وجود فایل عکس
-                    if os.path.exists(image_file_path):
-                        log(f"  فایل عکس موجود است، از دانلود مجدد صرف‌نظر شد: {image_filename}", "INFO")
-                    else:
-                        download_success = await download_image(image_url, details_dir, image_filename, token)
-                        if download_success:
-                            # آپلود عکس به S3
-                            if upload_to_s3 and s3_config:
-                                s3_key = f"{content_type}/{today}/{image_filename}"
-                                await upload_file_to_s3(
-                                    image_file_path, s3_key,
-                                    s3_config["endpoint"], s3_config["bucket"],
-                                    s3_config["access_key"], s3_config["secret_key"],
-                                    s3_config["region"], "image/jpeg"
-                                )
-                else:
-                    log("  هشدار: URL عکس با rendition=rend:baseImage یافت نشد", "WARNING")
+                    async with limits.media:
+                        keep_headline = await download_video(video_url, details_dir, video_filename)
+            else:
+                log("  هشدار: URL ویدئو با rendition=rend:stream:8256:16x9:mp4 یافت نشد", "WARNING")
             
-            # تاخیر کوتاه برای جلوگیری از rate limiting
-            await asyncio.sleep(0.5)
+            # اگر ویدئو دانلود نشد، رزرو headline را آزاد کن
+            if headline_id and not keep_headline:
+                downloaded_headlines.discard(headline_id)
+            elif headline_id and history_db is not None:
+                record_headline(history_db, headline_id)
+        
+        # مرحله media: برای عکس، دانلود فایل عکس
+        if content_type == "Photo" and root is not None:
+            image_url = (
+                get_image_url_from_xml(root, token)
+                if _IMAGE_RENDITION_RE.search(detail_xml) else None
+            )
+            if image_url:
+                # نام فایل عکس: همان نام XML اما با پسوند .jpg
+                image_filename = os.path.splitext(detail_filename)[0] + ".jpg"
+                image_file_path = os.path.join(details_dir, image_filename)
+                
+                # چک کردن وجود فایل عکس
+                if image_filename in existing_files:
+                    log(f"  فایل عکس موجود است، از دانلود مجدد صرف‌نظر شد: {image_filename}", "INFO")
+                elif upload_to_s3 and s3_client is not None:
+                    # عکس هم مثل ویدئو مستقیماً به S3 ارسال می‌شود (نسخه محلی فقط با --keep-local)
+                    s3_key = s3_prefix + image_filename
+                    async with limits.media:
+                        await pipe_to_s3(
+                            image_request_url(image_url, token), s3_client, s3_config["bucket"],
+                            s3_key, "image/jpeg",
+                            local_path=image_file_path if keep_local else None,
+                            headers=IMAGE_HEADERS
+                        )
+                else:
+                    async with limits.media:
+                        await download_image(image_url, details_dir, image_filename, token)
+            else:
+                log("  هشدار: URL عکس با rendition=rend:baseImage یافت نشد", "WARNING")
+    
+    try:
+        # TaskGroup: اگر یک آیتم خطای پیش‌بینی نشده بدهد، بقیه آیتم‌های کانال لغو می‌شوند
+        # (gather آن‌ها را بدون ناظر در حال اجرا رها می‌کرد) و خطا به run_download می‌رسد
+        async with asyncio.TaskGroup() as item_group:
+            for idx, item in enumerate(items, 1):
+                item_group.create_task(_process_item(idx, item))
+    finally:
+        # منتظر ماندن برای آپلودهای پس‌زمینه این کانال (حتی اگر پردازش آیتم‌ها خطا داد)
+        if owns_uploads:
+            await wait_for_uploads(upload_tasks, f"کانال {channel}")
+    
+    return len(items)
+
+
+def list_existing_files(directory: str) -> Set[str]:
+    """نام فایل‌های موجود در یک پوشه با یک scandir (به جای یک stat برای هر فایل)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
 
+async def wait_for_uploads(upload_tasks: List[asyncio.Task], scope: str):
+    """منتظر ماندن برای آپلودهای پس‌زمینه و گزارش تعداد آپلودهای ناموفق"""
+    if not upload_tasks:
+        return
+    results = await asyncio.gather(*upload_tasks, return_exceptions=True)
+    failed = sum(1 for result in results if result is not True)
+    if failed:
+        log(f"  {failed} از {len(results)} آپلود S3 در {scope} ناموفق بود", "WARNING")
 
-async def run_download(args):
-    """اجرای یک دور دانلود"""
+
+async def run_download(args, context: Optional[RunContext] = None):
+    """اجرای یک دور دانلود (context بین دورهای loop مشترک است)"""
+    if context is None:
+        context = RunContext()
     
     log("================================================")
     log("شروع دانلود اخبار رویترز")
@@ -791,11 +1383,17 @@ async def run_download(args):
     content_type_dir = os.path.join(output_dir, args.content_type)
     date_dir = os.path.join(content_type_dir, today)
     
-    os.makedirs(date_dir, exist_ok=True)
+    # پوشه‌های channels/items/details برای همه کانال‌ها مشترک‌اند، پس یک بار ساخته می‌شوند
+    for dir_name in ("channels", "items", "details"):
+        os.makedirs(os.path.join(date_dir, dir_name), exist_ok=True)
     log(f"پوشه‌های خروجی: {date_dir}")
     
-    # احراز هویت
-    token = await authenticate(args.username, args.password)
+    # فایل‌های موجود پوشه details یک بار برای کل دور خوانده می‌شوند
+    details_dir = os.path.join(date_dir, "details")
+    existing_files = list_existing_files(details_dir)
+    
+    # احراز هویت (token دور قبل تا پایان AUTH_TOKEN_TTL استفاده می‌شود)
+    token = await context.get_token(args.username, args.password)
     if not token:
         log("خطا: امکان احراز هویت وجود ندارد.", "ERROR")
         raise Exception("احراز هویت ناموفق بود")
@@ -805,25 +1403,20 @@ async def run_download(args):
         channels_to_process = [c.strip() for c in args.channels.split(",")]
         log(f"استفاده از کانال‌های مشخص شده: {', '.join(channels_to_process)}")
     else:
-        channels_to_process = await get_channels(token, args.content_type)
+        channels_to_process = await context.get_channels(token, args.content_type)
         if not channels_to_process:
             log("هیچ کانالی یافت نشد.", "ERROR")
             raise Exception("هیچ کانالی یافت نشد")
-        log(f"تعداد {len(channels_to_process)} کانال از API دریافت شد")
     
     # ذخیره لیست کانال‌ها
-    channels_xml = ET.Element("channels")
-    for ch in channels_to_process:
-        ET.SubElement(channels_xml, "channel").text = ch
-    
-    channels_tree = ET.ElementTree(channels_xml)
-    channels_file = os.path.join(content_type_dir, today, "channels", "channels_list.xml")
-    os.makedirs(os.path.dirname(channels_file), exist_ok=True)
-    channels_tree.write(channels_file, encoding='utf-8', xml_declaration=True)
-    
-    # فایل history برای tracking headline های دانلود شده
-    history_file = os.path.join(content_type_dir, "downloaded_headlines.json")
-    downloaded_headlines = load_downloaded_headlines(history_file)
+    # ساختار XML ثابت و ساده است، پس مستقیماً به صورت رشته ساخته می‌شود (بدون ساخت درخت)
+    channels_xml = (
+        "<?xml version='1.0' encoding='UTF-8'?>\n<channels>"
+        + "".join(f"<channel>{escape(ch)}</channel>" for ch in channels_to_process)
+        + "</channels>"
+    ).encode("utf-8")
+    channels_file = os.path.join(date_dir, "channels", "channels_list.xml")
+    await asyncio.to_thread(Path(channels_file).write_bytes, channels_xml)
     
     # تنظیمات S3
     s3_config = None
@@ -839,30 +1432,58 @@ async def run_download(args):
                 "region": args.s3_region
             }
     
+    # یک client مشترک S3 برای همه آپلودها (به جای ساخت client جدید برای هر فایل)
+    s3_client = await get_s3_client(s3_config) if s3_config else None
+    
     # پردازش هر کانال
     total_items = 0
     total_details = 0
     
-    for channel in channels_to_process:
-        items = await get_items(token, channel, args.limit, args.content_type)
-        total_items += len(items)
-        
-        if items:
-            await process_channel(
+    # کانال‌ها به صورت همزمان پردازش می‌شوند؛ محدودیت‌های مشترک همزمانی هر مرحله را در همه کانال‌ها محدود می‌کنند
+    limits = StageLimits()
+    # تعداد کانال‌های همزمان هم محدود است تا درخواست‌های get_items یک‌جا به API نرسند
+    channel_semaphore = asyncio.Semaphore(max(1, args.concurrency))
+    # آپلودهای پس‌زمینه همه کانال‌ها در سطح دور نگه داشته می‌شوند تا یک کانال برای تمام شدن
+    # آپلودهایش جای کانال بعدی را اشغال نکند؛ در پایان دور منتظر همه آن‌ها می‌مانیم
+    upload_tasks: List[asyncio.Task] = []
+    
+    async def _run_channel(channel: str) -> int:
+        async with channel_semaphore:
+            # لیست آیتم‌ها فقط یک بار (داخل process_channel) دریافت می‌شود
+            return await process_channel(
                 token, channel, args.content_type, args.limit,
                 output_dir, today, downloaded_headlines,
-                args.upload_to_s3, s3_config
+                args.upload_to_s3, s3_config, limits, s3_client, args.keep_local,
+                history_db, upload_tasks, existing_files
             )
     
-    # ذخیره history
-    save_downloaded_headlines(downloaded_headlines, history_file)
+    # history برای tracking headline های دانلود شده؛ هر headline جدید بلافاصله با یک
+    # INSERT در sqlite ثبت می‌شود (به جای بازنویسی کل فایل)
+    history_db = open_history_db(content_type_dir)
+    try:
+        downloaded_headlines = load_downloaded_headlines(history_db)
+
+        results = await asyncio.gather(
+            *(_run_channel(channel) for channel in channels_to_process),
+            return_exceptions=True
+        )
+        # خطای یک کانال نباید نتیجه بقیه کانال‌ها را از بین ببرد
+        for channel, result in zip(channels_to_process, results):
+            if isinstance(result, BaseException):
+                errors = result.exceptions if isinstance(result, BaseExceptionGroup) else (result,)
+                log(f"خطا در پردازش کانال {channel}: {'; '.join(str(error) for error in errors)}", "ERROR")
+            else:
+                total_items += result
+    finally:
+        await wait_for_uploads(upload_tasks, "این دور")
+        history_db.close()
+    
+    # هیچ آیتمی از هیچ کانالی نیامد: احتمالاً token منقضی شده، پس دور بعد دوباره login می‌کند
+    if total_items == 0:
+        context.invalidate()
     
     # شمارش نهایی فایل‌های XML
-    details_dir = os.path.join(date_dir, "details")
-    if os.path.exists(details_dir):
-        total_details = len([f for f in os.listdir(details_dir) if f.endswith('.xml')])
-    else:
-        total_details = 0
+    total_details = sum(1 for name in list_existing_files(details_dir) if name.endswith('.xml'))
     
     # خلاصه
     log("================================================")
@@ -874,31 +1495,8 @@ async def run_download(args):
     log("================================================")
 
 
-async def main():
-    """تابع اصلی"""
-    parser = argparse.ArgumentParser(
-        description="دانلود اخبار رویترز و ذخیره به صورت XML",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    parser.add_argument("--username", required=True, help="نام کاربری رویترز")
-    parser.add_argument("--password", required=True, help="رمز عبور رویترز")
-    parser.add_argument("--output-dir", default="./reuters_news", help="مسیر پوشه خروجی")
-    parser.add_argument("--content-type", choices=["Video", "Text", "Photo"], default="Video", help="نوع محتوا")
-    parser.add_argument("--limit", type=int, default=10, help="تعداد آیتم‌ها برای هر کانال")
-    parser.add_argument("--channels", help="لیست کانال‌های خاص (جدا شده با کاما)")
-    parser.add_argument("--s3-endpoint", help="آدرس S3 endpoint")
-    parser.add_argument("--s3-bucket", help="نام S3 bucket")
-    parser.add_argument("--s3-access-key", help="کلید دسترسی S3")
-    parser.add_argument("--s3-secret-key", help="کلید مخفی S3")
-    parser.add_argument("--s3-region", default="us-east-1", help="منطقه S3")
-    parser.add_argument("--upload-to-s3", action="store_true", help="آپلود فایل‌ها به S3")
-    parser.add_argument("--loop", action="store_true", default=True, help="اجرای مداوم اسکریپت در loop (پیش‌فرض: فعال)")
-    parser.add_argument("--no-loop", dest="loop", action="store_false", help="غیرفعال کردن حالت loop")
-    parser.add_argument("--loop-interval", type=int, default=3600, help="فاصله زمانی بین هر اجرا به ثانیه (پیش‌فرض: 3600 = 1 ساعت)")
-    
-    args = parser.parse_args()
-    
+async def run_loop(args):
+    """اجرای دانلود، به صورت مداوم یا یک‌باره"""
     if args.loop:
         log("================================================")
         log("اجرای مداوم اسکریپت در حالت loop")
@@ -907,6 +1505,8 @@ async def main():
         log("================================================")
         
         iteration = 0
+        # token و لیست کانال‌ها بین دورها حفظ می‌شوند
+        context = RunContext()
         while True:
             iteration += 1
             try:
@@ -914,7 +1514,7 @@ async def main():
                 log(f"شروع اجرای دور {iteration}")
                 log("================================================")
                 
-                await run_download(args)
+                await run_download(args, context)
                 
                 log("================================================")
                 log(f"دور {iteration} با موفقیت به پایان رسید")
@@ -930,12 +1530,52 @@ async def main():
                 break
             except Exception as e:
                 log(f"خطا در دور {iteration}: {str(e)}", "ERROR")
+                context.invalidate()
                 log(f"در انتظار {args.loop_interval} ثانیه برای دور بعدی...")
                 await asyncio.sleep(args.loop_interval)
     else:
         await run_download(args)
 
 
+async def main():
+    """تابع اصلی"""
+    parser = argparse.ArgumentParser(
+        description="دانلود اخبار رویترز و ذخیره به صورت XML",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument("--username", required=True, help="نام کاربری رویترز")
+    parser.add_argument("--password", required=True, help="رمز عبور رویترز")
+    parser.add_argument("--output-dir", default="./reuters_news", help="مسیر پوشه خروجی")
+    parser.add_argument("--content-type", choices=["Video", "Text", "Photo"], default="Video", help="نوع محتوا")
+    parser.add_argument("--limit", type=int, default=10, help="تعداد آیتم‌ها برای هر کانال")
+    parser.add_argument("--channels", help="لیست کانال‌های خاص (جدا شده با کاما)")
+    parser.add_argument("--s3-endpoint", help="آدرس S3 endpoint")
+    parser.add_argument("--s3-bucket", help="نام S3 bucket")
+    parser.add_argument("--s3-access-key", help="کلید دسترسی S3")
+    parser.add_argument("--s3-secret-key", help="کلید مخفی S3")
+    parser.add_argument("--s3-region", default="us-east-1", help="منطقه S3")
+    parser.add_argument("--upload-to-s3", action="store_true", help="آپلود فایل‌ها به S3")
+    parser.add_argument("--concurrency", type=int, default=CHANNEL_CONCURRENCY, help=f"تعداد کانال‌هایی که همزمان پردازش می‌شوند (پیش‌فرض: {CHANNEL_CONCURRENCY})")
+    parser.add_argument("--keep-local", action="store_true", help="نگه داشتن نسخه محلی ویدئوها و عکس‌ها هنگام آپلود به S3")
+    parser.add_argument("--loop", action="store_true", default=True, help="اجرای مداوم اسکریپت در loop (پیش‌فرض: فعال)")
+    parser.add_argument("--no-loop", dest="loop", action="store_false", help="غیرفعال کردن حالت loop")
+    parser.add_argument("--loop-interval", type=int, default=3600, help="فاصله زمانی بین هر اجرا به ثانیه (پیش‌فرض: 3600 = 1 ساعت)")
+    
+    parser.add_argument("--debug", action="store_true", help="نمایش لاگ‌های DEBUG")
+    
+    args = parser.parse_args()
+    
+    global DEBUG_LOGGING
+    DEBUG_LOGGING = args.debug
+    
+    try:
+        await run_loop(args)
+    finally:
+        await close_session()
+        await close_s3_client()
+
+
 if __name__ == "__main__":
     asyncio.run(main())
 